@@ -14,9 +14,11 @@ from .exception import BackendNotFoundError, CacheError, CacheLockTimeout
 from .exception import ConfigurationError
 from .manager import aget_backend, clear_async_backends, clear_backends
 from .manager import get_backend
-from .operations import async_cache_clear, async_cache_delete, async_cache_get
-from .operations import async_cache_info, async_cache_set, cache_clear
-from .operations import cache_delete, cache_get, cache_info, cache_set
+from .operations import async_cache_clear, async_cache_delete
+from .operations import async_cache_delete_many, async_cache_get
+from .operations import async_cache_get_many, async_cache_info, async_cache_set
+from .operations import cache_clear, cache_delete, cache_delete_many, cache_get
+from .operations import cache_get_many, cache_info, cache_set
 
 __all__ = [
     'BACKENDS',
@@ -33,14 +35,18 @@ __all__ = [
     'aget_backend',
     'async_cache_clear',
     'async_cache_delete',
+    'async_cache_delete_many',
     'async_cache_get',
+    'async_cache_get_many',
     'async_cache_info',
     'async_cache_set',
     'backends',
     'cache',
     'cache_clear',
     'cache_delete',
+    'cache_delete_many',
     'cache_get',
+    'cache_get_many',
     'cache_info',
     'cache_set',
     'clear_async_backends',
@@ -26,7 +26,7 @@ class CacheEntry:
     age: float
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheInfo:
     """Cache statistics for one decorated function.
 
@@ -86,6 +86,32 @@ class SyncBackend(ABC):
         """Delete value by key.
         """
 
+    def get_many(self, keys: list[str]) -> list[Any]:
+        """Get values for keys, in order. Missing entries are NO_VALUE.
+
+        Backends override this to fetch the batch in one round trip; the
+        default loops over `get`.
+        """
+        return [self.get(key) for key in keys]
+
+    def set_many(self, items: dict[str, Any], ttl: int) -> None:
+        """Set values for keys with one TTL in seconds.
+
+        Backends override this to write the batch in one round trip; the
+        default loops over `set`.
+        """
+        for key, value in items.items():
+            self.set(key, value, ttl)
+
+    def delete_many(self, keys: list[str]) -> None:
+        """Delete values by keys.
+
+        Backends override this to delete the batch in one round trip; the
+        default loops over `delete`.
+        """
+        for key in keys:
+            self.delete(key)
+
     @abstractmethod
     def clear(self, pattern: str | None = None) -> int:
         """Clear entries matching pattern. Returns count of cleared entries.
@@ -135,6 +161,32 @@ class AsyncBackend(ABC):
         """Async delete value by key.
         """
 
+    async def aget_many(self, keys: list[str]) -> list[Any]:
+        """Async get values for keys, in order. Missing entries are NO_VALUE.
+
+        Backends override this to fetch the batch in one round trip; the
+        default loops over `aget`.
+        """
+        return [await self.aget(key) for key in keys]
+
+    async def aset_many(self, items: dict[str, Any], ttl: int) -> None:
+        """Async set values for keys with one TTL in seconds.
+
+        Backends override this to write the batch in one round trip; the
+        default loops over `aset`.
+        """
+        for key, value in items.items():
+            await self.aset(key, value, ttl)
+
+    async def adelete_many(self, keys: list[str]) -> None:
+        """Async delete values by keys.
+
+        Backends override this to delete the batch in one round trip; the
+        default loops over `adelete`.
+        """
+        for key in keys:
+            await self.adelete(key)
+
     @abstractmethod
     async def aclear(self, pattern: str | None = None) -> int:
         """Async clear entries matching pattern. Returns count of cleared entries.
@@ -224,6 +276,19 @@ class Backend(SyncBackend, AsyncBackend):
         """Clear stats for a function, or all stats if fn_name is None.
         """
 
+    def incr_stats(
+        self,
+        updates: list[tuple[str, Literal['hits', 'misses'], int]],
+    ) -> None:
+        """Apply several stat increments, each `(fn_name, stat, amount)`.
+
+        Backends override this to apply the batch in one round trip; the
+        default loops over `incr_stat`.
+        """
+        for fn_name, stat, amount in updates:
+            for _ in range(amount):
+                self.incr_stat(fn_name, stat)
+
     @abstractmethod
     async def aincr_stat(self, fn_name: str, stat: Literal['hits', 'misses']) -> None:
         """Async increment a stat counter for a function.
@@ -239,6 +304,19 @@ class Backend(SyncBackend, AsyncBackend):
         """Async clear stats for a function, or all stats if fn_name is None.
         """
 
+    async def aincr_stats(
+        self,
+        updates: list[tuple[str, Literal['hits', 'misses'], int]],
+    ) -> None:
+        """Async apply several stat increments, each `(fn_name, stat, amount)`.
+
+        Backends override this to apply the batch in one round trip; the
+        default loops over `aincr_stat`.
+        """
+        for fn_name, stat, amount in updates:
+            for _ in range(amount):
+                await self.aincr_stat(fn_name, stat)
+
 
 __all__ = [
     'AsyncBackend',
@@ -1,7 +1,9 @@
 """Memory cache backend implementation.
 """
 import fnmatch
+import functools
 import logging
+import re
 import threading
 import time
 from collections import OrderedDict
@@ -14,6 +16,20 @@ from ..mutex import AsyncioMutex, CacheMutex, ThreadingMutex
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=64)
+def _pattern_re(pattern: str) -> re.Pattern[str]:
+    """Compile a glob pattern once for matching many keys.
+
+    Notes
+    -----
+    - Case-sensitive like `fnmatch.fnmatchcase`, matching Redis and SQLite
+      GLOB. `fnmatch.fnmatch` would case-fold on Windows.
+    - The compiled regex is matched directly in the scan loop, skipping
+      the per-key normcase and cache lookup inside `fnmatch.fnmatch`.
+    """
+    return re.compile(fnmatch.translate(pattern))
+
+
 class MemoryBackend(Backend):
     """Thread-safe in-memory cache backend with both sync and async interfaces.
 
@@ -144,7 +160,8 @@ class MemoryBackend(Backend):
             self._cache.clear()
             return count
 
-        keys_to_delete = [k for k in list(self._cache) if fnmatch.fnmatch(k, pattern)]
+        match = _pattern_re(pattern).match
+        keys_to_delete = [k for k in list(self._cache) if match(k)]
         for key in keys_to_delete:
             self._cache.pop(key, None)
         return len(keys_to_delete)
@@ -155,7 +172,17 @@ class MemoryBackend(Backend):
         self._do_sweep()
         if pattern is None:
             return list(self._cache)
-        return [key for key in list(self._cache) if fnmatch.fnmatch(key, pattern)]
+        match = _pattern_re(pattern).match
+        return [key for key in list(self._cache) if match(key)]
+
+    def _do_incr_stat(self, fn_name: str, stat: Literal['hits', 'misses'], amount: int) -> None:
+        """Add `amount` to a stat counter without locking.
+        """
+        hits, misses = self._stats.get(fn_name, (0, 0))
+        if stat == 'hits':
+            self._stats[fn_name] = (hits + amount, misses)
+        else:
+            self._stats[fn_name] = (hits, misses + amount)
 
     # ===== Sync interface =====
 
@@ -184,6 +211,26 @@ class MemoryBackend(Backend):
         with self._lock:
             self._do_delete(key)
 
+    def get_many(self, keys: list[str]) -> list[Any]:
+        """Get values for keys under one lock acquisition. Missing entries are NO_VALUE.
+        """
+        with self._lock:
+            return [self._do_get(key)[0] for key in keys]
+
+    def set_many(self, items: dict[str, Any], ttl: int) -> None:
+        """Set values for keys under one lock acquisition.
+        """
+        with self._lock:
+            for key, value in items.items():
+                self._do_set(key, value, ttl)
+
+    def delete_many(self, keys: list[str]) -> None:
+        """Delete values by keys under one lock acquisition.
+        """
+        with self._lock:
+            for key in keys:
+                self._do_delete(key)
+
     def clear(self, pattern: str | None = None) -> int:
         """Clear entries matching pattern. Returns count of cleared entries.
         """
@@ -225,11 +272,17 @@ class MemoryBackend(Backend):
         """Increment a stat counter for a function.
         """
         with self._lock:
-            hits, misses = self._stats.get(fn_name, (0, 0))
-            if stat == 'hits':
-                self._stats[fn_name] = (hits + 1, misses)
-            else:
-                self._stats[fn_name] = (hits, misses + 1)
+            self._do_incr_stat(fn_name, stat, 1)
+
+    def incr_stats(
+        self,
+        updates: list[tuple[str, Literal['hits', 'misses'], int]],
+    ) -> None:
+        """Apply a batch of stat increments under one lock acquisition.
+        """
+        with self._lock:
+            for fn_name, stat, amount in updates:
+                self._do_incr_stat(fn_name, stat, amount)
 
     def get_stats(self, fn_name: str) -> tuple[int, int]:
         """Get (hits, misses) for a function.
@@ -273,6 +326,26 @@ class MemoryBackend(Backend):
         with self._lock:
             self._do_delete(key)
 
+    async def aget_many(self, keys: list[str]) -> list[Any]:
+        """Async get values for keys under one lock acquisition. Missing entries are NO_VALUE.
+        """
+        with self._lock:
+            return [self._do_get(key)[0] for key in keys]
+
+    async def aset_many(self, items: dict[str, Any], ttl: int) -> None:
+        """Async set values for keys under one lock acquisition.
+        """
+        with self._lock:
+            for key, value in items.items():
+                self._do_set(key, value, ttl)
+
+    async def adelete_many(self, keys: list[str]) -> None:
+        """Async delete values by keys under one lock acquisition.
+        """
+        with self._lock:
+            for key in keys:
+                self._do_delete(key)
+
     async def aclear(self, pattern: str | None = None) -> int:
         """Async clear entries matching pattern. Returns count of cleared entries.
         """
@@ -316,11 +389,17 @@ class MemoryBackend(Backend):
         """Async increment a stat counter for a function.
         """
         with self._lock:
-            hits, misses = self._stats.get(fn_name, (0, 0))
-            if stat == 'hits':
-                self._stats[fn_name] = (hits + 1, misses)
-            else:
-                self._stats[fn_name] = (hits, misses + 1)
+            self._do_incr_stat(fn_name, stat, 1)
+
+    async def aincr_stats(
+        self,
+        updates: list[tuple[str, Literal['hits', 'misses'], int]],
+    ) -> None:
+        """Async apply a batch of stat increments under one lock acquisition.
+        """
+        with self._lock:
+            for fn_name, stat, amount in updates:
+                self._do_incr_stat(fn_name, stat, amount)
 
     async def aget_stats(self, fn_name: str) -> tuple[int, int]:
         """Async get (hits, misses) for a function.
@@ -6,6 +6,10 @@ from typing import Any, Literal
 from ..api import NO_VALUE, Backend
 from ..mutex import NullAsyncMutex, NullMutex
 
+# Stateless, so one instance serves every key.
+_NULL_MUTEX = NullMutex()
+_NULL_ASYNC_MUTEX = NullAsyncMutex()
+
 
 class NullBackend(Backend):
     """Passthrough backend that never caches anything.
@@ -48,9 +52,9 @@ class NullBackend(Backend):
         return 0
 
     def get_mutex(self, key: str) -> NullMutex:
-        """Returns NullMutex (no-op mutex).
+        """Returns the shared NullMutex (no-op mutex).
         """
-        return NullMutex()
+        return _NULL_MUTEX
 
     def incr_stat(self, fn_name: str, stat: Literal['hits', 'misses']) -> None:
         """No-op.
@@ -100,9 +104,9 @@ class NullBackend(Backend):
         return 0
 
     def get_async_mutex(self, key: str) -> NullAsyncMutex:
-        """Returns NullAsyncMutex (no-op async mutex).
+        """Returns the shared NullAsyncMutex (no-op async mutex).
         """
-        return NullAsyncMutex()
+        return _NULL_ASYNC_MUTEX
 
     async def aincr_stat(self, fn_name: str, stat: Literal['hits', 'misses']) -> None:
         """No-op.
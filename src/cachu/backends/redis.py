@@ -7,11 +7,13 @@ import pickle
 import struct
 import threading
 import time
+from collections import Counter
 from collections.abc import AsyncIterator, Iterator
 from typing import TYPE_CHECKING, Any, Literal
 
 from ..api import NO_VALUE, Backend
 from ..mutex import AsyncCacheMutex, AsyncRedisMutex, CacheMutex, RedisMutex
+from ..util import _dumps
 
 if TYPE_CHECKING:
     import redis
@@ -221,6 +223,46 @@ def get_redis_client(
     return client
 
 
+# Sync clients shared by every RedisBackend built with the same connection
+# settings, each with the number of open backends holding it.
+_shared_clients: dict[tuple[str, int, float, int], list[Any]] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def _acquire_shared_client(settings: tuple[str, int, float, int]) -> 'redis.Redis':
+    """Return the shared sync client for `settings`, creating it on first use.
+
+    Notes
+    -----
+    - The manager builds one backend per (package, backend, ttl), so a
+      process caching at several TTLs against one server would otherwise
+      hold one connection pool per TTL. redis-py clients are thread-safe
+      and reset their pool after a fork, so one pool serves them all.
+    - Only the sync client is shared. Async pools are bound to the event
+      loop that opened their connections, so each backend keeps its own.
+    """
+    with _shared_clients_lock:
+        entry = _shared_clients.get(settings)
+        if entry is None:
+            entry = _shared_clients[settings] = [get_redis_client(*settings), 0]
+        entry[1] += 1
+        return entry[0]
+
+
+def _release_shared_client(settings: tuple[str, int, float, int]) -> None:
+    """Drop one backend's hold on a shared client, closing it with the last.
+    """
+    with _shared_clients_lock:
+        entry = _shared_clients.get(settings)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+        del _shared_clients[settings]
+    entry[0].close()
+
+
 def get_async_redis_client(
     url: str,
     health_check_interval: int = 30,
@@ -246,9 +288,7 @@ def get_async_redis_client(
 def _pack_value(value: Any, created_at: float) -> bytes:
     """Pack value with creation timestamp.
     """
-    metadata = struct.pack(_METADATA_FORMAT, created_at)
-    pickled = pickle.dumps(value)
-    return metadata + pickled
+    return _dumps(value, header=struct.pack(_METADATA_FORMAT, created_at))
 
 
 def _unpack_value(data: bytes, key: str) -> tuple[Any, float] | None:
@@ -276,10 +316,12 @@ def _unpack_value(data: bytes, key: str) -> tuple[Any, float] | None:
       drives the hit rate to zero for as long as both run. Silent here would
       leave the operator nothing to read; the file backend already warns on
       the identical fault.
+    - The pickle is read through a memoryview, so a large payload is not
+      copied once more just to strip the header.
     """
     try:
         created_at = struct.unpack(_METADATA_FORMAT, data[:_METADATA_SIZE])[0]
-        value = pickle.loads(data[_METADATA_SIZE:])
+        value = pickle.loads(memoryview(data)[_METADATA_SIZE:])
         return value, created_at
     except (pickle.UnpicklingError, EOFError, TypeError, AttributeError, ModuleNotFoundError, struct.error):
         logger.warning(
@@ -287,6 +329,135 @@ def _unpack_value(data: bytes, key: str) -> tuple[Any, float] | None:
         return None
 
 
+def _unpack_many(keys: list[str], payloads: list[bytes | None]) -> tuple[list[Any], list[str]]:
+    """Unpack a batch of GET replies into (values, undecodable keys).
+
+    Missing and undecodable entries come back as NO_VALUE.
+    """
+    values: list[Any] = []
+    corrupt: list[str] = []
+    for key, data in zip(keys, payloads):
+        if data is None:
+            values.append(NO_VALUE)
+            continue
+        result = _unpack_value(data, key)
+        if result is None:
+            corrupt.append(key)
+            values.append(NO_VALUE)
+            continue
+        values.append(result[0])
+    return values, corrupt
+
+
+def _unlink_matching(client: 'redis.Redis', pattern: str) -> int:
+    """UNLINK every key matching `pattern`, one pipeline per SCAN batch.
+
+    Parameters
+    ----------
+    client : redis.Redis
+        Client to scan and unlink through.
+    pattern : str
+        Redis glob to match.
+
+    Returns
+    -------
+    int
+        Number of keys UNLINKed.
+
+    Notes
+    -----
+    - Batches are flushed as the SCAN produces them rather than after the
+      whole keyspace has been listed, so memory stays bounded by
+      `_CLEAR_BATCH_SIZE` and the first keys are gone before the scan ends.
+      Deleting behind a SCAN cursor is safe: SCAN still returns every key
+      that existed for the whole iteration.
+    - Single-key UNLINKs are pipelined to stay legal on Redis Cluster, and
+      UNLINK frees the values off the server's main thread.
+    """
+    count = 0
+    pipe = client.pipeline(transaction=False)
+    pending = 0
+    for key in client.scan_iter(match=pattern, count=_CLEAR_BATCH_SIZE):
+        pipe.unlink(key)
+        pending += 1
+        if pending >= _CLEAR_BATCH_SIZE:
+            pipe.execute()
+            count += pending
+            pending = 0
+    if pending:
+        pipe.execute()
+        count += pending
+    return count
+
+
+async def _aunlink_matching(client: 'aioredis.Redis', pattern: str) -> int:
+    """Async `_unlink_matching`: UNLINK matches one pipeline per SCAN batch.
+    """
+    count = 0
+    pipe = client.pipeline(transaction=False)
+    pending = 0
+    async for key in client.scan_iter(match=pattern, count=_CLEAR_BATCH_SIZE):
+        pipe.unlink(key)
+        pending += 1
+        if pending >= _CLEAR_BATCH_SIZE:
+            await pipe.execute()
+            count += pending
+            pending = 0
+    if pending:
+        await pipe.execute()
+        count += pending
+    return count
+
+
+def _flush_db(client: 'redis.Redis') -> int:
+    """Empty the client's whole logical DB in one round trip.
+
+    Parameters
+    ----------
+    client : redis.Redis
+        Client whose DB to flush.
+
+    Returns
+    -------
+    int
+        DBSIZE read just before the flush.
+
+    Notes
+    -----
+    - DBSIZE and FLUSHDB ASYNC share one pipeline, so the count is exact
+      only when no other client writes in between, the same point-in-time
+      caveat a SCAN-based count carries.
+    - FLUSHDB ASYNC frees the keyspace off the server's main thread, as
+      UNLINK does per key.
+    - Servers that rename or disable FLUSHDB (common on managed Redis)
+      reject it with a ResponseError; the clear then falls back to
+      `_unlink_matching` over '*'.
+    """
+    pipe = client.pipeline(transaction=False)
+    pipe.dbsize()
+    pipe.flushdb(asynchronous=True)
+    try:
+        size, _ = pipe.execute()
+    except _get_redis_module().ResponseError:
+        logger.debug('FLUSHDB rejected, clearing by SCAN', exc_info=True)
+        return _unlink_matching(client, '*')
+    return size
+
+
+async def _aflush_db(client: 'aioredis.Redis') -> int:
+    """Async `_flush_db`: DBSIZE plus FLUSHDB ASYNC in one round trip.
+    """
+    pipe = client.pipeline(transaction=False)
+    pipe.dbsize()
+    pipe.flushdb(asynchronous=True)
+    try:
+        size, _ = await pipe.execute()
+    except _get_redis_module().ResponseError:
+        logger.debug('FLUSHDB rejected, clearing by SCAN', exc_info=True)
+        return await _aunlink_matching(client, '*')
+    return size
+
+
 class RedisBackend(Backend):
     """Unified Redis cache backend with both sync and async interfaces.
     """
@@ -298,27 +469,37 @@ class RedisBackend(Backend):
         health_check_interval: int = 30,
         socket_timeout: float = 5.0,
         retry_count: int = 3,
+        stats_batch: int = 1,
     ) -> None:
         self._url = url
         self._lock_timeout = lock_timeout
         self._health_check_interval = health_check_interval
         self._socket_timeout = socket_timeout
         self._retry_count = retry_count
+        self._stats_batch = stats_batch
         self._sync_client: redis.Redis | None = None
+        self._shared_settings: tuple[str, int, float, int] | None = None
         self._async_client: aioredis.Redis | None = None
         self._init_lock = threading.Lock()
+        self._stat_lock = threading.Lock()
+        self._stat_buffer: Counter[tuple[str, str]] = Counter()
+        self._stat_pending = 0
 
     @property
     def client(self) -> 'redis.Redis':
-        """Lazy-load sync Redis client.
+        """Lazy-load sync Redis client, shared with same-settings backends.
         """
         if self._sync_client is None:
-            self._sync_client = get_redis_client(
-                self._url,
-                self._health_check_interval,
-                self._socket_timeout,
-                self._retry_count,
-            )
+            with self._init_lock:
+                if self._sync_client is None:
+                    settings = (
+                        self._url,
+                        self._health_check_interval,
+                        self._socket_timeout,
+                        self._retry_count,
+                    )
+                    self._sync_client = _acquire_shared_client(settings)
+                    self._shared_settings = settings
         return self._sync_client
 
     def _get_async_client(self) -> 'aioredis.Redis':
@@ -380,6 +561,57 @@ class RedisBackend(Backend):
         """
         self.client.delete(key)
 
+    def get_many(self, keys: list[str]) -> list[Any]:
+        """Get values for keys in one round trip. Missing entries are NO_VALUE.
+
+        Notes
+        -----
+        - Pipelined single-key GETs rather than MGET: cachu keys carry no
+          hash tag, so an MGET spanning slots would be rejected by Redis
+          Cluster. The pipeline costs the same single round trip.
+        - Undecodable payloads are deleted in one further pipeline, as `get`
+          deletes them one at a time.
+        """
+        if not keys:
+            return []
+        pipe = self.client.pipeline(transaction=False)
+        for key in keys:
+            pipe.get(key)
+        values, corrupt = _unpack_many(keys, pipe.execute())
+        if corrupt:
+            self.delete_many(corrupt)
+        return values
+
+    def set_many(self, items: dict[str, Any], ttl: int) -> None:
+        """Set values for keys in one pipelined round trip.
+
+        Notes
+        -----
+        - Pipelined SET ... EX per key rather than MSET: MSET cannot carry a
+          TTL, and spanning slots it would be rejected by Redis Cluster.
+        - A non-positive TTL is not cached: the keys are deleted instead.
+        """
+        if ttl <= 0:
+            self.delete_many(list(items))
+            return
+        if not items:
+            return
+        now = time.time()
+        pipe = self.client.pipeline(transaction=False)
+        for key, value in items.items():
+            pipe.set(key, _pack_value(value, now), ex=ttl)
+        pipe.execute()
+
+    def delete_many(self, keys: list[str]) -> None:
+        """Delete values by keys in one pipelined round trip.
+        """
+        if not keys:
+            return
+        pipe = self.client.pipeline(transaction=False)
+        for key in keys:
+            pipe.delete(key)
+        pipe.execute()
+
     def clear(self, pattern: str | None = None) -> int:
         """Clear entries matching pattern. Returns count of cleared entries.
 
@@ -396,7 +628,10 @@ class RedisBackend(Backend):
 
         Notes
         -----
-        - Single-key UNLINKs are pipelined to stay legal on Redis Cluster.
+        - Matches are UNLINKed in pipelined batches as the SCAN yields them;
+          see `_unlink_matching`.
+        - None skips the SCAN: the DB is flushed server-side in one round
+          trip; see `_flush_db`.
         - `cache_clear` never passes None: it derives a region-scoped glob
           from cachu's own key shape, so a library-level clear cannot reach a
           key cachu did not write. None stays available on the backend itself
@@ -404,24 +639,25 @@ class RedisBackend(Backend):
           for exactly that store.
         """
         if pattern is None:
-            pattern = '*'
-
-        keys = list(self.client.scan_iter(match=pattern))
-        count = 0
-        for start in range(0, len(keys), _CLEAR_BATCH_SIZE):
-            chunk = keys[start:start + _CLEAR_BATCH_SIZE]
-            pipe = self.client.pipeline(transaction=False)
-            for key in chunk:
-                pipe.unlink(key)
-            pipe.execute()
-            count += len(chunk)
-        return count
+            return _flush_db(self.client)
+        return _unlink_matching(self.client, pattern)
 
     def keys(self, pattern: str | None = None) -> Iterator[str]:
-        """Iterate over keys matching pattern.
+        """Iterate over keys matching pattern, each key once.
+
+        Notes
+        -----
+        - SCAN may return a key more than once (for instance while the
+          server rehashes its keyspace mid-iteration), so yielded keys are
+          tracked and repeats dropped. A pattern `count` goes through here
+          and inherits the same guarantee.
         """
         redis_pattern = pattern or '*'
+        seen = set()
         for key in self.client.scan_iter(match=redis_pattern):
+            if key in seen:
+                continue
+            seen.add(key)
             yield key.decode() if isinstance(key, bytes) else key
 
     def count(self, pattern: str | None = None) -> int:
@@ -441,16 +677,61 @@ class RedisBackend(Backend):
 
     # ===== Stats interface (sync) =====
 
+    def _buffer_stat(self, fn_name: str, stat: str) -> list[tuple[str, str, int]]:
+        """Buffer one increment; return the drained batch once it is full.
+        """
+        with self._stat_lock:
+            self._stat_buffer[fn_name, stat] += 1
+            self._stat_pending += 1
+            if self._stat_pending < self._stats_batch:
+                return []
+        return self._drain_stats()
+
+    def _drain_stats(self) -> list[tuple[str, str, int]]:
+        """Take every buffered increment as `incr_stats` updates.
+        """
+        with self._stat_lock:
+            updates = [(fn_name, stat, n) for (fn_name, stat), n in self._stat_buffer.items()]
+            self._stat_buffer.clear()
+            self._stat_pending = 0
+        return updates
+
     def incr_stat(self, fn_name: str, stat: Literal['hits', 'misses']) -> None:
         """Increment a stat counter for a function.
+
+        Notes
+        -----
+        - With `stats_batch` above 1, increments are buffered in-process and
+          written as one pipelined batch every `stats_batch` calls, sync and
+          async calls sharing the buffer. This instance's `get_stats`,
+          `clear_stats` and `close` flush first, but other processes see up
+          to `stats_batch - 1` increments late, and a batch whose write fails
+          is dropped - stats are best-effort.
         """
-        self.client.hincrby(f'{_STATS_KEY_PREFIX}{fn_name}', stat, 1)
+        if self._stats_batch == 1:
+            self.client.hincrby(f'{_STATS_KEY_PREFIX}{fn_name}', stat, 1)
+            return
+        self.incr_stats(self._buffer_stat(fn_name, stat))
+
+    def incr_stats(
+        self,
+        updates: list[tuple[str, Literal['hits', 'misses'], int]],
+    ) -> None:
+        """Apply several stat increments in one pipelined round trip.
+        """
+        if not updates:
+            return
+        pipe = self.client.pipeline(transaction=False)
+        for fn_name, stat, amount in updates:
+            pipe.hincrby(f'{_STATS_KEY_PREFIX}{fn_name}', stat, amount)
+        pipe.execute()
 
     def get_stats(self, fn_name: str) -> tuple[int, int]:
         """Get (hits, misses) for a function.
         """
-        data = self.client.hgetall(f'{_STATS_KEY_PREFIX}{fn_name}')
-        return (int(data.get(b'hits', 0)), int(data.get(b'misses', 0)))
+        self.incr_stats(self._drain_stats())
+        hits, misses = self.client.hmget(f'{_STATS_KEY_PREFIX}{fn_name}', 'hits', 'misses')
+        return (int(hits or 0), int(misses or 0))
 
     def clear_stats(self, fn_name: str | None = None) -> None:
         """Clear stats for a function, or all stats if fn_name is None.
@@ -466,14 +747,13 @@ class RedisBackend(Backend):
           mutex; it self-heals in at most `_CURRSIZE_LOCK_TTL` and only
           costs one extra scan.
         """
+        self.incr_stats(self._drain_stats())
         if fn_name:
             self.client.delete(f'{_STATS_KEY_PREFIX}{fn_name}')
         else:
-            for key in self.client.scan_iter(match=f'{_STATS_KEY_PREFIX}*'):
-                self.client.delete(key)
+            _unlink_matching(self.client, f'{_STATS_KEY_PREFIX}*')
         for prefix in _CURRSIZE_CACHE_PREFIXES:
-            for key in self.client.scan_iter(match=f'{prefix}*'):
-                self.client.delete(key)
+            _unlink_matching(self.client, f'{prefix}*')
 
     # ===== Async interface =====
 
@@ -525,6 +805,43 @@ class RedisBackend(Backend):
         client = self._get_async_client()
         await client.delete(key)
 
+    async def aget_many(self, keys: list[str]) -> list[Any]:
+        """Async get values for keys in one round trip. Missing entries are NO_VALUE.
+        """
+        if not keys:
+            return []
+        pipe = self._get_async_client().pipeline(transaction=False)
+        for key in keys:
+            pipe.get(key)
+        values, corrupt = _unpack_many(keys, await pipe.execute())
+        if corrupt:
+            await self.adelete_many(corrupt)
+        return values
+
+    async def aset_many(self, items: dict[str, Any], ttl: int) -> None:
+        """Async set values for keys in one pipelined round trip.
+        """
+        if ttl <= 0:
+            await self.adelete_many(list(items))
+            return
+        if not items:
+            return
+        now = time.time()
+        pipe = self._get_async_client().pipeline(transaction=False)
+        for key, value in items.items():
+            pipe.set(key, _pack_value(value, now), ex=ttl)
+        await pipe.execute()
+
+    async def adelete_many(self, keys: list[str]) -> None:
+        """Async delete values by keys in one pipelined round trip.
+        """
+        if not keys:
+            return
+        pipe = self._get_async_client().pipeline(transaction=False)
+        for key in keys:
+            pipe.delete(key)
+        await pipe.execute()
+
     async def aclear(self, pattern: str | None = None) -> int:
         """Async clear entries matching pattern. Returns count of cleared entries.
 
@@ -541,29 +858,25 @@ class RedisBackend(Backend):
 
         Notes
         -----
-        - Single-key UNLINKs are pipelined to stay legal on Redis Cluster.
+        - Matches are UNLINKed in pipelined batches as the SCAN yields them;
+          see `_unlink_matching`. None flushes the DB instead; see
+          `_flush_db`.
         """
         client = self._get_async_client()
         if pattern is None:
-            pattern = '*'
-
-        keys = [key async for key in client.scan_iter(match=pattern)]
-        count = 0
-        for start in range(0, len(keys), _CLEAR_BATCH_SIZE):
-            chunk = keys[start:start + _CLEAR_BATCH_SIZE]
-            pipe = client.pipeline(transaction=False)
-            for key in chunk:
-                pipe.unlink(key)
-            await pipe.execute()
-            count += len(chunk)
-        return count
+            return await _aflush_db(client)
+        return await _aunlink_matching(client, pattern)
 
     async def akeys(self, pattern: str | None = None) -> AsyncIterator[str]:
-        """Async iterate over keys matching pattern.
+        """Async iterate over keys matching pattern, each key once as in `keys`.
         """
         client = self._get_async_client()
         redis_pattern = pattern or '*'
+        seen = set()
         async for key in client.scan_iter(match=redis_pattern):
+            if key in seen:
+                continue
+            seen.add(key)
             yield key.decode() if isinstance(key, bytes) else key
 
     async def acount(self, pattern: str | None = None) -> int:
@@ -587,17 +900,34 @@ class RedisBackend(Backend):
     # ===== Stats interface (async) =====
 
     async def aincr_stat(self, fn_name: str, stat: Literal['hits', 'misses']) -> None:
-        """Async increment a stat counter for a function.
+        """Async increment a stat counter for a function, buffered as in `incr_stat`.
         """
-        client = self._get_async_client()
-        await client.hincrby(f'{_STATS_KEY_PREFIX}{fn_name}', stat, 1)
+        if self._stats_batch == 1:
+            client = self._get_async_client()
+            await client.hincrby(f'{_STATS_KEY_PREFIX}{fn_name}', stat, 1)
+            return
+        await self.aincr_stats(self._buffer_stat(fn_name, stat))
+
+    async def aincr_stats(
+        self,
+        updates: list[tuple[str, Literal['hits', 'misses'], int]],
+    ) -> None:
+        """Async apply several stat increments in one pipelined round trip.
+        """
+        if not updates:
+            return
+        pipe = self._get_async_client().pipeline(transaction=False)
+        for fn_name, stat, amount in updates:
+            pipe.hincrby(f'{_STATS_KEY_PREFIX}{fn_name}', stat, amount)
+        await pipe.execute()
 
     async def aget_stats(self, fn_name: str) -> tuple[int, int]:
         """Async get (hits, misses) for a function.
         """
+        await self.aincr_stats(self._drain_stats())
         client = self._get_async_client()
-        data = await client.hgetall(f'{_STATS_KEY_PREFIX}{fn_name}')
-        return (int(data.get(b'hits', 0)), int(data.get(b'misses', 0)))
+        hits, misses = await client.hmget(f'{_STATS_KEY_PREFIX}{fn_name}', 'hits', 'misses')
+        return (int(hits or 0), int(misses or 0))
 
     async def aclear_stats(self, fn_name: str | None = None) -> None:
         """Async clear stats for a function, or all stats if fn_name is None.
@@ -608,25 +938,29 @@ class RedisBackend(Backend):
           leaves the refresh lock alone, exactly as the sync `clear_stats`
           does.
         """
+        await self.aincr_stats(self._drain_stats())
         client = self._get_async_client()
         if fn_name:
             await client.delete(f'{_STATS_KEY_PREFIX}{fn_name}')
         else:
-            async for key in client.scan_iter(match=f'{_STATS_KEY_PREFIX}*'):
-                await client.delete(key)
+            await _aunlink_matching(client, f'{_STATS_KEY_PREFIX}*')
         for prefix in _CURRSIZE_CACHE_PREFIXES:
-            async for key in client.scan_iter(match=f'{prefix}*'):
-                await client.delete(key)
+            await _aunlink_matching(client, f'{prefix}*')
 
     # ===== Lifecycle =====
 
     def _close_sync_client(self) -> None:
-        """Close sync client if open.
+        """Close sync client if open, or release this backend's hold on a shared one.
         """
         if self._sync_client is not None:
             client = self._sync_client
+            settings = self._shared_settings
             self._sync_client = None
-            client.close()
+            self._shared_settings = None
+            if settings is None:
+                client.close()
+            else:
+                _release_shared_client(settings)
 
     def _close_async_client_sync(self) -> None:
         """Close async client from sync context via thread.
@@ -648,12 +982,22 @@ class RedisBackend(Backend):
     def close(self) -> None:
         """Close all backend resources from sync context.
         """
+        if self._stat_pending:
+            try:
+                self.incr_stats(self._drain_stats())
+            except Exception:
+                logger.warning('Dropped buffered cache stats on close', exc_info=True)
         self._close_sync_client()
         self._close_async_client_sync()
 
     async def aclose(self) -> None:
         """Close all backend resources from async context.
         """
+        if self._stat_pending:
+            try:
+                await self.aincr_stats(self._drain_stats())
+            except Exception:
+                logger.warning('Dropped buffered cache stats on close', exc_info=True)
         if self._async_client is not None:
             client = self._async_client
             self._async_client = None
@@ -11,12 +11,63 @@ from typing import TYPE_CHECKING, Any, Literal
 
 from ..api import NO_VALUE, Backend
 from ..mutex import AsyncCacheMutex, AsyncioMutex, CacheMutex, ThreadingMutex
+from ..util import _dumps
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     import aiosqlite
 
+# Keys bound per `IN (...)` statement; SQLite builds before 3.32 cap host
+# parameters at 999.
+_IN_BATCH_SIZE = 500
+
+# Per-connection settings. busy_timeout makes a contended connection wait
+# rather than fail with 'database is locked'; under WAL, synchronous=NORMAL
+# fsyncs at checkpoints instead of on every commit, which can lose only the
+# last few writes on power loss - an acceptable trade for a cache.
+_CONNECTION_PRAGMAS = (
+    'PRAGMA busy_timeout=5000',
+    'PRAGMA synchronous=NORMAL',
+)
+
+
+# One UPSERT adds a (hits, misses) delta, so single and batched increments
+# share a statement and the batch runs as one executemany in one commit.
+_INCR_STATS_SQL = """INSERT INTO cache_stats (fn_name, hits, misses)
+                     VALUES (?, ?, ?)
+                     ON CONFLICT(fn_name) DO UPDATE SET
+                         hits = hits + excluded.hits,
+                         misses = misses + excluded.misses"""
+
+
+_SET_SQL = """INSERT OR REPLACE INTO cache (key, value, created_at, expires_at)
+              VALUES (?, ?, ?, ?)"""
+
+
+def _set_rows(items: dict[str, Any], ttl: int) -> list[tuple[str, bytes, float, float]]:
+    """Return the `_SET_SQL` parameters for each item, stamped with one `now`.
+    """
+    now = time.time()
+    return [(key, _dumps(value), now, now + ttl) for key, value in items.items()]
+
+
+def _stat_row(fn_name: str, stat: str, amount: int) -> tuple[str, int, int]:
+    """Return the `_INCR_STATS_SQL` parameters adding `amount` to `stat`.
+    """
+    if stat == 'hits':
+        return (fn_name, amount, 0)
+    return (fn_name, 0, amount)
+
+
+def _key_batches(keys: list[str]) -> Iterator[tuple[str, list[str]]]:
+    """Yield (placeholders, batch) pairs covering the distinct `keys`.
+    """
+    unique = list(dict.fromkeys(keys))
+    for start in range(0, len(unique), _IN_BATCH_SIZE):
+        batch = unique[start:start + _IN_BATCH_SIZE]
+        yield ', '.join('?' * len(batch)), batch
+
 
 def _get_aiosqlite_module() -> Any:
     """Import aiosqlite module, raising helpful error if not installed.
@@ -56,12 +107,13 @@ class SqliteBackend(Backend):
             conn = sqlite3.connect(self._filepath)
             try:
                 # WAL lets readers and a writer proceed concurrently (persistent
-                # at the DB level, set once here); busy_timeout makes a
-                # contended connection wait rather than fail with a spurious
-                # 'database is locked' - the sync path was missing both, so
-                # concurrent writers (e.g. reactive materialization) could miss.
+                # at the DB level, set once here); see `_CONNECTION_PRAGMAS` for
+                # the settings every connection repeats - the sync path was
+                # missing both, so concurrent writers (e.g. reactive
+                # materialization) could miss.
                 conn.execute('PRAGMA journal_mode=WAL')
-                conn.execute('PRAGMA busy_timeout=5000')
+                for pragma in _CONNECTION_PRAGMAS:
+                    conn.execute(pragma)
                 conn.execute("""
                     CREATE TABLE IF NOT EXISTS cache (
                         key TEXT PRIMARY KEY,
@@ -94,7 +146,8 @@ class SqliteBackend(Backend):
                 aiosqlite = _get_aiosqlite_module()
                 self._async_connection = await aiosqlite.connect(self._filepath)
                 await self._async_connection.execute('PRAGMA journal_mode=WAL')
-                await self._async_connection.execute('PRAGMA busy_timeout=5000')
+                for pragma in _CONNECTION_PRAGMAS:
+                    await self._async_connection.execute(pragma)
 
             if not self._async_initialized:
                 await self._async_connection.execute("""
@@ -122,11 +175,12 @@ class SqliteBackend(Backend):
         return self._async_connection
 
     def _get_sync_connection(self) -> sqlite3.Connection:
-        """Get a sync database connection (busy-timeout guarded; DB is WAL).
+        """Get a sync database connection (`_CONNECTION_PRAGMAS` applied; DB is WAL).
         """
         self._ensure_sync_initialized()
         conn = sqlite3.connect(self._filepath)
-        conn.execute('PRAGMA busy_timeout=5000')
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
         return conn
 
     def _fnmatch_to_glob(self, pattern: str) -> str:
@@ -238,16 +292,12 @@ class SqliteBackend(Backend):
             return
 
         now = time.time()
-        value_blob = pickle.dumps(value)
+        value_blob = _dumps(value)
 
         with self._sync_lock:
             conn = self._get_sync_connection()
             try:
-                conn.execute(
-                    """INSERT OR REPLACE INTO cache (key, value, created_at, expires_at)
-                       VALUES (?, ?, ?, ?)""",
-                    (key, value_blob, now, now + ttl),
-                )
+                conn.execute(_SET_SQL, (key, value_blob, now, now + ttl))
                 conn.commit()
             finally:
                 conn.close()
@@ -265,6 +315,86 @@ class SqliteBackend(Backend):
             finally:
                 conn.close()
 
+    def get_many(self, keys: list[str]) -> list[Any]:
+        """Get values for keys, in order. Missing entries are NO_VALUE.
+
+        Notes
+        -----
+        - One SELECT per `_IN_BATCH_SIZE` keys over one connection, instead
+          of a connection and a query per key.
+        - Expired and undecodable rows are dropped exactly as `get` drops
+          them, but with one DELETE per batch.
+        """
+        found: dict[str, Any] = {}
+        stale: list[str] = []
+        now = time.time()
+
+        with self._sync_lock:
+            conn = self._get_sync_connection()
+            try:
+                for placeholders, batch in _key_batches(keys):
+                    cursor = conn.execute(
+                        f'SELECT key, value, expires_at FROM cache WHERE key IN ({placeholders})',
+                        batch,
+                    )
+                    for key, value_blob, expires_at in cursor.fetchall():
+                        if now > expires_at:
+                            stale.append(key)
+                            continue
+                        try:
+                            found[key] = pickle.loads(value_blob)
+                        except Exception:
+                            logger.warning(
+                                f'Evicting undecodable cache row for key {key!r}',
+                                exc_info=True)
+                            stale.append(key)
+                for placeholders, batch in _key_batches(stale):
+                    conn.execute(f'DELETE FROM cache WHERE key IN ({placeholders})', batch)
+                if stale:
+                    conn.commit()
+            except Exception:
+                logger.warning(f'SQLite read failed for {len(keys)} keys', exc_info=True)
+                return [NO_VALUE] * len(keys)
+            finally:
+                conn.close()
+
+        return [found.get(key, NO_VALUE) for key in keys]
+
+    def set_many(self, items: dict[str, Any], ttl: int) -> None:
+        """Set values for keys with one executemany and a single commit.
+
+        A non-positive TTL is not cached: the keys are deleted instead.
+        """
+        if ttl <= 0:
+            self.delete_many(list(items))
+            return
+        if not items:
+            return
+
+        rows = _set_rows(items, ttl)
+
+        with self._sync_lock:
+            conn = self._get_sync_connection()
+            try:
+                conn.executemany(_SET_SQL, rows)
+                conn.commit()
+            finally:
+                conn.close()
+
+    def delete_many(self, keys: list[str]) -> None:
+        """Delete values by keys with one DELETE per batch and a single commit.
+        """
+        with self._sync_lock:
+            conn = self._get_sync_connection()
+            try:
+                for placeholders, batch in _key_batches(keys):
+                    conn.execute(f'DELETE FROM cache WHERE key IN ({placeholders})', batch)
+                conn.commit()
+            except Exception:
+                pass
+            finally:
+                conn.close()
+
     def clear(self, pattern: str | None = None) -> int:
         """Clear entries matching pattern. Returns count of cleared entries.
         """
@@ -272,21 +402,14 @@ class SqliteBackend(Backend):
             conn = self._get_sync_connection()
             try:
                 if pattern is None:
-                    cursor = conn.execute('SELECT COUNT(*) FROM cache')
-                    count = cursor.fetchone()[0]
-                    conn.execute('DELETE FROM cache')
-                    conn.commit()
-                    return count
-
-                glob_pattern = self._fnmatch_to_glob(pattern)
-                cursor = conn.execute(
-                    'SELECT COUNT(*) FROM cache WHERE key GLOB ?',
-                    (glob_pattern,),
-                )
-                count = cursor.fetchone()[0]
-                conn.execute('DELETE FROM cache WHERE key GLOB ?', (glob_pattern,))
+                    cursor = conn.execute('DELETE FROM cache')
+                else:
+                    cursor = conn.execute(
+                        'DELETE FROM cache WHERE key GLOB ?',
+                        (self._fnmatch_to_glob(pattern),),
+                    )
                 conn.commit()
-                return count
+                return cursor.rowcount
             except Exception:
                 return 0
             finally:
@@ -376,20 +499,23 @@ class SqliteBackend(Backend):
         with self._sync_lock:
             conn = self._get_sync_connection()
             try:
-                if stat == 'hits':
-                    conn.execute(
-                        """INSERT INTO cache_stats (fn_name, hits, misses)
-                           VALUES (?, 1, 0)
-                           ON CONFLICT(fn_name) DO UPDATE SET hits = hits + 1""",
-                        (fn_name,),
-                    )
-                else:
-                    conn.execute(
-                        """INSERT INTO cache_stats (fn_name, hits, misses)
-                           VALUES (?, 0, 1)
-                           ON CONFLICT(fn_name) DO UPDATE SET misses = misses + 1""",
-                        (fn_name,),
-                    )
+                conn.execute(_INCR_STATS_SQL, _stat_row(fn_name, stat, 1))
+                conn.commit()
+            finally:
+                conn.close()
+
+    def incr_stats(
+        self,
+        updates: list[tuple[str, Literal['hits', 'misses'], int]],
+    ) -> None:
+        """Apply several stat increments in one transaction.
+        """
+        if not updates:
+            return
+        with self._sync_lock:
+            conn = self._get_sync_connection()
+            try:
+                conn.executemany(_INCR_STATS_SQL, [_stat_row(*update) for update in updates])
                 conn.commit()
             finally:
                 conn.close()
@@ -495,15 +621,11 @@ class SqliteBackend(Backend):
             return
 
         now = time.time()
-        value_blob = pickle.dumps(value)
+        value_blob = _dumps(value)
 
         async with self._async_write_lock:
             conn = await self._ensure_async_initialized()
-            await conn.execute(
-                """INSERT OR REPLACE INTO cache (key, value, created_at, expires_at)
-                   VALUES (?, ?, ?, ?)""",
-                (key, value_blob, now, now + ttl),
-            )
+            await conn.execute(_SET_SQL, (key, value_blob, now, now + ttl))
             await conn.commit()
 
     async def adelete(self, key: str) -> None:
@@ -517,6 +639,72 @@ class SqliteBackend(Backend):
             except Exception:
                 pass
 
+    async def aget_many(self, keys: list[str]) -> list[Any]:
+        """Async get values for keys, in order. Missing entries are NO_VALUE.
+
+        Notes
+        -----
+        - One SELECT per `_IN_BATCH_SIZE` keys; expired and undecodable rows
+          are scheduled for background deletion exactly as in `aget`.
+        """
+        found: dict[str, Any] = {}
+        now = time.time()
+
+        try:
+            conn = await self._ensure_async_initialized()
+            for placeholders, batch in _key_batches(keys):
+                cursor = await conn.execute(
+                    f'SELECT key, value, expires_at FROM cache WHERE key IN ({placeholders})',
+                    batch,
+                )
+                for key, value_blob, expires_at in await cursor.fetchall():
+                    if now > expires_at:
+                        self._schedule_async_delete(key)
+                        continue
+                    try:
+                        found[key] = pickle.loads(value_blob)
+                    except Exception:
+                        logger.warning(
+                            f'Evicting undecodable cache row for key {key!r}',
+                            exc_info=True)
+                        self._schedule_async_delete(key)
+        except Exception:
+            logger.warning(f'SQLite async read failed for {len(keys)} keys', exc_info=True)
+            return [NO_VALUE] * len(keys)
+
+        return [found.get(key, NO_VALUE) for key in keys]
+
+    async def aset_many(self, items: dict[str, Any], ttl: int) -> None:
+        """Async set values for keys with one executemany and a single commit.
+
+        A non-positive TTL is not cached: the keys are deleted instead.
+        """
+        if ttl <= 0:
+            await self.adelete_many(list(items))
+            return
+        if not items:
+            return
+
+        rows = _set_rows(items, ttl)
+
+        async with self._async_write_lock:
+            conn = await self._ensure_async_initialized()
+            await conn.executemany(_SET_SQL, rows)
+            await conn.commit()
+
+    async def adelete_many(self, keys: list[str]) -> None:
+        """Async delete values by keys with one DELETE per batch and a single commit.
+        """
+        async with self._async_write_lock:
+            try:
+                conn = await self._ensure_async_initialized()
+                for placeholders, batch in _key_batches(keys):
+                    await conn.execute(
+                        f'DELETE FROM cache WHERE key IN ({placeholders})', batch)
+                await conn.commit()
+            except Exception:
+                pass
+
     async def aclear(self, pattern: str | None = None) -> int:
         """Async clear entries matching pattern. Returns count of cleared entries.
         """
@@ -524,23 +712,14 @@ class SqliteBackend(Backend):
             try:
                 conn = await self._ensure_async_initialized()
                 if pattern is None:
-                    cursor = await conn.execute('SELECT COUNT(*) FROM cache')
-                    row = await cursor.fetchone()
-                    count = row[0]
-                    await conn.execute('DELETE FROM cache')
-                    await conn.commit()
-                    return count
-
-                glob_pattern = self._fnmatch_to_glob(pattern)
-                cursor = await conn.execute(
-                    'SELECT COUNT(*) FROM cache WHERE key GLOB ?',
-                    (glob_pattern,),
-                )
-                row = await cursor.fetchone()
-                count = row[0]
-                await conn.execute('DELETE FROM cache WHERE key GLOB ?', (glob_pattern,))
+                    cursor = await conn.execute('DELETE FROM cache')
+                else:
+                    cursor = await conn.execute(
+                        'DELETE FROM cache WHERE key GLOB ?',
+                        (self._fnmatch_to_glob(pattern),),
+                    )
                 await conn.commit()
-                return count
+                return cursor.rowcount
             except Exception:
                 return 0
 
@@ -620,20 +799,20 @@ class SqliteBackend(Backend):
         """
         async with self._async_write_lock:
             conn = await self._ensure_async_initialized()
-            if stat == 'hits':
-                await conn.execute(
-                    """INSERT INTO cache_stats (fn_name, hits, misses)
-                       VALUES (?, 1, 0)
-                       ON CONFLICT(fn_name) DO UPDATE SET hits = hits + 1""",
-                    (fn_name,),
-                )
-            else:
-                await conn.execute(
-                    """INSERT INTO cache_stats (fn_name, hits, misses)
-                       VALUES (?, 0, 1)
-                       ON CONFLICT(fn_name) DO UPDATE SET misses = misses + 1""",
-                    (fn_name,),
-                )
+            await conn.execute(_INCR_STATS_SQL, _stat_row(fn_name, stat, 1))
+            await conn.commit()
+
+    async def aincr_stats(
+        self,
+        updates: list[tuple[str, Literal['hits', 'misses'], int]],
+    ) -> None:
+        """Async apply several stat increments in one transaction.
+        """
+        if not updates:
+            return
+        async with self._async_write_lock:
+            conn = await self._ensure_async_initialized()
+            await conn.executemany(_INCR_STATS_SQL, [_stat_row(*update) for update in updates])
             await conn.commit()
 
     async def aget_stats(self, fn_name: str) -> tuple[int, int]:
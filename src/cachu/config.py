@@ -3,6 +3,7 @@
 Each calling library gets its own isolated configuration, preventing
 configuration conflicts when multiple libraries use the cachu package.
 """
+import functools
 import logging
 import math
 import os
@@ -229,6 +230,19 @@ def get_disabled_scopes() -> DisabledScopes:
         )
 
 
+@functools.lru_cache(maxsize=8)
+def _main_package(script: str) -> str:
+    """Package name for code running as `__main__` from `script`.
+
+    Notes
+    -----
+    - Cached on the script path: building a `pathlib.Path` costs several
+      times the rest of the frame walk, and a script caller pays it on
+      every `cache_clear`/`cache_info` call.
+    """
+    return f'__main__.{pathlib.Path(script).stem}'
+
+
 def _get_caller_package() -> str | None:
     """Get the top-level package name of the caller.
     """
@@ -238,7 +252,7 @@ def _get_caller_package() -> str | None:
         if name and not name.startswith('cachu'):
             pkg = name.split('.')[0]
             if pkg == '__main__' and sys.argv and sys.argv[0]:
-                return f'__main__.{pathlib.Path(sys.argv[0]).stem}'
+                return _main_package(sys.argv[0])
             return pkg
         frame = frame.f_back
     return None
@@ -268,6 +282,9 @@ class CacheConfig:
         addresses the endpoint resolves to.
     redis_retry_count : int, default 3
         Retry attempts redis-py makes per operation.
+    redis_stats_batch : int, default 1
+        Hit/miss increments the 'redis' backend buffers per process before
+        writing them as one pipelined batch; 1 writes each one through.
     fail_open : bool, default True
         Degrade backend faults to a cache miss instead of raising.
     cache_deadline : float or None, default None
@@ -316,6 +333,7 @@ class CacheConfig:
     redis_health_check_interval: int = 30
     redis_socket_timeout: float = 5.0
     redis_retry_count: int = 3
+    redis_stats_batch: int = 1
     fail_open: bool = True
     cache_deadline: float | None = None
     on_lock_timeout: str = 'run'
@@ -329,12 +347,32 @@ class ConfigRegistry:
     Each library (identified by top-level package name) gets its own
     isolated configuration. This prevents configuration conflicts when
     multiple libraries use the cache package with different settings.
+
+    Attributes
+    ----------
+    version : int
+        Bumped whenever a package's config OBJECT may change: `configure`,
+        `clear`, or assigning `_default`. Callers that memoize the result of
+        `get_config` revalidate against it. Editing a field of a config in
+        place needs no bump, since a memoized object sees the edit.
     """
 
     def __init__(self) -> None:
         self._configs: dict[str | None, CacheConfig] = {}
-        self._default = CacheConfig()
+        self._default_config = CacheConfig()
         self._lock = threading.Lock()
+        self.version = 0
+
+    @property
+    def _default(self) -> CacheConfig:
+        """Fallback config for packages that never called `configure`.
+        """
+        return self._default_config
+
+    @_default.setter
+    def _default(self, cfg: CacheConfig) -> None:
+        self._default_config = cfg
+        self.version += 1
 
     def configure(
         self,
@@ -347,6 +385,7 @@ class ConfigRegistry:
         redis_health_check_interval: int | None = None,
         redis_socket_timeout: float | None = None,
         redis_retry_count: int | None = None,
+        redis_stats_batch: int | None = None,
         fail_open: bool | None = None,
         cache_deadline: float | None = None,
         on_lock_timeout: str | None = None,
@@ -367,6 +406,7 @@ class ConfigRegistry:
             'redis_health_check_interval': redis_health_check_interval,
             'redis_socket_timeout': redis_socket_timeout,
             'redis_retry_count': redis_retry_count,
+            'redis_stats_batch': redis_stats_batch,
             'fail_open': fail_open,
             'cache_deadline': cache_deadline,
             'on_lock_timeout': on_lock_timeout,
@@ -381,6 +421,7 @@ class ConfigRegistry:
             base = self._configs.get(package, self._default)
             new_cfg = replace(base, **updates)
             self._configs[package] = new_cfg
+            self.version += 1
 
         logger.debug(f"Configured cache for package '{package}': {updates}")
         return new_cfg
@@ -426,6 +467,10 @@ class ConfigRegistry:
                 raise ConfigurationError(
                     f'{name} must be a non-negative integer, got {kwargs[name]!r}')
 
+        if 'redis_stats_batch' in kwargs and not _is_whole_number(kwargs['redis_stats_batch'], minimum=1):
+            raise ConfigurationError(
+                f"redis_stats_batch must be a positive integer, got {kwargs['redis_stats_batch']!r}")
+
         if 'memory_maxsize' in kwargs and not _is_whole_number(kwargs['memory_maxsize'], minimum=1):
             raise ConfigurationError(
                 f"memory_maxsize must be a positive integer, got {kwargs['memory_maxsize']!r}")
@@ -457,6 +502,7 @@ class ConfigRegistry:
         """Clear all package configurations. Primarily for testing.
         """
         self._configs.clear()
+        self.version += 1
 
 
 _registry = ConfigRegistry()
@@ -471,6 +517,7 @@ def configure(
     redis_health_check_interval: int | None = None,
     redis_socket_timeout: float | None = None,
     redis_retry_count: int | None = None,
+    redis_stats_batch: int | None = None,
     fail_open: bool | None = None,
     cache_deadline: float | None = None,
     on_lock_timeout: str | None = None,
@@ -503,6 +550,10 @@ def configure(
         the endpoint resolves to.
     redis_retry_count : int or None, default None
         Retries on connection failure (default 3).
+    redis_stats_batch : int or None, default None
+        Hit/miss increments buffered per process before one pipelined write
+        (default 1, write-through). Other processes read stats up to this
+        many increments late.
     fail_open : bool or None, default None
         When True (default), backend construction, read and lock errors
         degrade to a cache miss; when False they propagate to the caller.
@@ -563,6 +614,7 @@ def configure(
         redis_health_check_interval=redis_health_check_interval,
         redis_socket_timeout=redis_socket_timeout,
         redis_retry_count=redis_retry_count,
+        redis_stats_batch=redis_stats_batch,
         fail_open=fail_open,
         cache_deadline=cache_deadline,
         on_lock_timeout=on_lock_timeout,
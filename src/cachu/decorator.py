@@ -13,7 +13,7 @@ from .backends.redis import _CURRSIZE_LOCK_PREFIX, RedisBackend
 from .config import VALID_BACKENDS, _get_caller_package, get_config
 from .config import is_disabled
 from .exception import CacheLockTimeout
-from .manager import manager
+from .manager import RegionHandle, manager
 from .util import _is_connection_like, _normalize_tag, _predicate_arity
 from .util import _seconds_to_region_name, make_key_generator
 from .util import make_partial_pattern, mangle_key, validate_entry
@@ -304,6 +304,7 @@ def cache(
             package=resolved_package,
             key_generator=key_generator,
         )
+        region = RegionHandle(resolved_package, resolved_backend, ttl_for_backend)
 
         if is_async:
             @wraps(fn)
@@ -314,7 +315,7 @@ def cache(
                 if skip_cache or is_disabled(resolved_package, tag):
                     return await fn(*args, **kwargs)
 
-                cfg = get_config(resolved_package)
+                cfg = region.config()
                 fail_open = cfg.fail_open
                 deadline = cfg.cache_deadline
                 started = time.monotonic() if deadline is not None else None
@@ -367,7 +368,8 @@ def cache(
                 acquired = False
                 lock_faulted = False
                 lock_attempted = False
-                if mutex is not None and not _budget_spent(started, deadline):
+                if (mutex is not None and not mutex._is_noop
+                        and not _budget_spent(started, deadline)):
                     lock_attempted = True
                     lock_started = time.monotonic()
                     try:
@@ -441,6 +443,7 @@ def cache(
 
             async_wrapper._cache_meta = meta
             async_wrapper._cache_key_generator = key_generator
+            async_wrapper._cache_backend = region
             _attach_helpers(async_wrapper, key_generator, resolved_package,
                             resolved_backend, ttl_for_backend, is_async=True,
                             original_fn=fn, fn_name=fn_name, tag=tag,
@@ -456,7 +459,7 @@ def cache(
                 if skip_cache or is_disabled(resolved_package, tag):
                     return fn(*args, **kwargs)
 
-                cfg = get_config(resolved_package)
+                cfg = region.config()
                 fail_open = cfg.fail_open
                 deadline = cfg.cache_deadline
                 started = time.monotonic() if deadline is not None else None
@@ -506,7 +509,8 @@ def cache(
                 acquired = False
                 lock_faulted = False
                 lock_attempted = False
-                if mutex is not None and not _budget_spent(started, deadline):
+                if (mutex is not None and not mutex._is_noop
+                        and not _budget_spent(started, deadline)):
                     lock_attempted = True
                     lock_started = time.monotonic()
                     try:
@@ -580,6 +584,7 @@ def cache(
 
             sync_wrapper._cache_meta = meta
             sync_wrapper._cache_key_generator = key_generator
+            sync_wrapper._cache_backend = region
             _attach_helpers(sync_wrapper, key_generator, resolved_package,
                             resolved_backend, ttl_for_backend, is_async=False,
                             original_fn=fn, fn_name=fn_name, tag=tag,
@@ -893,8 +898,17 @@ def _attach_helpers(
     exclude: set[str] | None = None,
 ) -> None:
     """Attach helper methods to wrapper (.clear, .refresh, .get, .set, .original).
+
+    Notes
+    -----
+    - The helpers resolve their backend through the wrapper's memoized
+      `RegionHandle` rather than the manager, so a hot invalidate/refresh
+      loop pays the manager lock once per `clear_backends`, not per call.
+      The package config is memoized on the same handle, so `key_prefix`
+      costs an attribute read rather than a registry lookup.
     """
     exclude = exclude or frozenset()
+    region = wrapper._cache_backend
     if is_async:
         async def clear(_global: bool = False, **kwargs: Any) -> int:
             filtered = {
@@ -908,8 +922,8 @@ def _attach_helpers(
                 logger.warning(
                     f'{fn_name}.clear(): all kwargs were excluded from '
                     f'cache key ({", ".join(kwargs)}); clearing all entries')
-            backend = await manager.aget_backend(resolved_package, resolved_backend, ttl)
-            cfg = get_config(resolved_package)
+            backend = region.get()
+            cfg = region.config()
             pattern = make_partial_pattern(
                 fn_name, tag, cfg.key_prefix, ttl,
                 global_clear=_global, **filtered)
@@ -920,8 +934,8 @@ def _attach_helpers(
             return await wrapper(**kwargs)
 
         async def get(default: Any = _MISSING, **kwargs: Any) -> Any:
-            backend = await manager.aget_backend(resolved_package, resolved_backend, ttl)
-            cfg = get_config(resolved_package)
+            backend = region.get()
+            cfg = region.config()
             base_key, _ = key_generator(**kwargs)
             cache_key = mangle_key(base_key, cfg.key_prefix, ttl)
             value = await backend.aget(cache_key)
@@ -932,8 +946,8 @@ def _attach_helpers(
             return value
 
         async def set(value: Any, **kwargs: Any) -> None:
-            backend = await manager.aget_backend(resolved_package, resolved_backend, ttl)
-            cfg = get_config(resolved_package)
+            backend = region.get()
+            cfg = region.config()
             base_key, _ = key_generator(**kwargs)
             cache_key = mangle_key(base_key, cfg.key_prefix, ttl)
             await backend.aset(cache_key, value, ttl)
@@ -959,8 +973,8 @@ def _attach_helpers(
                 logger.warning(
                     f'{fn_name}.clear(): all kwargs were excluded from '
                     f'cache key ({", ".join(kwargs)}); clearing all entries')
-            backend = manager.get_backend(resolved_package, resolved_backend, ttl)
-            cfg = get_config(resolved_package)
+            backend = region.get()
+            cfg = region.config()
             pattern = make_partial_pattern(
                 fn_name, tag, cfg.key_prefix, ttl,
                 global_clear=_global, **filtered)
@@ -971,8 +985,8 @@ def _attach_helpers(
             return wrapper(**kwargs)
 
         def get(default: Any = _MISSING, **kwargs: Any) -> Any:
-            backend = manager.get_backend(resolved_package, resolved_backend, ttl)
-            cfg = get_config(resolved_package)
+            backend = region.get()
+            cfg = region.config()
             base_key, _ = key_generator(**kwargs)
             cache_key = mangle_key(base_key, cfg.key_prefix, ttl)
             value = backend.get(cache_key)
@@ -983,8 +997,8 @@ def _attach_helpers(
             return value
 
         def set(value: Any, **kwargs: Any) -> None:
-            backend = manager.get_backend(resolved_package, resolved_backend, ttl)
-            cfg = get_config(resolved_package)
+            backend = region.get()
+            cfg = region.config()
             base_key, _ = key_generator(**kwargs)
             cache_key = mangle_key(base_key, cfg.key_prefix, ttl)
             backend.set(cache_key, value, ttl)
@@ -3,12 +3,12 @@
 import logging
 import os
 import threading
-from collections.abc import AsyncIterator, Iterator
+from collections.abc import AsyncIterator, Collection, Iterator
 
 from .api import Backend
 from .backends.memory import MemoryBackend
 from .backends.sqlite import SqliteBackend
-from .config import CacheConfig, _get_caller_package, get_config
+from .config import CacheConfig, _get_caller_package, _registry, get_config
 from .exception import BackendNotFoundError
 from .util import _normalize_tag
 
@@ -66,6 +66,7 @@ class CacheManager:
         self.backends: dict[tuple[str | None, str, int], Backend] = {}
         self._regions: dict[tuple[str | None, str, int], set[str]] = {}
         self._lock = threading.RLock()
+        self.generation = 0
 
     # Notes:
     # - One reentrant lock guards `backends` and `_regions` for both the
@@ -121,6 +122,7 @@ class CacheManager:
                 cfg.redis_health_check_interval,
                 cfg.redis_socket_timeout,
                 cfg.redis_retry_count,
+                cfg.redis_stats_batch,
             )
         elif backend_type == 'null':
             from .backends.null import NullBackend
@@ -180,7 +182,7 @@ class CacheManager:
     def get_regions(
         self,
         package: str | None,
-        backend_types: list[str] | None = None,
+        backend_types: Collection[str] | None = None,
         ttl: int | None = None,
         tag: str | None = None,
     ) -> set[tuple[str | None, str, int]]:
@@ -190,7 +192,7 @@ class CacheManager:
         ----------
         package : str or None
             Owning package to match exactly.
-        backend_types : list of str or None, default None
+        backend_types : collection of str or None, default None
             Backend names to keep; all of them if None or empty.
         ttl : int or None, default None
             TTL region to keep; all of them if None.
@@ -243,7 +245,7 @@ class CacheManager:
     def materialize(
         self,
         package: str | None,
-        backend_types: list[str] | None = None,
+        backend_types: Collection[str] | None = None,
         ttl: int | None = None,
         tag: str | None = None,
     ) -> int:
@@ -253,7 +255,7 @@ class CacheManager:
         ----------
         package : str or None
             Owning package to match exactly.
-        backend_types : list of str or None, default None
+        backend_types : collection of str or None, default None
             Backend names to build; all of them if None or empty.
         ttl : int or None, default None
             TTL region to build; all of them if None.
@@ -286,7 +288,7 @@ class CacheManager:
     async def amaterialize(
         self,
         package: str | None,
-        backend_types: list[str] | None = None,
+        backend_types: Collection[str] | None = None,
         ttl: int | None = None,
         tag: str | None = None,
     ) -> int:
@@ -365,7 +367,7 @@ class CacheManager:
     def iter_backends(
         self,
         package: str | None,
-        backend_types: list[str] | None = None,
+        backend_types: Collection[str] | None = None,
         ttl: int | None = None,
         tag: str | None = None,
     ) -> Iterator[tuple[tuple[str | None, str, int], Backend]]:
@@ -376,7 +378,7 @@ class CacheManager:
     async def aiter_backends(
         self,
         package: str | None,
-        backend_types: list[str] | None = None,
+        backend_types: Collection[str] | None = None,
         ttl: int | None = None,
         tag: str | None = None,
     ) -> AsyncIterator[tuple[tuple[str | None, str, int], Backend]]:
@@ -388,7 +390,7 @@ class CacheManager:
     def _matching(
         self,
         package: str | None,
-        backend_types: list[str] | None = None,
+        backend_types: Collection[str] | None = None,
         ttl: int | None = None,
         tag: str | None = None,
     ) -> list[tuple[tuple[str | None, str, int], Backend]]:
@@ -427,18 +429,85 @@ class CacheManager:
           `SqliteBackend.close` join a helper thread for up to 5 s, and
           holding the lock across that would stall every coroutine and
           thread that touches the cache.
+        - Bumps `generation` so every `RegionHandle` drops the instances it
+          memoized; a detached backend is about to be closed.
         """
         with self._lock:
             keys = [
                 key for key in self.backends
                 if package is None or key[0] == package
             ]
+            self.generation += 1
             return [self.backends.pop(key) for key in keys]
 
 
 manager = CacheManager()
 
 
+class RegionHandle:
+    """Memo of the backend one decorated function's region resolves to.
+
+    Parameters
+    ----------
+    package : str or None
+        Owning package of the region.
+    backend_type : str
+        One of VALID_BACKENDS.
+    ttl : int
+        TTL region identifier (-1 for dynamic TTL).
+
+    Notes
+    -----
+    - Attached by @cache so the CRUD helpers (`cache_get`, `.set()`, ...)
+      skip the manager's lock and dict lookup on every call after the first.
+    - Validated against `manager.generation`, which `clear_backends` bumps,
+      so a memoized instance never outlives its registration. The
+      generation is read BEFORE resolving: a detach racing the resolve then
+      leaves a stale generation behind and the next call resolves again,
+      never the reverse.
+    - The package's `CacheConfig` is memoized the same way against the
+      config registry's `version`. The object is memoized, not its fields,
+      so `key_prefix` and friends still read live on every call.
+    - A handle with no package is never memoized: `get_config(None)`
+      resolves the calling package on every call, and caching the first
+      answer would serve it to callers from other packages.
+    """
+
+    __slots__ = ('_key', '_backend', '_generation', '_config', '_config_version')
+
+    def __init__(self, package: str | None, backend_type: str, ttl: int) -> None:
+        self._key = (package, backend_type, ttl)
+        self._backend: Backend | None = None
+        self._generation = -1
+        self._config: CacheConfig | None = None
+        self._config_version = -1
+
+    def get(self) -> Backend:
+        """Return the region's backend, resolving it through the manager when stale.
+        """
+        generation = manager.generation
+        backend = self._backend
+        if backend is None or self._generation != generation:
+            backend = manager.get_backend(*self._key)
+            self._backend = backend
+            self._generation = generation
+        return backend
+
+    def config(self) -> CacheConfig:
+        """Return the region's package config, re-reading it after any reconfigure.
+        """
+        package = self._key[0]
+        if package is None:
+            return get_config(None)
+        version = _registry.version
+        cfg = self._config
+        if cfg is None or self._config_version != version:
+            cfg = get_config(package)
+            self._config = cfg
+            self._config_version = version
+        return cfg
+
+
 def get_backend(
     backend_type: str | None = None,
     package: str | None = None,
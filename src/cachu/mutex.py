@@ -1,23 +1,59 @@
 """Mutex implementations for cache dogpile prevention.
 """
 import asyncio
+import logging
+import os
 import threading
 import time
-import uuid
 import weakref
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, ClassVar, Self
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, ClassVar, Self
 
 if TYPE_CHECKING:
     import redis
     import redis.asyncio as aioredis
 
+logger = logging.getLogger(__name__)
+
 _MIN_WAIT = 0.001
+_POOL_MAX = 20
+_POLL_INTERVAL = 0.05
+_RELEASE_WAIT_INTERVAL = 0.5
+
+# Notes:
+# - Shared by both Redis mutexes. The release announces itself on a pub/sub
+#   channel named after the lock key (channels and keys are separate
+#   namespaces), so waiters wake on the release instead of on a poll tick.
+_REDIS_RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    redis.call("del", KEYS[1])
+    redis.call("publish", KEYS[1], "released")
+    return 1
+end
+return 0
+"""
+
+
+@dataclass(slots=True)
+class _LockEntry:
+    """One key's lock and the number of mutexes waiting on or holding it.
+    """
+    lock: Any
+    pending: int = 0
 
 
 class CacheMutex(ABC):
     """Abstract base class for synchronous cache mutexes.
+
+    Notes
+    -----
+    - `_is_noop` marks a mutex whose acquire/release do nothing, so the
+      decorator can skip the lock calls outright rather than pay for them.
+    - Every mutex declares `__slots__`: one is built per cache miss.
     """
+    __slots__ = ()
+    _is_noop: ClassVar[bool] = False
 
     @abstractmethod
     def acquire(self, timeout: float | None = None) -> bool:
@@ -39,7 +75,13 @@ class CacheMutex(ABC):
 
 class AsyncCacheMutex(ABC):
     """Abstract base class for asynchronous cache mutexes.
+
+    Notes
+    -----
+    - `_is_noop` and `__slots__` as in `CacheMutex`.
     """
+    __slots__ = ()
+    _is_noop: ClassVar[bool] = False
 
     @abstractmethod
     async def acquire(self, timeout: float | None = None) -> bool:
@@ -62,6 +104,8 @@ class AsyncCacheMutex(ABC):
 class NullMutex(CacheMutex):
     """No-op mutex for testing or when locking is not needed.
     """
+    __slots__ = ()
+    _is_noop: ClassVar[bool] = True
 
     def acquire(self, timeout: float | None = None) -> bool:
         return True
@@ -73,6 +117,8 @@ class NullMutex(CacheMutex):
 class NullAsyncMutex(AsyncCacheMutex):
     """No-op async mutex for testing or when locking is not needed.
     """
+    __slots__ = ()
+    _is_noop: ClassVar[bool] = True
 
     async def acquire(self, timeout: float | None = None) -> bool:
         return True
@@ -86,47 +132,84 @@ class ThreadingMutex(CacheMutex):
 
     Notes
     -----
-    - The registry holds locks weakly, so an entry disappears once no live
-      mutex references it. A strong dict grew one entry per distinct cache
-      key and never shrank, which reintroduced the unbounded per-key growth
-      that `memory_maxsize` exists to stop: 200,000 caller-supplied keys
-      cost tens of megabytes of locks whatever bound the cache itself had.
-    - Every mutex that needs a key keeps a strong reference for its whole
-      lifetime, so two callers contending on one key still share one lock;
-      only genuinely unused entries are collected.
+    - The registry is reference counted. A key is registered when a mutex
+      starts to acquire and removed when the last waiter or holder is done,
+      so the registry holds only keys in use. A registry that kept every
+      key grew one lock per distinct cache key, which reintroduced the
+      unbounded per-key growth that `memory_maxsize` exists to stop.
+    - Lookup-and-increment and decrement-and-delete each happen under the
+      registry lock. Removing an entry outside it would let a caller that
+      just looked the key up keep the old lock while the next caller
+      creates a new one, and the two would no longer exclude each other.
+    - A removed key's lock is pooled, up to `_POOL_MAX` spares, and handed
+      to the next new key instead of allocating another.
     """
-    _locks: ClassVar['weakref.WeakValueDictionary[str, threading.Lock]'] = (
-        weakref.WeakValueDictionary())
+    __slots__ = ('_key', '_acquired', '_lock', '_entry')
+    _locks: ClassVar[dict[str, _LockEntry]] = {}
+    _pool: ClassVar[list[threading.Lock]] = []
     _registry_lock: ClassVar[threading.Lock] = threading.Lock()
 
     def __init__(self, key: str) -> None:
         self._key = key
         self._acquired = False
+        self._lock: threading.Lock | None = None
+        self._entry: _LockEntry | None = None
+
+    def _resolve_lock(self) -> threading.Lock:
+        """Register on this key's lock and return it.
+        """
+        with self._registry_lock:
+            entry = self._locks.get(self._key)
+            if entry is None:
+                entry = _LockEntry(self._pool.pop() if self._pool else threading.Lock())
+                self._locks[self._key] = entry
+            entry.pending += 1
+            self._entry = entry
+            return entry.lock
+
+    def _release_entry(self) -> None:
+        """Drop this mutex's registration, recycling the lock once nobody uses it.
+        """
+        entry = self._entry
+        if entry is None:
+            return
+        self._entry = None
         with self._registry_lock:
-            lock = self._locks.get(key)
-            if lock is None:
-                lock = threading.Lock()
-                self._locks[key] = lock
-            self._lock = lock
+            entry.pending -= 1
+            if entry.pending > 0:
+                return
+            if self._locks.get(self._key) is entry:
+                del self._locks[self._key]
+            if len(self._pool) < _POOL_MAX and not entry.lock.locked():
+                self._pool.append(entry.lock)
 
     def acquire(self, timeout: float | None = None) -> bool:
-        if timeout is None:
-            self._acquired = self._lock.acquire()
-        else:
-            self._acquired = self._lock.acquire(timeout=timeout)
+        self._lock = self._resolve_lock()
+        try:
+            if timeout is None:
+                self._acquired = self._lock.acquire()
+            else:
+                self._acquired = self._lock.acquire(timeout=timeout)
+        except BaseException:
+            self._release_entry()
+            raise
+        if not self._acquired:
+            self._release_entry()
         return self._acquired
 
     def release(self) -> None:
-        if self._acquired:
+        if self._acquired and self._lock is not None:
             self._lock.release()
             self._acquired = False
+            self._release_entry()
 
     @classmethod
     def clear_locks(cls) -> None:
-        """Clear all locks. For testing only.
+        """Clear all locks and pooled spares. For testing only.
         """
         with cls._registry_lock:
             cls._locks.clear()
+            cls._pool.clear()
 
 
 class AsyncioMutex(AsyncCacheMutex):
@@ -134,17 +217,25 @@ class AsyncioMutex(AsyncCacheMutex):
 
     Notes
     -----
-    - The outer registry is keyed weakly by event loop and the inner one
-      weakly by lock, so neither a finished loop nor an idle key is
-      retained. A strong inner dict grew one entry per distinct cache key
-      for the life of the loop, defeating `memory_maxsize` for exactly the
-      caller-influenced key spaces it is meant to bound.
-    - A mutex holds its lock strongly from `acquire` until it is discarded,
-      so contending callers still share one lock per key.
+    - The outer registries are keyed weakly by event loop, so a finished
+      loop is not retained. The inner registry is reference counted: a key
+      is registered when a mutex starts to acquire and dropped the moment
+      the last waiter or holder is done with it, so an idle key costs
+      nothing and contending callers still share one lock.
+    - A dropped key's lock goes back to a per-loop pool of at most
+      `_POOL_MAX` spares and is handed to the next new key, so a workload
+      with high key cardinality allocates O(pool size) locks rather than
+      one per distinct key. The pool is per loop because an asyncio.Lock
+      binds to the first loop that waits on it.
+    - A lock is only pooled when it is free. One that a cancelled
+      `wait_for` left held is discarded rather than handed to a new key.
     """
+    __slots__ = ('_key', '_acquired', '_lock', '_entry', '_loop')
     _loop_locks: ClassVar[
-        'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, '
-        'weakref.WeakValueDictionary[str, asyncio.Lock]]'
+        'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, _LockEntry]]'
+    ] = weakref.WeakKeyDictionary()
+    _loop_pools: ClassVar[
+        'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, list[asyncio.Lock]]'
     ] = weakref.WeakKeyDictionary()
     _registry_lock: ClassVar[threading.Lock] = threading.Lock()
 
@@ -152,21 +243,49 @@ class AsyncioMutex(AsyncCacheMutex):
         self._key = key
         self._acquired = False
         self._lock: asyncio.Lock | None = None
+        self._entry: _LockEntry | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
 
     def _resolve_lock(self) -> asyncio.Lock:
-        """Return the lock for this key on the currently running event loop.
+        """Register on this key's lock for the running event loop and return it.
         """
         loop = asyncio.get_running_loop()
         with self._registry_lock:
             per_loop = self._loop_locks.get(loop)
             if per_loop is None:
-                per_loop = weakref.WeakValueDictionary()
+                per_loop = {}
                 self._loop_locks[loop] = per_loop
-            lock = per_loop.get(self._key)
-            if lock is None:
-                lock = asyncio.Lock()
-                per_loop[self._key] = lock
-            return lock
+            entry = per_loop.get(self._key)
+            if entry is None:
+                pool = self._loop_pools.get(loop)
+                entry = _LockEntry(pool.pop() if pool else asyncio.Lock())
+                per_loop[self._key] = entry
+            entry.pending += 1
+            self._entry = entry
+            self._loop = loop
+            return entry.lock
+
+    def _release_entry(self) -> None:
+        """Drop this mutex's registration, recycling the lock once nobody uses it.
+        """
+        entry, loop = self._entry, self._loop
+        if entry is None or loop is None:
+            return
+        self._entry = None
+        self._loop = None
+        with self._registry_lock:
+            entry.pending -= 1
+            if entry.pending > 0:
+                return
+            per_loop = self._loop_locks.get(loop)
+            if per_loop is not None and per_loop.get(self._key) is entry:
+                del per_loop[self._key]
+            pool = self._loop_pools.get(loop)
+            if pool is None:
+                pool = []
+                self._loop_pools[loop] = pool
+            if len(pool) < _POOL_MAX and not entry.lock.locked():
+                pool.append(entry.lock)
 
     async def acquire(self, timeout: float | None = None) -> bool:
         """Acquire the per-loop lock, waiting at most `timeout` seconds.
@@ -185,43 +304,64 @@ class AsyncioMutex(AsyncCacheMutex):
           section.
         - The floor is small enough to be indistinguishable from "try once"
           and bounded, which is the property the caller actually needs.
+        - A wait that times out or is cancelled gives its registration back
+          before returning, so only a holder keeps the key registered.
         """
         self._lock = self._resolve_lock()
-        if timeout is None:
-            await self._lock.acquire()
-            self._acquired = True
-            return True
-
         try:
-            await asyncio.wait_for(
-                self._lock.acquire(), timeout=max(timeout, _MIN_WAIT))
-            self._acquired = True
-            return True
+            if timeout is None:
+                await self._lock.acquire()
+            else:
+                await asyncio.wait_for(
+                    self._lock.acquire(), timeout=max(timeout, _MIN_WAIT))
         except asyncio.TimeoutError:
+            self._release_entry()
             return False
+        except BaseException:
+            self._release_entry()
+            raise
+        self._acquired = True
+        return True
 
     async def release(self) -> None:
         if self._acquired and self._lock is not None:
             self._lock.release()
             self._acquired = False
+            self._release_entry()
 
     @classmethod
     def clear_locks(cls) -> None:
-        """Clear all locks. For testing only.
+        """Clear all locks and pooled spares. For testing only.
         """
         with cls._registry_lock:
             cls._loop_locks.clear()
+            cls._loop_pools.clear()
+
+
+def _close_pubsub(pubsub: Any) -> None:
+    """Close a waiter's pub/sub connection, never raising.
+    """
+    try:
+        pubsub.close()
+    except Exception:
+        logger.debug('Closing release channel failed', exc_info=True)
+
+
+async def _aclose_pubsub(pubsub: Any) -> None:
+    """Async `_close_pubsub`; `aclose` where redis-py has it (5.0.1+).
+    """
+    try:
+        close = getattr(pubsub, 'aclose', None) or pubsub.close
+        await close()
+    except Exception:
+        logger.debug('Closing release channel failed', exc_info=True)
 
 
 class RedisMutex(CacheMutex):
     """Distributed lock using Redis SET NX EX.
     """
-    _RELEASE_SCRIPT = """
-    if redis.call("get", KEYS[1]) == ARGV[1] then
-        return redis.call("del", KEYS[1])
-    end
-    return 0
-    """
+    __slots__ = ('_client', '_key', '_lock_timeout', '_token', '_acquired')
+    _RELEASE_SCRIPT = _REDIS_RELEASE_SCRIPT
 
     def __init__(
         self,
@@ -232,11 +372,36 @@ class RedisMutex(CacheMutex):
         self._client = client
         self._key = key
         self._lock_timeout = lock_timeout
-        self._token = str(uuid.uuid4())
+        self._token = os.urandom(16).hex()
         self._acquired = False
 
+    def _try_set(self) -> bool:
+        """Make one SET NX attempt, recording a win.
+        """
+        if self._client.set(
+            self._key,
+            self._token,
+            nx=True,
+            ex=max(1, round(self._lock_timeout)),
+        ):
+            self._acquired = True
+            return True
+        return False
+
+    def _subscribe(self) -> Any:
+        """Subscribe to this lock's release channel, or None to poll instead.
+        """
+        try:
+            pubsub = self._client.pubsub()
+            pubsub.subscribe(self._key)
+        except Exception:
+            logger.debug(f'Release channel unavailable for {self._key!r}; '
+                         f'polling', exc_info=True)
+            return None
+        return pubsub
+
     def acquire(self, timeout: float | None = None) -> bool:
-        """Poll SET NX until acquired or `timeout` seconds elapse.
+        """Retry SET NX on each release until acquired or `timeout` elapses.
 
         Notes
         -----
@@ -244,25 +409,52 @@ class RedisMutex(CacheMutex):
           threading.Lock.acquire(timeout=0). Only None falls back to the
           configured lock_timeout - a falsy-check here would have turned an
           explicit 0 into a full-length wait.
+        - A waiter subscribes to the lock's release channel and retries when
+          the holder's release publishes, so it wakes on the release rather
+          than up to a poll interval later, and sends no SET per tick. The
+          first message read is the SUBSCRIBE confirmation; the retry that
+          follows it covers a release that landed before the subscription.
+        - While subscribed the retry still runs every 0.5 s, for a holder
+          whose lock expired instead of being released.
+        - Where pub/sub is unavailable (a proxy that rejects SUBSCRIBE, or
+          the connection fails mid-wait) the waiter falls back to a 50 ms
+          SET NX poll.
         - Each poll iteration pays a full socket budget, so against an
           unreachable endpoint the wall time is driven by the socket
-          timeouts, not by the 50 ms sleep.
+          timeouts, not by the sleep.
+        - Every wait is clamped to what is left of the budget, so the final
+          attempt lands on the deadline instead of up to one interval past
+          it.
         """
         if timeout is None:
             timeout = self._lock_timeout
-        end = time.monotonic() + timeout
-        while True:
-            if self._client.set(
-                self._key,
-                self._token,
-                nx=True,
-                ex=max(1, round(self._lock_timeout)),
-            ):
-                self._acquired = True
-                return True
-            if not time.monotonic() < end:
-                return False
-            time.sleep(0.05)
+        deadline = time.monotonic() + timeout
+        if self._try_set():
+            return True
+        if deadline - time.monotonic() <= 0:
+            return False
+        pubsub = self._subscribe()
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                if pubsub is None:
+                    time.sleep(min(_POLL_INTERVAL, remaining))
+                else:
+                    try:
+                        pubsub.get_message(
+                            timeout=min(_RELEASE_WAIT_INTERVAL, remaining))
+                    except Exception:
+                        logger.debug(f'Release channel lost for {self._key!r}; '
+                                     f'polling', exc_info=True)
+                        _close_pubsub(pubsub)
+                        pubsub = None
+                if self._try_set():
+                    return True
+        finally:
+            if pubsub is not None:
+                _close_pubsub(pubsub)
 
     def release(self) -> None:
         if self._acquired:
@@ -273,12 +465,8 @@ class RedisMutex(CacheMutex):
 class AsyncRedisMutex(AsyncCacheMutex):
     """Async distributed lock using redis.asyncio.
     """
-    _RELEASE_SCRIPT = """
-    if redis.call("get", KEYS[1]) == ARGV[1] then
-        return redis.call("del", KEYS[1])
-    end
-    return 0
-    """
+    __slots__ = ('_client', '_key', '_lock_timeout', '_token', '_acquired')
+    _RELEASE_SCRIPT = _REDIS_RELEASE_SCRIPT
 
     def __init__(
         self,
@@ -289,32 +477,77 @@ class AsyncRedisMutex(AsyncCacheMutex):
         self._client = client
         self._key = key
         self._lock_timeout = lock_timeout
-        self._token = str(uuid.uuid4())
+        self._token = os.urandom(16).hex()
         self._acquired = False
 
+    async def _try_set(self) -> bool:
+        """Make one SET NX attempt, recording a win.
+        """
+        if await self._client.set(
+            self._key,
+            self._token,
+            nx=True,
+            ex=max(1, round(self._lock_timeout)),
+        ):
+            self._acquired = True
+            return True
+        return False
+
+    async def _subscribe(self) -> Any:
+        """Subscribe to this lock's release channel, or None to poll instead.
+        """
+        try:
+            pubsub = self._client.pubsub()
+            await pubsub.subscribe(self._key)
+        except Exception:
+            logger.debug(f'Release channel unavailable for {self._key!r}; '
+                         f'polling', exc_info=True)
+            return None
+        return pubsub
+
     async def acquire(self, timeout: float | None = None) -> bool:
-        """Poll SET NX until acquired or `timeout` seconds elapse.
+        """Retry SET NX on each release until acquired or `timeout` elapses.
 
         Notes
         -----
+        - Waits on the release channel with the same fallbacks as the sync
+          `RedisMutex.acquire`.
         - A timeout of 0 makes exactly one attempt and returns; only None
           falls back to the configured lock_timeout.
+        - Timed on the running loop's monotonic clock, the same one
+          `asyncio.sleep` is scheduled on, and every wait is clamped to the
+          budget left exactly as in the sync mutex.
         """
         if timeout is None:
             timeout = self._lock_timeout
-        end = time.monotonic() + timeout
-        while True:
-            if await self._client.set(
-                self._key,
-                self._token,
-                nx=True,
-                ex=max(1, round(self._lock_timeout)),
-            ):
-                self._acquired = True
-                return True
-            if not time.monotonic() < end:
-                return False
-            await asyncio.sleep(0.05)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        if await self._try_set():
+            return True
+        if deadline - loop.time() <= 0:
+            return False
+        pubsub = await self._subscribe()
+        try:
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return False
+                if pubsub is None:
+                    await asyncio.sleep(min(_POLL_INTERVAL, remaining))
+                else:
+                    try:
+                        await pubsub.get_message(
+                            timeout=min(_RELEASE_WAIT_INTERVAL, remaining))
+                    except Exception:
+                        logger.debug(f'Release channel lost for {self._key!r}; '
+                                     f'polling', exc_info=True)
+                        await _aclose_pubsub(pubsub)
+                        pubsub = None
+                if await self._try_set():
+                    return True
+        finally:
+            if pubsub is not None:
+                await _aclose_pubsub(pubsub)
 
     async def release(self) -> None:
         if self._acquired:
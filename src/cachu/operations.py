@@ -4,7 +4,7 @@ import logging
 from collections.abc import Callable
 from typing import Any
 
-from .api import NO_VALUE, CacheInfo, CacheMeta
+from .api import NO_VALUE, Backend, CacheInfo, CacheMeta
 from .config import VALID_BACKENDS, _get_caller_package, get_config
 from .decorator import get_async_cache_info, get_cache_info
 from .manager import manager
@@ -13,6 +13,7 @@ from .util import _normalize_tag, make_clear_pattern, mangle_key
 logger = logging.getLogger(__name__)
 
 _MISSING = object()
+_ALL_BACKENDS = frozenset(VALID_BACKENDS)
 
 
 def _get_meta(fn: Callable[..., Any], decorator_name: str = '@cache') -> CacheMeta:
@@ -24,11 +25,35 @@ def _get_meta(fn: Callable[..., Any], decorator_name: str = '@cache') -> CacheMe
     return meta
 
 
+def _resolve_entries(
+    fn: Callable[..., Any],
+    kwargs_list: list[dict[str, Any]],
+) -> tuple[CacheMeta, list[str], Backend]:
+    """Resolve the metadata, full backend keys and backend a CRUD helper addresses.
+
+    Notes
+    -----
+    - Shared by every sync and async CRUD helper, single-key and batch, so
+      the lookup chain lives in one place. `key_prefix` is read once per
+      call, not once per key, and both it and the backend come from the
+      function's memoized `RegionHandle`.
+    """
+    meta = _get_meta(fn)
+    region = fn._cache_backend
+    key_generator = fn._cache_key_generator
+    key_prefix = region.config().key_prefix
+    cache_keys = [
+        mangle_key(key_generator(**kwargs)[0], key_prefix, meta.ttl)
+        for kwargs in kwargs_list
+    ]
+    return meta, cache_keys, region.get()
+
+
 def _clear_targets(
     tag: str | None,
     backend: str | None,
     package: str | None,
-) -> tuple[str | None, list[str], str | None, str]:
+) -> tuple[str | None, frozenset[str], str | None, str]:
     """Resolve what a clear should act on, shared by the sync and async paths.
 
     Parameters
@@ -55,11 +80,14 @@ def _clear_targets(
       `key_prefix` configured, let it reach every key in the store.
     - An empty tag is normalized to None. `tag=''` is the decorator default,
       so treating it as a tag would narrow to regions that declared nothing.
+    - The backend names come back as a frozenset: the manager tests every
+      registered region against them, and the all-backends case reuses one
+      module-level set instead of building a list per call.
     """
     if package is None:
         package = _get_caller_package()
 
-    backend_types = [backend] if backend is not None else list(VALID_BACKENDS)
+    backend_types = frozenset((backend,)) if backend is not None else _ALL_BACKENDS
 
     return tag or None, backend_types, package, get_config(package).key_prefix
 
@@ -133,14 +161,7 @@ def cache_get(fn: Callable[..., Any], default: Any = _MISSING, **kwargs: Any) ->
         KeyError: If not found and no default provided
         ValueError: If function is not decorated with @cache
     """
-    meta = _get_meta(fn)
-    cfg = get_config(meta.package)
-
-    key_generator = fn._cache_key_generator
-    base_key, _ = key_generator(**kwargs)
-    cache_key = mangle_key(base_key, cfg.key_prefix, meta.ttl)
-
-    backend = manager.get_backend(meta.package, meta.backend, meta.ttl)
+    _, (cache_key,), backend = _resolve_entries(fn, [kwargs])
     value = backend.get(cache_key)
 
     if value is NO_VALUE:
@@ -162,14 +183,7 @@ def cache_set(fn: Callable[..., Any], value: Any, **kwargs: Any) -> None:
     Raises
         ValueError: If function is not decorated with @cache
     """
-    meta = _get_meta(fn)
-    cfg = get_config(meta.package)
-
-    key_generator = fn._cache_key_generator
-    base_key, _ = key_generator(**kwargs)
-    cache_key = mangle_key(base_key, cfg.key_prefix, meta.ttl)
-
-    backend = manager.get_backend(meta.package, meta.backend, meta.ttl)
+    meta, (cache_key,), backend = _resolve_entries(fn, [kwargs])
     backend.set(cache_key, value, meta.ttl)
 
     logger.debug(f'Set cache for {fn.__name__} with key {cache_key}')
@@ -185,19 +199,51 @@ def cache_delete(fn: Callable[..., Any], **kwargs: Any) -> None:
     Raises
         ValueError: If function is not decorated with @cache
     """
-    meta = _get_meta(fn)
-    cfg = get_config(meta.package)
-
-    key_generator = fn._cache_key_generator
-    base_key, _ = key_generator(**kwargs)
-    cache_key = mangle_key(base_key, cfg.key_prefix, meta.ttl)
-
-    backend = manager.get_backend(meta.package, meta.backend, meta.ttl)
+    _, (cache_key,), backend = _resolve_entries(fn, [kwargs])
     backend.delete(cache_key)
 
     logger.debug(f'Deleted cache for {fn.__name__} with key {cache_key}')
 
 
+def cache_get_many(
+    fn: Callable[..., Any],
+    kwargs_list: list[dict[str, Any]],
+    default: Any = None,
+) -> list[Any]:
+    """Get several cached values in one backend round trip.
+
+    Args:
+        fn: A function decorated with @cache
+        kwargs_list: One dict of function arguments per entry to fetch
+        default: Value to return for entries that are not cached
+
+    Returns
+        The cached values or default, in the order of kwargs_list
+
+    Raises
+        ValueError: If function is not decorated with @cache
+    """
+    _, cache_keys, backend = _resolve_entries(fn, kwargs_list)
+    values = backend.get_many(cache_keys)
+    return [default if value is NO_VALUE else value for value in values]
+
+
+def cache_delete_many(fn: Callable[..., Any], kwargs_list: list[dict[str, Any]]) -> None:
+    """Delete several cached entries in one backend round trip.
+
+    Args:
+        fn: A function decorated with @cache
+        kwargs_list: One dict of function arguments per entry to delete
+
+    Raises
+        ValueError: If function is not decorated with @cache
+    """
+    _, cache_keys, backend = _resolve_entries(fn, kwargs_list)
+    backend.delete_many(cache_keys)
+
+    logger.debug(f'Deleted {len(cache_keys)} cache entries for {fn.__name__}')
+
+
 def cache_clear(
     tag: str | None = None,
     backend: str | None = None,
@@ -271,7 +317,7 @@ def cache_clear(
         backend_instance.clear_stats()
         if cleared > 0:
             total_cleared += cleared
-            logger.debug(f'Cleared {cleared} entries from {backend} backend (ttl={ttl})')
+            logger.debug('Cleared %d entries from %s backend (ttl=%s)', cleared, backend, ttl)
         return total_cleared
 
     manager.materialize(package, backend_types, ttl, tag)
@@ -292,7 +338,7 @@ def cache_clear(
             continue
         if cleared > 0:
             total_cleared += cleared
-            logger.debug(f'Cleared {cleared} entries from {btype} backend (ttl={bttl})')
+            logger.debug('Cleared %d entries from %s backend (ttl=%s)', cleared, btype, bttl)
 
     if not targets:
         logger.warning(_no_region_message('cache_clear', package, backend, ttl, tag))
@@ -355,14 +401,7 @@ async def async_cache_get(
         KeyError: If not found and no default provided
         ValueError: If function is not decorated with @cache
     """
-    meta = _get_meta(fn, '@cache')
-    cfg = get_config(meta.package)
-
-    key_generator = fn._cache_key_generator
-    base_key, _ = key_generator(**kwargs)
-    cache_key = mangle_key(base_key, cfg.key_prefix, meta.ttl)
-
-    backend = await manager.aget_backend(meta.package, meta.backend, meta.ttl)
+    _, (cache_key,), backend = _resolve_entries(fn, [kwargs])
     value = await backend.aget(cache_key)
 
     if value is NO_VALUE:
@@ -384,14 +423,7 @@ async def async_cache_set(fn: Callable[..., Any], value: Any, **kwargs: Any) ->
     Raises
         ValueError: If function is not decorated with @cache
     """
-    meta = _get_meta(fn, '@cache')
-    cfg = get_config(meta.package)
-
-    key_generator = fn._cache_key_generator
-    base_key, _ = key_generator(**kwargs)
-    cache_key = mangle_key(base_key, cfg.key_prefix, meta.ttl)
-
-    backend = await manager.aget_backend(meta.package, meta.backend, meta.ttl)
+    meta, (cache_key,), backend = _resolve_entries(fn, [kwargs])
     await backend.aset(cache_key, value, meta.ttl)
 
     logger.debug(f'Set cache for {fn.__name__} with key {cache_key}')
@@ -407,19 +439,54 @@ async def async_cache_delete(fn: Callable[..., Any], **kwargs: Any) -> None:
     Raises
         ValueError: If function is not decorated with @cache
     """
-    meta = _get_meta(fn, '@cache')
-    cfg = get_config(meta.package)
-
-    key_generator = fn._cache_key_generator
-    base_key, _ = key_generator(**kwargs)
-    cache_key = mangle_key(base_key, cfg.key_prefix, meta.ttl)
-
-    backend = await manager.aget_backend(meta.package, meta.backend, meta.ttl)
+    _, (cache_key,), backend = _resolve_entries(fn, [kwargs])
     await backend.adelete(cache_key)
 
     logger.debug(f'Deleted cache for {fn.__name__} with key {cache_key}')
 
 
+async def async_cache_get_many(
+    fn: Callable[..., Any],
+    kwargs_list: list[dict[str, Any]],
+    default: Any = None,
+) -> list[Any]:
+    """Get several cached values in one backend round trip.
+
+    Args:
+        fn: A function decorated with @cache
+        kwargs_list: One dict of function arguments per entry to fetch
+        default: Value to return for entries that are not cached
+
+    Returns
+        The cached values or default, in the order of kwargs_list
+
+    Raises
+        ValueError: If function is not decorated with @cache
+    """
+    _, cache_keys, backend = _resolve_entries(fn, kwargs_list)
+    values = await backend.aget_many(cache_keys)
+    return [default if value is NO_VALUE else value for value in values]
+
+
+async def async_cache_delete_many(
+    fn: Callable[..., Any],
+    kwargs_list: list[dict[str, Any]],
+) -> None:
+    """Delete several cached entries in one backend round trip.
+
+    Args:
+        fn: A function decorated with @cache
+        kwargs_list: One dict of function arguments per entry to delete
+
+    Raises
+        ValueError: If function is not decorated with @cache
+    """
+    _, cache_keys, backend = _resolve_entries(fn, kwargs_list)
+    await backend.adelete_many(cache_keys)
+
+    logger.debug(f'Deleted {len(cache_keys)} cache entries for {fn.__name__}')
+
+
 async def async_cache_clear(
     tag: str | None = None,
     backend: str | None = None,
@@ -469,7 +536,7 @@ async def async_cache_clear(
         await backend_instance.aclear_stats()
         if cleared > 0:
             total_cleared += cleared
-            logger.debug(f'Cleared {cleared} entries from {backend} backend (ttl={ttl})')
+            logger.debug('Cleared %d entries from %s backend (ttl=%s)', cleared, backend, ttl)
         return total_cleared
 
     await manager.amaterialize(package, backend_types, ttl, tag)
@@ -496,7 +563,7 @@ async def async_cache_clear(
             continue
         if cleared > 0:
             total_cleared += cleared
-            logger.debug(f'Cleared {cleared} entries from {btype} backend (ttl={bttl})')
+            logger.debug('Cleared %d entries from %s backend (ttl=%s)', cleared, btype, bttl)
 
     if not targets:
         logger.warning(_no_region_message('async_cache_clear', package, backend, ttl, tag))
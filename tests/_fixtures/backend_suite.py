@@ -3,8 +3,12 @@
 Backend-specific test classes inherit from these suites to get comprehensive
 test coverage without code duplication. Follows dogpile.cache's testing pattern.
 """
+import asyncio
 import time
 from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
 from typing import Any
 
 import cachu
@@ -12,6 +16,29 @@ import pytest
 from cachu.api import NO_VALUE
 
 
+# Control paths applied to an entry warmed by func(5) == 5, for a function
+# returning x times its call count: (op, result, calls after op, next plain
+# call). The ops return awaitables for async functions, so both suites
+# share the table.
+_CONTROL_CASES = [
+    pytest.param(lambda f: f(5, _skip_cache=True), 10, 2, 5, id='skip_cache'),
+    pytest.param(lambda f: f(5, _overwrite_cache=True), 10, 2, 10, id='overwrite_cache'),
+    pytest.param(lambda f: f.refresh(x=5), 10, 2, 10, id='refresh'),
+    pytest.param(lambda f: f.original(5), 10, 2, 5, id='original'),
+    pytest.param(lambda f: f.get(x=5), 5, 1, 5, id='get'),
+    pytest.param(lambda f: f.set('preset', x=5), None, 1, 'preset', id='set'),
+]
+
+
+async def _acounter(keys: AsyncIterator[str]) -> Counter:
+    """Tally an async key iterator as it streams, like Counter(iterable).
+    """
+    counts = Counter()
+    async for key in keys:
+        counts[key] += 1
+    return counts
+
+
 class _GenericBackendTestSuite(ABC):
     """Base test suite that all sync backends inherit.
 
@@ -119,8 +146,13 @@ class _GenericBackendTestSuite(ABC):
         assert result1 == result2 == result3 == 15
         assert call_count == 1
 
-    def test_skip_cache_bypasses_cache(self):
-        """Verify _skip_cache=True bypasses the cache.
+    @pytest.mark.parametrize(('op', 'result', 'calls', 'after'), _CONTROL_CASES)
+    def test_control_path_on_cached_entry(self, op, result, calls, after):
+        """Verify each control path's result, executions and what it leaves cached.
+
+        The function returns x times its call count, so a recomputation is
+        visible in the value and the follow-up plain call shows whether the
+        control path stored its result.
         """
         call_count = 0
 
@@ -128,36 +160,15 @@ class _GenericBackendTestSuite(ABC):
         def func(x: int) -> int:
             nonlocal call_count
             call_count += 1
-            return x * 2
-
-        result1 = func(5)
-        assert call_count == 1
-
-        result2 = func(5, _skip_cache=True)
-        assert call_count == 2
-        assert result1 == result2 == 10
-
-    def test_overwrite_cache_refreshes_value(self):
-        """Verify _overwrite_cache=True refreshes cached value.
-        """
-        counter = [0]
-
-        @cachu.cache(ttl=300, backend=self.backend)
-        def func(x: int) -> int:
-            counter[0] += 1
-            return x * counter[0]
-
-        result1 = func(5)
-        assert result1 == 5
+            return x * call_count
 
-        result2 = func(5)
-        assert result2 == 5
+        assert func(5) == 5
 
-        result3 = func(5, _overwrite_cache=True)
-        assert result3 == 10
+        assert op(func) == result
+        assert call_count == calls
 
-        result4 = func(5)
-        assert result4 == 10
+        assert func(5) == after
+        assert call_count == calls
 
     def test_cache_info_tracks_hits_misses(self):
         """Verify cache_info returns accurate statistics.
@@ -218,40 +229,6 @@ class _GenericBackendTestSuite(ABC):
         compute(10)
         assert call_count == 3
 
-    def test_refresh_recomputes_and_caches(self):
-        """Verify func.refresh() recomputes and stores new value.
-        """
-        call_count = 0
-
-        @cachu.cache(ttl=60, backend=self.backend)
-        def compute(x: int) -> int:
-            nonlocal call_count
-            call_count += 1
-            return x * 2
-
-        result1 = compute(5)
-        assert call_count == 1
-        assert result1 == 10
-
-        result2 = compute.refresh(x=5)
-        assert call_count == 2
-        assert result2 == 10
-
-        result3 = compute(5)
-        assert call_count == 2
-        assert result3 == 10
-
-    def test_get_returns_cached_value(self):
-        """Verify func.get() retrieves cached value without execution.
-        """
-        @cachu.cache(ttl=60, backend=self.backend)
-        def compute(x: int) -> int:
-            return x * 2
-
-        compute(5)
-        result = compute.get(x=5)
-        assert result == 10
-
     def test_get_raises_keyerror_when_not_cached(self):
         """Verify func.get() raises KeyError for missing key.
         """
@@ -272,44 +249,6 @@ class _GenericBackendTestSuite(ABC):
         result = compute.get(default='fallback', x=888)
         assert result == 'fallback'
 
-    def test_set_stores_value_without_execution(self):
-        """Verify func.set() stores value without calling function.
-        """
-        call_count = 0
-
-        @cachu.cache(ttl=60, backend=self.backend)
-        def compute(x: int) -> int:
-            nonlocal call_count
-            call_count += 1
-            return x * 2
-
-        compute.set('preset_value', x=42)
-
-        result = compute(42)
-        assert result == 'preset_value'
-        assert call_count == 0
-
-    def test_original_calls_unwrapped_function(self):
-        """Verify func.original() calls function bypassing cache.
-        """
-        call_count = 0
-
-        @cachu.cache(ttl=60, backend=self.backend)
-        def compute(x: int) -> int:
-            nonlocal call_count
-            call_count += 1
-            return x * 2
-
-        compute(5)
-        assert call_count == 1
-
-        result = compute.original(5)
-        assert result == 10
-        assert call_count == 2
-
-        compute(5)
-        assert call_count == 2
-
     def test_complex_objects_roundtrip(self):
         """Verify complex nested objects serialize/deserialize correctly.
         """
@@ -346,13 +285,42 @@ class _GenericBackendTestSuite(ABC):
 
 
 class _GenericBackendTestSuiteWithTTL(_GenericBackendTestSuite):
-    """Extended test suite with TTL tests that require time.sleep().
+    """Extended test suite with TTL expiry tests.
+
+    Subclasses may set:
+        clock_module: str - Dotted path of the backend module whose `time`
+            lookups decide expiry. When set, the tests advance a virtual
+            clock there instead of sleeping; when None (server-side TTLs
+            such as Redis) they fall back to real sleeps, and conftest
+            marks them @pytest.mark.slow.
 
-    These tests are slower and marked with @pytest.mark.slow.
+    `test_ttl_expiration_wall_clock` always sleeps, keeping one end-to-end
+    check against the real clock. It is marked @pytest.mark.slow.
     """
 
-    @pytest.mark.slow
-    def test_ttl_expiration(self):
+    clock_module: str | None = None
+
+    @pytest.fixture
+    def advance(self, monkeypatch):
+        """Return a callable that moves the backend's clock forward.
+        """
+        if self.clock_module is None:
+            return time.sleep
+
+        offset = 0.0
+        clock = SimpleNamespace(
+            time=lambda: time.time() + offset,
+            monotonic=lambda: time.monotonic() + offset,
+        )
+        monkeypatch.setattr(f'{self.clock_module}.time', clock)
+
+        def _advance(seconds: float) -> None:
+            nonlocal offset
+            offset += seconds
+
+        return _advance
+
+    def test_ttl_expiration(self, advance):
         """Verify cached values expire after TTL.
         """
         call_count = 0
@@ -368,13 +336,12 @@ class _GenericBackendTestSuiteWithTTL(_GenericBackendTestSuite):
         func(5)
         assert call_count == 1
 
-        time.sleep(1.5)
+        advance(1.5)
 
         func(5)
         assert call_count == 2
 
-    @pytest.mark.slow
-    def test_ttl_boundary_still_valid(self):
+    def test_ttl_boundary_still_valid(self, advance):
         """Verify cached value is valid just before TTL expires.
         """
         call_count = 0
@@ -388,14 +355,13 @@ class _GenericBackendTestSuiteWithTTL(_GenericBackendTestSuite):
         func(5)
         assert call_count == 1
 
-        time.sleep(0.5)
+        advance(0.5)
 
         result = func(5)
         assert result == 10
         assert call_count == 1
 
-    @pytest.mark.slow
-    def test_ttl_just_expired(self):
+    def test_ttl_just_expired(self, advance):
         """Verify cached value expires just after TTL boundary.
         """
         call_count = 0
@@ -409,12 +375,61 @@ class _GenericBackendTestSuiteWithTTL(_GenericBackendTestSuite):
         func(5)
         assert call_count == 1
 
-        time.sleep(1.1)
+        advance(1.1)
+
+        func(5)
+        assert call_count == 2
+
+    @pytest.mark.slow
+    def test_ttl_expiration_wall_clock(self):
+        """Verify expiry against the real clock, with no virtual time.
+        """
+        call_count = 0
+
+        @cachu.cache(ttl=1, backend=self.backend)
+        def func(x: int) -> int:
+            nonlocal call_count
+            call_count += 1
+            return x * 2
+
+        func(5)
+        assert call_count == 1
+
+        time.sleep(1.5)
 
         func(5)
         assert call_count == 2
 
 
+class _HitPathBenchmarkSuite:
+    """Mixin timing a cache hit through the decorator with pytest-benchmark.
+
+    Mix into in-process backends only: a networked backend would measure
+    round-trip noise rather than cachu's own per-call overhead (key
+    building, stats, lookup). Run with `--benchmark-only` to time it, or
+    `--benchmark-skip` to leave it out.
+    """
+
+    backend: str = None
+
+    @pytest.mark.benchmark(group='hit-path')
+    def test_hit_path_bench(self, benchmark):
+        """Time a repeated call whose result is already cached.
+        """
+        call_count = 0
+
+        @cachu.cache(ttl=300, backend=self.backend)
+        def func(x: int) -> int:
+            nonlocal call_count
+            call_count += 1
+            return x * 2
+
+        func(5)
+
+        assert benchmark(func, 5) == 10
+        assert call_count == 1
+
+
 class _GenericAsyncBackendTestSuite(ABC):
     """Base test suite that all async backends inherit.
 
@@ -447,6 +462,27 @@ class _GenericAsyncBackendTestSuite(ABC):
         assert result2 == 10
         assert call_count == 1
 
+    async def test_async_concurrent_hits_are_coalesced(self):
+        """Verify overlapping calls for one key run the function once.
+
+        Mutation: skip the dogpile lock on the async miss path. Every task
+        then misses together and computes its own value.
+        Oracle: the call counter, plus every caller seeing the one result.
+        """
+        call_count = 0
+
+        @cachu.cache(ttl=300, backend=self.backend)
+        async def slow_func(x: int) -> int:
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.05)
+            return x * 2
+
+        results = await asyncio.gather(*[slow_func(5) for _ in range(32)])
+
+        assert results == [10] * 32
+        assert call_count == 1
+
     async def test_async_different_args_create_different_entries(self):
         """Verify different arguments result in separate cache entries.
         """
@@ -458,9 +494,7 @@ class _GenericAsyncBackendTestSuite(ABC):
             call_count += 1
             return x * 2
 
-        await func(5)
-        await func(10)
-
+        assert await asyncio.gather(func(5), func(10)) == [10, 20]
         assert call_count == 2
 
     async def test_async_with_tag(self):
@@ -517,8 +551,9 @@ class _GenericAsyncBackendTestSuite(ABC):
         assert result1 == result2 == result3 == 15
         assert call_count == 1
 
-    async def test_async_skip_cache_bypasses_cache(self):
-        """Verify _skip_cache=True bypasses the cache.
+    @pytest.mark.parametrize(('op', 'result', 'calls', 'after'), _CONTROL_CASES)
+    async def test_async_control_path_on_cached_entry(self, op, result, calls, after):
+        """Verify each async control path's result, executions and what it leaves cached.
         """
         call_count = 0
 
@@ -526,36 +561,15 @@ class _GenericAsyncBackendTestSuite(ABC):
         async def func(x: int) -> int:
             nonlocal call_count
             call_count += 1
-            return x * 2
-
-        result1 = await func(5)
-        assert call_count == 1
-
-        result2 = await func(5, _skip_cache=True)
-        assert call_count == 2
-        assert result1 == result2 == 10
+            return x * call_count
 
-    async def test_async_overwrite_cache_refreshes_value(self):
-        """Verify _overwrite_cache=True refreshes cached value.
-        """
-        counter = [0]
-
-        @cachu.cache(ttl=300, backend=self.backend)
-        async def func(x: int) -> int:
-            counter[0] += 1
-            return x * counter[0]
+        assert await func(5) == 5
 
-        result1 = await func(5)
-        assert result1 == 5
+        assert await op(func) == result
+        assert call_count == calls
 
-        result2 = await func(5)
-        assert result2 == 5
-
-        result3 = await func(5, _overwrite_cache=True)
-        assert result3 == 10
-
-        result4 = await func(5)
-        assert result4 == 10
+        assert await func(5) == after
+        assert call_count == calls
 
     async def test_async_cache_info_tracks_hits_misses(self):
         """Verify async_cache_info returns accurate statistics.
@@ -616,40 +630,6 @@ class _GenericAsyncBackendTestSuite(ABC):
         await compute(10)
         assert call_count == 3
 
-    async def test_async_refresh_recomputes_and_caches(self):
-        """Verify async func.refresh() recomputes and stores new value.
-        """
-        call_count = 0
-
-        @cachu.cache(ttl=60, backend=self.backend)
-        async def compute(x: int) -> int:
-            nonlocal call_count
-            call_count += 1
-            return x * 2
-
-        result1 = await compute(5)
-        assert call_count == 1
-        assert result1 == 10
-
-        result2 = await compute.refresh(x=5)
-        assert call_count == 2
-        assert result2 == 10
-
-        result3 = await compute(5)
-        assert call_count == 2
-        assert result3 == 10
-
-    async def test_async_get_returns_cached_value(self):
-        """Verify async func.get() retrieves cached value.
-        """
-        @cachu.cache(ttl=60, backend=self.backend)
-        async def compute(x: int) -> int:
-            return x * 2
-
-        await compute(5)
-        result = await compute.get(x=5)
-        assert result == 10
-
     async def test_async_get_raises_keyerror_when_not_cached(self):
         """Verify async func.get() raises KeyError for missing key.
         """
@@ -670,44 +650,6 @@ class _GenericAsyncBackendTestSuite(ABC):
         result = await compute.get(default='fallback', x=888)
         assert result == 'fallback'
 
-    async def test_async_set_stores_value_without_execution(self):
-        """Verify async func.set() stores value without calling function.
-        """
-        call_count = 0
-
-        @cachu.cache(ttl=60, backend=self.backend)
-        async def compute(x: int) -> int:
-            nonlocal call_count
-            call_count += 1
-            return x * 2
-
-        await compute.set('preset_value', x=42)
-
-        result = await compute(42)
-        assert result == 'preset_value'
-        assert call_count == 0
-
-    async def test_async_original_calls_unwrapped_function(self):
-        """Verify async func.original() calls function bypassing cache.
-        """
-        call_count = 0
-
-        @cachu.cache(ttl=60, backend=self.backend)
-        async def compute(x: int) -> int:
-            nonlocal call_count
-            call_count += 1
-            return x * 2
-
-        await compute(5)
-        assert call_count == 1
-
-        result = await compute.original(5)
-        assert result == 10
-        assert call_count == 2
-
-        await compute(5)
-        assert call_count == 2
-
 
 class _GenericDirectBackendTestSuite(ABC):
     """Test suite for direct backend API (not via decorator).
@@ -738,6 +680,18 @@ class _GenericDirectBackendTestSuite(ABC):
         result = backend.get('nonexistent')
         assert result is NO_VALUE
 
+    @pytest.mark.parametrize('size', [1 << 10, 1 << 16, 1 << 20])
+    def test_large_object_roundtrip(self, size):
+        """Verify bytes and bytearray payloads of growing size survive set/get.
+        """
+        backend = self.create_backend()
+        value = {'blob': bytes(range(256)) * (size // 256), 'buffer': bytearray(size)}
+        backend.set('large', value, 300)
+
+        result = backend.get('large')
+        assert result == value
+        assert type(result['buffer']) is bytearray
+
     def test_get_with_metadata(self):
         """Verify get_with_metadata returns value and timestamp.
         """
@@ -756,12 +710,44 @@ class _GenericDirectBackendTestSuite(ABC):
         result = backend.get('key1')
         assert result is NO_VALUE
 
+    def test_get_many_preserves_order_and_misses(self):
+        """Verify get_many returns values in key order with NO_VALUE for misses.
+        """
+        backend = self.create_backend()
+        backend.set_many({'key1': 'value1', 'key2': 'value2'}, 300)
+
+        result = backend.get_many(['key2', 'missing', 'key1', 'key2'])
+        assert result == ['value2', NO_VALUE, 'value1', 'value2']
+        assert backend.get_many([]) == []
+
+    def test_set_many(self):
+        """Verify set_many stores every item and a non-positive TTL deletes them.
+        """
+        backend = self.create_backend()
+        backend.set_many({'key1': 'value1', 'key2': {'nested': [1, 2]}}, 300)
+
+        assert backend.get_many(['key1', 'key2']) == ['value1', {'nested': [1, 2]}]
+        _, created_at = backend.get_with_metadata('key1')
+        assert created_at is not None
+
+        backend.set_many({}, 300)
+        backend.set_many({'key1': 'ignored'}, 0)
+        assert backend.get_many(['key1', 'key2']) == [NO_VALUE, {'nested': [1, 2]}]
+
+    def test_delete_many(self):
+        """Verify delete_many removes only the named entries.
+        """
+        backend = self.create_backend()
+        backend.set_many({'key1': 'value1', 'key2': 'value2', 'key3': 'value3'}, 300)
+
+        backend.delete_many(['key1', 'key3', 'missing'])
+        assert backend.get_many(['key1', 'key2', 'key3']) == [NO_VALUE, 'value2', NO_VALUE]
+
     def test_clear_all(self):
         """Verify clear() removes all entries.
         """
         backend = self.create_backend()
-        backend.set('key1', 'value1', 300)
-        backend.set('key2', 'value2', 300)
+        backend.set_many({'key1': 'value1', 'key2': 'value2'}, 300)
 
         count = backend.clear()
         assert count == 2
@@ -769,13 +755,17 @@ class _GenericDirectBackendTestSuite(ABC):
         assert backend.get('key1') is NO_VALUE
         assert backend.get('key2') is NO_VALUE
 
-    def test_clear_pattern(self):
-        """Verify clear(pattern) removes matching entries only.
+    def test_pattern_operations(self):
+        """Verify count, keys and clear honour a glob pattern.
+
+        The read-only operations are checked first on one populated backend,
+        then clear(pattern) removes the matching entries only.
         """
         backend = self.create_backend()
-        backend.set('user:1', 'value1', 300)
-        backend.set('user:2', 'value2', 300)
-        backend.set('other:1', 'value3', 300)
+        backend.set_many({'user:1': 'value1', 'user:2': 'value2', 'other:1': 'value3'}, 300)
+
+        assert backend.count('user:*') == 2
+        assert Counter(backend.keys('user:*')) == Counter(['user:1', 'user:2'])
 
         count = backend.clear('user:*')
         assert count == 2
@@ -788,44 +778,32 @@ class _GenericDirectBackendTestSuite(ABC):
         """Verify keys() iterates over all keys.
         """
         backend = self.create_backend()
-        backend.set('key1', 'value1', 300)
-        backend.set('key2', 'value2', 300)
+        backend.set_many({'key1': 'value1', 'key2': 'value2'}, 300)
 
-        keys = list(backend.keys())
-        assert set(keys) == {'key1', 'key2'}
+        assert Counter(backend.keys()) == Counter(['key1', 'key2'])
 
-    def test_keys_pattern(self):
-        """Verify keys(pattern) filters keys.
+    @pytest.mark.slow
+    def test_keys_large_scale(self):
+        """Verify keys() streams a large keyspace once per key, agreeing with count().
         """
         backend = self.create_backend()
-        backend.set('user:1', 'value1', 300)
-        backend.set('user:2', 'value2', 300)
-        backend.set('other:1', 'value3', 300)
+        total = 100_000
+        backend.set_many({f'bulk:{i}': i for i in range(total)}, 300)
 
-        keys = list(backend.keys('user:*'))
-        assert set(keys) == {'user:1', 'user:2'}
+        counts = Counter(backend.keys('bulk:*'))
+        assert len(counts) == total
+        assert max(counts.values()) == 1
+        assert backend.count('bulk:*') == total
 
     def test_count(self):
         """Verify count() returns correct count.
         """
         backend = self.create_backend()
-        backend.set('key1', 'value1', 300)
-        backend.set('key2', 'value2', 300)
+        backend.set_many({'key1': 'value1', 'key2': 'value2'}, 300)
 
         count = backend.count()
         assert count == 2
 
-    def test_count_pattern(self):
-        """Verify count(pattern) counts matching keys only.
-        """
-        backend = self.create_backend()
-        backend.set('user:1', 'value1', 300)
-        backend.set('user:2', 'value2', 300)
-        backend.set('other:1', 'value3', 300)
-
-        count = backend.count('user:*')
-        assert count == 2
-
     def test_stats_incr_and_get(self):
         """Verify stats increment and retrieval.
         """
@@ -838,6 +816,21 @@ class _GenericDirectBackendTestSuite(ABC):
         assert hits == 2
         assert misses == 1
 
+    def test_incr_stats_applies_each_amount(self):
+        """Verify incr_stats applies a batch of increments, amounts included.
+        """
+        backend = self.create_backend()
+        backend.incr_stat('func1', 'hits')
+        backend.incr_stats([
+            ('func1', 'hits', 2),
+            ('func1', 'misses', 3),
+            ('func2', 'misses', 1),
+        ])
+        backend.incr_stats([])
+
+        assert backend.get_stats('func1') == (3, 3)
+        assert backend.get_stats('func2') == (0, 1)
+
     def test_stats_unknown_function(self):
         """Verify stats return (0, 0) for unknown function.
         """
@@ -897,6 +890,18 @@ class _GenericAsyncDirectBackendTestSuite(ABC):
         result = await backend.aget('nonexistent')
         assert result is NO_VALUE
 
+    @pytest.mark.parametrize('size', [1 << 10, 1 << 16, 1 << 20])
+    async def test_async_large_object_roundtrip(self, size):
+        """Verify bytes and bytearray payloads of growing size survive aset/aget.
+        """
+        backend = self.create_backend()
+        value = {'blob': bytes(range(256)) * (size // 256), 'buffer': bytearray(size)}
+        await backend.aset('large', value, 300)
+
+        result = await backend.aget('large')
+        assert result == value
+        assert type(result['buffer']) is bytearray
+
     async def test_async_get_with_metadata(self):
         """Verify aget_with_metadata returns value and timestamp.
         """
@@ -915,76 +920,87 @@ class _GenericAsyncDirectBackendTestSuite(ABC):
         result = await backend.aget('key1')
         assert result is NO_VALUE
 
+    async def test_async_get_many_preserves_order_and_misses(self):
+        """Verify aget_many returns values in key order with NO_VALUE for misses.
+        """
+        backend = self.create_backend()
+        await backend.aset_many({'key1': 'value1', 'key2': 'value2'}, 300)
+
+        result = await backend.aget_many(['key2', 'missing', 'key1', 'key2'])
+        assert result == ['value2', NO_VALUE, 'value1', 'value2']
+        assert await backend.aget_many([]) == []
+
+    async def test_async_set_many(self):
+        """Verify aset_many stores every item and a non-positive TTL deletes them.
+        """
+        backend = self.create_backend()
+        await backend.aset_many({'key1': 'value1', 'key2': {'nested': [1, 2]}}, 300)
+
+        assert await backend.aget_many(['key1', 'key2']) == ['value1', {'nested': [1, 2]}]
+        _, created_at = await backend.aget_with_metadata('key1')
+        assert created_at is not None
+
+        await backend.aset_many({}, 300)
+        await backend.aset_many({'key1': 'ignored'}, 0)
+        assert await backend.aget_many(['key1', 'key2']) == [NO_VALUE, {'nested': [1, 2]}]
+
+    async def test_async_delete_many(self):
+        """Verify adelete_many removes only the named entries.
+        """
+        backend = self.create_backend()
+        await backend.aset_many({'key1': 'value1', 'key2': 'value2', 'key3': 'value3'}, 300)
+
+        await backend.adelete_many(['key1', 'key3', 'missing'])
+        result = await backend.aget_many(['key1', 'key2', 'key3'])
+        assert result == [NO_VALUE, 'value2', NO_VALUE]
+
     async def test_async_clear_all(self):
         """Verify aclear() removes all entries.
         """
         backend = self.create_backend()
-        await backend.aset('key1', 'value1', 300)
-        await backend.aset('key2', 'value2', 300)
+        await backend.aset_many({'key1': 'value1', 'key2': 'value2'}, 300)
 
         count = await backend.aclear()
         assert count == 2
 
-        assert await backend.aget('key1') is NO_VALUE
-        assert await backend.aget('key2') is NO_VALUE
+        assert await asyncio.gather(backend.aget('key1'), backend.aget('key2')) == [NO_VALUE, NO_VALUE]
 
-    async def test_async_clear_pattern(self):
-        """Verify aclear(pattern) removes matching entries only.
+    async def test_async_pattern_operations(self):
+        """Verify acount, akeys and aclear honour a glob pattern.
+
+        The read-only operations are checked first on one populated backend,
+        then aclear(pattern) removes the matching entries only.
         """
         backend = self.create_backend()
-        await backend.aset('user:1', 'value1', 300)
-        await backend.aset('user:2', 'value2', 300)
-        await backend.aset('other:1', 'value3', 300)
+        await backend.aset_many({'user:1': 'value1', 'user:2': 'value2', 'other:1': 'value3'}, 300)
+
+        assert await backend.acount('user:*') == 2
+        assert await _acounter(backend.akeys('user:*')) == Counter(['user:1', 'user:2'])
 
         count = await backend.aclear('user:*')
         assert count == 2
 
-        assert await backend.aget('user:1') is NO_VALUE
-        assert await backend.aget('user:2') is NO_VALUE
-        assert await backend.aget('other:1') == 'value3'
+        survivors = await asyncio.gather(
+            backend.aget('user:1'), backend.aget('user:2'), backend.aget('other:1'))
+        assert survivors == [NO_VALUE, NO_VALUE, 'value3']
 
     async def test_async_keys(self):
         """Verify akeys() iterates over all keys.
         """
         backend = self.create_backend()
-        await backend.aset('key1', 'value1', 300)
-        await backend.aset('key2', 'value2', 300)
-
-        keys = [k async for k in backend.akeys()]
-        assert set(keys) == {'key1', 'key2'}
-
-    async def test_async_keys_pattern(self):
-        """Verify akeys(pattern) filters keys.
-        """
-        backend = self.create_backend()
-        await backend.aset('user:1', 'value1', 300)
-        await backend.aset('user:2', 'value2', 300)
-        await backend.aset('other:1', 'value3', 300)
+        await backend.aset_many({'key1': 'value1', 'key2': 'value2'}, 300)
 
-        keys = [k async for k in backend.akeys('user:*')]
-        assert set(keys) == {'user:1', 'user:2'}
+        assert await _acounter(backend.akeys()) == Counter(['key1', 'key2'])
 
     async def test_async_count(self):
         """Verify acount() returns correct count.
         """
         backend = self.create_backend()
-        await backend.aset('key1', 'value1', 300)
-        await backend.aset('key2', 'value2', 300)
+        await backend.aset_many({'key1': 'value1', 'key2': 'value2'}, 300)
 
         count = await backend.acount()
         assert count == 2
 
-    async def test_async_count_pattern(self):
-        """Verify acount(pattern) counts matching keys only.
-        """
-        backend = self.create_backend()
-        await backend.aset('user:1', 'value1', 300)
-        await backend.aset('user:2', 'value2', 300)
-        await backend.aset('other:1', 'value3', 300)
-
-        count = await backend.acount('user:*')
-        assert count == 2
-
     async def test_async_stats_incr_and_get(self):
         """Verify async stats increment and retrieval.
         """
@@ -997,6 +1013,20 @@ class _GenericAsyncDirectBackendTestSuite(ABC):
         assert hits == 1
         assert misses == 2
 
+    async def test_async_incr_stats_applies_each_amount(self):
+        """Verify aincr_stats applies a batch of increments, amounts included.
+        """
+        backend = self.create_backend()
+        await backend.aincr_stats([
+            ('func1', 'hits', 2),
+            ('func1', 'misses', 3),
+            ('func2', 'misses', 1),
+        ])
+        await backend.aincr_stats([])
+
+        assert await backend.aget_stats('func1') == (2, 3)
+        assert await backend.aget_stats('func2') == (0, 1)
+
     async def test_async_clear_stats(self):
         """Verify async clear_stats works.
         """
@@ -1,18 +1,12 @@
 import logging
+from types import SimpleNamespace
 
 import pytest
 
 logger = logging.getLogger(__name__)
 
-
-class RedisTestConfig:
-    """Singleton to store Redis test configuration.
-    """
-    host = 'localhost'
-    port = 6379
-
-
-redis_test_config = RedisTestConfig()
+# Where the session's Redis container listens; filled in by `redis_docker`.
+redis_test_config = SimpleNamespace(host='localhost', port=6379)
 
 
 @pytest.fixture(scope='session')
@@ -30,16 +24,58 @@ def redis_docker():
         host = redis_container.get_container_host_ip()
         port = int(redis_container.get_exposed_port(6379))
 
-        # Update the singleton
         redis_test_config.host = host
         redis_test_config.port = port
 
         import cachu
         cachu.configure(redis_url=f'redis://{host}:{port}/0')
 
-        r = redis_lib.Redis(host=host, port=port, db=0)
-        r.ping()
-        r.close()
+        # One liveness ping for the whole session, on a kept-alive socket.
+        with redis_lib.Redis(
+            host=host, port=port, db=0,
+            socket_keepalive=True, health_check_interval=30,
+        ) as r:
+            r.ping()
         logger.debug(f'Redis container ready at {host}:{port}')
 
         yield redis_container
+
+
+@pytest.fixture(scope='session')
+def redis_url(redis_docker):
+    """URL of the session's Redis container, DB 0.
+    """
+    return f'redis://{redis_test_config.host}:{redis_test_config.port}/0'
+
+
+@pytest.fixture(scope='session')
+def redis_conn(redis_docker):
+    """Pooled client on the session's Redis container, shared by every test.
+
+    The per-test FLUSHDB in `reset_cache_config` goes through this pool, so
+    the handshake happens once per session instead of once per test.
+    """
+    import redis as redis_lib
+
+    pool = redis_lib.ConnectionPool(
+        host=redis_test_config.host, port=redis_test_config.port, db=0,
+        max_connections=50, socket_keepalive=True,
+    )
+    client = redis_lib.Redis(connection_pool=pool)
+    yield client
+    client.close()
+    pool.disconnect()
+
+
+@pytest.fixture
+def redis_clean(redis_conn):
+    """Empty the session's Redis DB so a test starts from no keys.
+
+    Best effort: a test that stopped the container, or a DB that refuses
+    FLUSHDB, should fail on its own assertions rather than in setup.
+    """
+    try:
+        redis_conn.flushdb()
+    except Exception:
+        logger.debug('FLUSHDB before test failed', exc_info=True)
+    return redis_conn
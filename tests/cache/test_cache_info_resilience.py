@@ -317,14 +317,6 @@ class TestSyncCurrsizeIsNotAScanPerCall:
     """The sync path gets the same stale-while-revalidate cache as async.
     """
 
-    @pytest.fixture
-    def redis_url(self, redis_docker):
-        """Build the Redis URL for direct access.
-        """
-        from _fixtures.redis import redis_test_config
-
-        return f'redis://{redis_test_config.host}:{redis_test_config.port}/0'
-
     @pytest.fixture
     def client(self, redis_url):
         """An independent Redis client for seeding and reading SWR keys.
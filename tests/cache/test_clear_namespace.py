@@ -81,6 +81,19 @@ class TestClearPatternShape:
         assert make_clear_pattern(None, '', 86400) == '1d:*|*'
         assert make_clear_pattern(None, '', -1) == 'dynamic:*|*'
 
+    def test_pattern_is_memoized_without_sharing_float_ttl_regions(self):
+        """Repeat clears reuse the glob, and 300 / 300.0 still name one region.
+
+        Mutation: drop the int truncation and rely on the cache key alone.
+        Oracle: lru_cache statistics and hand-written globs.
+        """
+        make_clear_pattern.cache_clear()
+        first = make_clear_pattern('memo', 'p:', 300)
+        assert make_clear_pattern('memo', 'p:', 300) is first
+        assert make_clear_pattern.cache_info().hits == 1
+        assert make_clear_pattern('memo', 'p:', 300.0) == '5m:p:*|memo|*'
+        assert make_clear_pattern(None, '', 90.9) == '1m:*|*'
+
     def test_pattern_matches_cachu_keys_and_rejects_foreign_ones(self):
         """The glob is tight enough to exclude keys cachu never wrote.
 
@@ -2,8 +2,9 @@
 """
 import cachu
 import pytest
-from cachu.config import _registry, get_config
-from cachu.manager import manager
+from cachu.api import NO_VALUE
+from cachu.config import _get_caller_package, _registry, get_config
+from cachu.manager import clear_backends, manager
 from cachu.util import mangle_key
 
 
@@ -262,10 +263,6 @@ def test_cache_clear_creates_backend_and_clears(temp_cache_dir):
     File backend persists data to disk, allowing us to verify that cache_clear
     can find and delete cached data even when called from a 'fresh' process state.
     """
-    from cachu.api import NO_VALUE
-    from cachu.config import _get_caller_package
-    from cachu.manager import clear_backends, manager
-
     package = _get_caller_package()
 
     cfg = get_config(package)
@@ -305,7 +302,6 @@ def test_cache_clear_resets_stats():
     assert info.misses == 0
 
 
-@pytest.mark.asyncio
 async def test_async_cache_clear_resets_stats():
     """Verify async_cache_clear resets hit/miss statistics.
     """
@@ -373,7 +369,6 @@ def test_cache_clear_nonexistent_backend_is_idempotent():
     cachu.cache_clear(backend='memory', ttl=9999)
 
 
-@pytest.mark.asyncio
 async def test_async_delete_then_access_causes_recomputation():
     """Verify async function re-executes after async_cache_delete removes entry.
     """
@@ -398,7 +393,6 @@ async def test_async_delete_then_access_causes_recomputation():
     assert result == 10
 
 
-@pytest.mark.asyncio
 async def test_async_cache_clear_all_backends():
     """Verify async_cache_clear works without specific backend/ttl params.
     """
@@ -431,9 +425,6 @@ async def test_async_cache_clear_all_backends():
 def test_cache_clear_respects_key_prefix():
     """Verify cache_clear only removes keys matching the configured key_prefix.
     """
-    from cachu.api import NO_VALUE
-    from cachu.config import _get_caller_package
-
     package = _get_caller_package()
     backend = manager.get_backend(package, 'memory', 300)
 
@@ -452,9 +443,6 @@ def test_cache_clear_respects_key_prefix():
 def test_cache_clear_with_tag_respects_key_prefix():
     """Verify cache_clear with tag only removes matching prefix+tag keys.
     """
-    from cachu.api import NO_VALUE
-    from cachu.config import _get_caller_package
-
     package = _get_caller_package()
     backend = manager.get_backend(package, 'memory', 300)
 
@@ -476,9 +464,6 @@ def test_cache_clear_with_tag_respects_key_prefix():
 def test_cache_clear_global_ignores_prefix():
     """Verify global_clear=True clears all keys regardless of key_prefix.
     """
-    from cachu.api import NO_VALUE
-    from cachu.config import _get_caller_package
-
     package = _get_caller_package()
     backend = manager.get_backend(package, 'memory', 300)
 
@@ -497,9 +482,6 @@ def test_cache_clear_global_ignores_prefix():
 def test_cache_clear_global_with_tag():
     """Verify global_clear=True still respects tag filtering.
     """
-    from cachu.api import NO_VALUE
-    from cachu.config import _get_caller_package
-
     package = _get_caller_package()
     backend = manager.get_backend(package, 'memory', 300)
 
@@ -518,13 +500,9 @@ def test_cache_clear_global_with_tag():
     assert backend.get(dev_products_key) == 'dev_products'
 
 
-@pytest.mark.asyncio
 async def test_async_cache_clear_global_ignores_prefix():
     """Verify async global_clear=True clears all keys regardless of key_prefix.
     """
-    from cachu.api import NO_VALUE
-    from cachu.config import _get_caller_package
-
     package = _get_caller_package()
     backend = manager.get_backend(package, 'memory', 300)
 
@@ -667,7 +645,6 @@ def test_clear_filters_combined():
     assert call_count == 2
 
 
-@pytest.mark.asyncio
 async def test_async_clear_filters_excluded_params():
     """Verify async .clear() ignores kwargs in the exclude set.
     """
@@ -306,6 +306,27 @@ class TestNothingToClearIsVisible:
 
         assert [r for r in caplog.records if 'no cache region' in r.message] == []
 
+    def test_cleared_count_is_logged_lazily_at_debug(self, caplog):
+        """A real clear reports its count through deferred %-formatting.
+
+        Mutation: format the message eagerly, paying for it with debug off.
+        Oracle: the record's unformatted msg and its rendered message.
+        """
+        package = cachu.config._get_caller_package()
+
+        @cachu.cache(ttl=445, backend='memory', tag='lazylog')
+        def one(x: int) -> int:
+            return x
+
+        one(1)
+        one(2)
+        with caplog.at_level(logging.DEBUG, logger='cachu.operations'):
+            assert cachu.cache_clear(tag='lazylog', package=package) == 2
+
+        [record] = [r for r in caplog.records if r.getMessage().startswith('Cleared')]
+        assert '%d' in record.msg
+        assert record.getMessage() == 'Cleared 2 entries from memory backend (ttl=445)'
+
 
 class TestExistingBehaviourIsPreserved:
     """The warm-process paths behave exactly as before.
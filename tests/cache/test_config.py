@@ -2,7 +2,7 @@
 """
 import cachu
 import pytest
-from cachu.config import ConfigRegistry
+from cachu.config import ConfigRegistry, _registry
 
 
 def test_configure_updates_settings(tmp_path):
@@ -198,7 +198,6 @@ class TestGetConfig:
     def test_get_config_with_explicit_package(self):
         """Verify get_config can retrieve config for explicit package.
         """
-        from cachu.config import _registry
 
         _registry.configure(package='explicit_pkg', key_prefix='explicit:')
 
@@ -232,7 +231,6 @@ class TestKeyPrefixCapture:
     def test_different_packages_have_different_key_prefixes(self):
         """Verify different packages can have different key prefixes.
         """
-        from cachu.config import _registry
 
         _registry.configure(package='pkg1', key_prefix='v1:')
         _registry.configure(package='pkg2', key_prefix='v2:')
@@ -242,3 +240,28 @@ class TestKeyPrefixCapture:
 
         assert cfg1.key_prefix == 'v1:'
         assert cfg2.key_prefix == 'v2:'
+
+
+class TestCallerPackage:
+    """Tests for resolving the calling package of a script run as __main__.
+    """
+
+    @staticmethod
+    def _call_as_main():
+        namespace = {'__name__': '__main__'}
+        exec('from cachu.config import _get_caller_package\n'
+             'package = _get_caller_package()', namespace)
+        return namespace['package']
+
+    def test_main_package_follows_the_running_script(self, monkeypatch):
+        """Verify a __main__ caller is named after sys.argv[0], per script.
+
+        Mutation: memoize the resolved name without keying on the script
+        path, so a second script inherits the first one's package.
+        Oracle: the stem of each script path.
+        """
+        monkeypatch.setattr('sys.argv', ['/opt/jobs/nightly.py'])
+        assert self._call_as_main() == '__main__.nightly'
+
+        monkeypatch.setattr('sys.argv', ['/opt/jobs/hourly.py'])
+        assert self._call_as_main() == '__main__.hourly'
@@ -11,15 +11,6 @@ from cachu.decorator import _get_cached_currsize_async
 pytestmark = pytest.mark.redis
 
 
-@pytest.fixture
-def redis_url(redis_docker):
-    """Build the Redis URL for direct access in tests.
-    """
-    from _fixtures.redis import redis_test_config
-
-    return f'redis://{redis_test_config.host}:{redis_test_config.port}/0'
-
-
 @pytest.fixture
 def backend(redis_url):
     """Provide a fresh RedisBackend for each test.
@@ -38,7 +29,6 @@ def sync_redis(redis_docker):
     client.close()
 
 
-@pytest.mark.asyncio
 async def test_acount_none_uses_dbsize(backend, sync_redis):
     """acount(None) and acount('*') should return DBSIZE rather than scan-counting.
     """
@@ -49,7 +39,6 @@ async def test_acount_none_uses_dbsize(backend, sync_redis):
     assert await backend.acount('*') == 7
 
 
-@pytest.mark.asyncio
 async def test_currsize_cold_start_returns_zero_and_schedules_refresh(backend, sync_redis):
     """Cold start: no fresh, no last-known. Returns 0 immediately and the
     background refresh populates both keys.
@@ -73,7 +62,6 @@ async def test_currsize_cold_start_returns_zero_and_schedules_refresh(backend, s
     assert sync_redis.get(lock_key) is None
 
 
-@pytest.mark.asyncio
 async def test_currsize_serves_fresh_value(backend, sync_redis):
     """A fresh cached value is returned without invoking the slow scan.
     """
@@ -88,7 +76,6 @@ async def test_currsize_serves_fresh_value(backend, sync_redis):
     assert await _get_cached_currsize_async(backend, 'pkg', 'fn', 60, '', '1m:test:fn|*') == 42
 
 
-@pytest.mark.asyncio
 async def test_currsize_serves_stale_during_refresh(backend, sync_redis):
     """No fresh key but a last-known value: returns stale immediately and refreshes.
     """
@@ -109,7 +96,6 @@ async def test_currsize_serves_stale_during_refresh(backend, sync_redis):
     assert int(sync_redis.get(last_key)) == 3
 
 
-@pytest.mark.asyncio
 async def test_currsize_concurrent_misses_run_one_scan(backend, sync_redis):
     """Concurrent cold-cache callers acquire the lock once; only one scan runs.
     """
@@ -1,7 +1,5 @@
 """Test file (SQLite) cache backend operations via inheritance-based test suite.
 """
-import tempfile
-
 import pytest
 from _fixtures.backend_suite import _GenericAsyncBackendTestSuite
 from _fixtures.backend_suite import _GenericAsyncDirectBackendTestSuite
@@ -15,6 +13,7 @@ class TestFileBackend(_GenericBackendTestSuiteWithTTL):
     """
 
     backend = 'file'
+    clock_module = 'cachu.backends.sqlite'
 
     @pytest.fixture(autouse=True)
     def setup_temp_dir(self, temp_cache_dir):
@@ -39,31 +38,40 @@ class TestSqliteBackendDirect(_GenericDirectBackendTestSuite):
     """
 
     @pytest.fixture(autouse=True)
-    def setup_backend(self):
-        """Create temp file for SQLite database.
+    def setup_backend(self, tmp_path):
+        """Point the backend at a per-test database file, removed by pytest.
         """
-        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
-            self._filepath = f.name
+        self._filepath = str(tmp_path / 'cache.db')
+        self._backends = []
+        yield
+        for backend in self._backends:
+            backend.close()
 
     def create_backend(self):
-        """Create SqliteBackend instance.
+        """Create SqliteBackend instance, closed when the test ends.
         """
-        return SqliteBackend(self._filepath)
+        backend = SqliteBackend(self._filepath)
+        self._backends.append(backend)
+        return backend
 
 
-@pytest.mark.asyncio
 class TestAsyncSqliteBackendDirect(_GenericAsyncDirectBackendTestSuite):
     """Async direct API tests for SqliteBackend.
     """
 
     @pytest.fixture(autouse=True)
-    def setup_backend(self):
-        """Create temp file for SQLite database.
+    def setup_backend(self, tmp_path):
+        """Point the backend at a per-test database file, removed by pytest.
         """
-        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
-            self._filepath = f.name
+        self._filepath = str(tmp_path / 'cache.db')
+        self._backends = []
+        yield
+        for backend in self._backends:
+            backend.close()
 
     def create_backend(self):
-        """Create SqliteBackend instance.
+        """Create SqliteBackend instance, closed when the test ends.
         """
-        return SqliteBackend(self._filepath)
+        backend = SqliteBackend(self._filepath)
+        self._backends.append(backend)
+        return backend
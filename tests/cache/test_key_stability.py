@@ -5,6 +5,7 @@ import subprocess
 import sys
 
 import cachu
+from cachu.util import make_key_generator
 
 
 def test_set_argument_cache_key_stable_across_process_restarts():
@@ -42,7 +43,6 @@ def test_set_argument_cache_key_stable_across_process_restarts():
 def test_set_argument_order_does_not_change_key():
     """Two sets with the same members in different insertion order share a key.
     """
-    from cachu.util import make_key_generator
 
     def func(tags):
         return None
@@ -82,7 +82,6 @@ def test_value_containing_escape_sequence_does_not_collide():
     """A value literally containing an escape output (e.g. '%20', '%2A') must
     not collide with the value containing the corresponding raw character.
     """
-    from cachu.util import make_key_generator
 
     def func(q):
         return None
@@ -106,3 +105,25 @@ def test_distinct_string_values_cached_separately():
     fetch('q=a b')
     fetch('q=a%20b')
     assert len(calls) == 2, 'percent-encoded value must not hit the raw entry'
+
+
+def test_scalar_subclass_still_checked_for_connection_markers():
+    """Plain scalars skip the connection check, but their subclasses do not.
+
+    Mutation: test `isinstance(value, (int, str, ...))` on the fast path
+    instead of the exact type. A str subclass carrying a `driver_connection`
+    attribute then lands in the key instead of being filtered out.
+    Oracle: the literal key for `x=1` alone.
+    """
+
+    class Dsn(str):
+        driver_connection = True
+
+    def func(x, conn=None):
+        return None
+
+    gen = make_key_generator(func)
+    key, filtered = gen(1, conn=Dsn('postgres://db'))
+    assert 'conn' not in filtered
+    assert key == 'func|x=1'
+    assert gen(1, conn='postgres://db')[0] != key
@@ -1,18 +1,22 @@
 """Test memory cache backend operations via inheritance-based test suite.
 """
-import pytest
+from concurrent.futures import ThreadPoolExecutor
+
 from _fixtures.backend_suite import _GenericAsyncBackendTestSuite
 from _fixtures.backend_suite import _GenericAsyncDirectBackendTestSuite
 from _fixtures.backend_suite import _GenericBackendTestSuiteWithTTL
 from _fixtures.backend_suite import _GenericDirectBackendTestSuite
+from _fixtures.backend_suite import _HitPathBenchmarkSuite
+from cachu.backends import memory as memory_backend
 from cachu.backends.memory import MemoryBackend
 
 
-class TestMemoryBackend(_GenericBackendTestSuiteWithTTL):
+class TestMemoryBackend(_GenericBackendTestSuiteWithTTL, _HitPathBenchmarkSuite):
     """Sync tests for memory backend via decorator.
     """
 
     backend = 'memory'
+    clock_module = 'cachu.backends.memory'
 
 
 class TestAsyncMemoryBackend(_GenericAsyncBackendTestSuite):
@@ -31,8 +35,47 @@ class TestMemoryBackendDirect(_GenericDirectBackendTestSuite):
         """
         return MemoryBackend()
 
+    def test_stats_incr_concurrent(self):
+        """Concurrent incr_stat and incr_stats calls lose no increments.
+
+        Mutation: drop the lock around the read-modify-write of a counter.
+        Threads then overwrite each other's updates and the totals come up
+        short.
+        Oracle: the exact number of increments submitted across all workers.
+        """
+        backend = self.create_backend()
+        workers, rounds = 8, 2000
+
+        def hammer(_):
+            for _ in range(rounds):
+                backend.incr_stat('shared', 'hits')
+                backend.incr_stats([('shared', 'misses', 2)])
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(hammer, range(workers)))
+
+        assert backend.get_stats('shared') == (workers * rounds, 2 * workers * rounds)
+
+    def test_pattern_compile_cached(self):
+        """A repeated pattern reuses its compiled regex and matches case-sensitively.
+
+        Mutation: compile the pattern inside the scan instead of through
+        `_pattern_re`. The cache then records no hit for the second clear.
+        Oracle: `_pattern_re.cache_info()` around two identical clears, and
+        the keys the other backends' GLOB matching would keep.
+        """
+        backend = self.create_backend()
+        backend.set_many({'user:1': 1, 'user:2': 2, 'User:3': 3}, 300)
+        memory_backend._pattern_re.cache_clear()
+
+        assert backend.count('user:*') == 2
+        assert backend.clear('user:*') == 2
+
+        info = memory_backend._pattern_re.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+        assert list(backend.keys()) == ['User:3']
+
 
-@pytest.mark.asyncio
 class TestAsyncMemoryBackendDirect(_GenericAsyncDirectBackendTestSuite):
     """Async direct API tests for MemoryBackend.
     """
@@ -378,16 +378,17 @@ class TestPerKeyStateIsBounded:
 
     Notes
     -----
-    - The dogpile mutex registries hold one lock per distinct cache key. A
-      strong dict never released them, so 200,000 caller-supplied keys cost
-      tens of megabytes of locks however small `memory_maxsize` was - the
-      same unbounded per-key growth the bound exists to stop.
+    - The dogpile mutex registries hold one lock per cache key in use. A
+      registry that never dropped a key kept one lock per distinct key, so
+      200,000 caller-supplied keys cost tens of megabytes of locks however
+      small `memory_maxsize` was - the same unbounded per-key growth the
+      bound exists to stop.
     """
 
     def test_mutex_registry_does_not_grow_per_key(self):
         """Distinct keys do not accumulate locks once their mutexes are gone.
 
-        Mutation: hold the per-key locks in a plain dict, restoring the leak
+        Mutation: never drop a key from the registry, restoring the leak
         that survives cache_clear and clear_backends.
         Oracle: hand-derived residency - after 2,000 distinct keys and a
         collection, the registry must hold far fewer than the 2,000 a strong
@@ -420,10 +421,10 @@ class TestPerKeyStateIsBounded:
         first = ThreadingMutex('shared')
         second = ThreadingMutex('shared')
 
-        assert first._lock is second._lock
         assert first.acquire(timeout=0) is True
         try:
             assert second.acquire(timeout=0) is False
+            assert first._lock is second._lock
         finally:
             first.release()
 
@@ -2,6 +2,7 @@
 """
 import asyncio
 
+import pytest
 from cachu.mutex import AsyncioMutex, AsyncRedisMutex, RedisMutex
 
 
@@ -99,3 +100,172 @@ async def test_async_redis_mutex_subsecond_timeout_not_floored_to_zero():
     assert await mutex.acquire() is True
     assert fake.ex_values
     assert all(ex is None or ex >= 1 for ex in fake.ex_values)
+
+
+class _BusySyncRedis:
+    """SET stand-in for a lock key another process keeps holding.
+    """
+
+    def set(self, key, value, nx=True, ex=None):
+        return False
+
+
+class _FakeClock:
+    """Monotonic clock that only advances when the code under test sleeps.
+    """
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_redis_mutex_poll_never_sleeps_past_the_deadline(monkeypatch):
+    """The last poll sleep is clamped to the budget left, not a full interval.
+    """
+    clock = _FakeClock()
+    monkeypatch.setattr('cachu.mutex.time', clock)
+    mutex = RedisMutex(_BusySyncRedis(), 'lock:k', lock_timeout=10.0)
+
+    assert mutex.acquire(timeout=0.12) is False
+    assert clock.now == pytest.approx(0.12)
+    assert clock.sleeps[-1] == pytest.approx(0.02)
+
+
+class _ReleasingPubSub:
+    """Pub/sub stand-in: confirms the SUBSCRIBE, then delivers one release.
+
+    The second read frees the lock on the shared fake, standing in for the
+    holder's release script.
+    """
+
+    def __init__(self, client) -> None:
+        self._client = client
+        self.timeouts = []
+        self.closed = False
+
+    def subscribe(self, channel):
+        self._client.channels.append(channel)
+
+    def get_message(self, timeout=0.0):
+        self.timeouts.append(timeout)
+        if len(self.timeouts) == 1:
+            return {'type': 'subscribe', 'data': 1}
+        self._client.held = False
+        return {'type': 'message', 'data': b'released'}
+
+    def close(self):
+        self.closed = True
+
+
+class _AsyncReleasingPubSub(_ReleasingPubSub):
+    """Async twin of `_ReleasingPubSub`.
+    """
+
+    async def subscribe(self, channel):
+        super().subscribe(channel)
+
+    async def get_message(self, timeout=0.0):
+        return super().get_message(timeout=timeout)
+
+    async def aclose(self):
+        self.closed = True
+
+
+class _HeldSyncRedis:
+    """Lock key held elsewhere until the fake pub/sub delivers a release.
+    """
+
+    def __init__(self) -> None:
+        self.held = True
+        self.set_calls = 0
+        self.channels = []
+        self.pubsubs = []
+
+    def set(self, key, value, nx=True, ex=None):
+        self.set_calls += 1
+        return not self.held
+
+    def pubsub(self):
+        self.pubsubs.append(_ReleasingPubSub(self))
+        return self.pubsubs[-1]
+
+
+class _HeldAsyncRedis(_HeldSyncRedis):
+    """Async twin of `_HeldSyncRedis`.
+    """
+
+    async def set(self, key, value, nx=True, ex=None):
+        return super().set(key, value, nx=nx, ex=ex)
+
+    def pubsub(self):
+        self.pubsubs.append(_AsyncReleasingPubSub(self))
+        return self.pubsubs[-1]
+
+
+class _NoPubSubRedis(_BusySyncRedis):
+    """SET stand-in behind a proxy that rejects SUBSCRIBE.
+    """
+
+    def pubsub(self):
+        raise ConnectionError('SUBSCRIBE is not supported by this proxy')
+
+
+def test_redis_mutex_waiter_wakes_on_release_message(monkeypatch):
+    """A waiter retries on the release message instead of polling on a timer.
+
+    Mutation: sleep-poll instead of reading the channel, or skip the retry
+    after the SUBSCRIBE confirmation.
+    Oracle: one SET per wake (first try, post-subscribe, post-release), no
+    sleeps, and the channel is the lock key, closed on the way out.
+    """
+    clock = _FakeClock()
+    monkeypatch.setattr('cachu.mutex.time', clock)
+    fake = _HeldSyncRedis()
+    mutex = RedisMutex(fake, 'lock:k', lock_timeout=10.0)
+
+    assert mutex.acquire(timeout=5) is True
+    assert fake.set_calls == 3
+    assert clock.sleeps == []
+    assert fake.channels == ['lock:k']
+    assert fake.pubsubs[0].timeouts == [0.5, 0.5]
+    assert fake.pubsubs[0].closed
+
+
+async def test_async_redis_mutex_waiter_wakes_on_release_message():
+    """The async waiter also wakes on the release message and closes its channel.
+    """
+    fake = _HeldAsyncRedis()
+    mutex = AsyncRedisMutex(fake, 'lock:k', lock_timeout=10.0)
+
+    assert await mutex.acquire(timeout=5) is True
+    assert fake.set_calls == 3
+    assert fake.channels == ['lock:k']
+    assert fake.pubsubs[0].closed
+
+
+def test_redis_mutex_polls_when_pubsub_is_unavailable(monkeypatch):
+    """A server that refuses SUBSCRIBE still gets a bounded 50 ms SET NX poll.
+    """
+    clock = _FakeClock()
+    monkeypatch.setattr('cachu.mutex.time', clock)
+    mutex = RedisMutex(_NoPubSubRedis(), 'lock:k', lock_timeout=10.0)
+
+    assert mutex.acquire(timeout=0.12) is False
+    assert clock.sleeps == pytest.approx([0.05, 0.05, 0.02])
+
+
+def test_redis_mutex_tokens_are_distinct_opaque_hex():
+    """Every mutex owns a fresh 128-bit token, so release never frees a rival's lock.
+    """
+    tokens = {RedisMutex(_RecordingSyncRedis(), 'lock:k')._token for _ in range(100)}
+    tokens |= {AsyncRedisMutex(_RecordingAsyncRedis(), 'lock:k')._token for _ in range(100)}
+
+    assert len(tokens) == 200
+    assert all(len(token) == 32 and int(token, 16) >= 0 for token in tokens)
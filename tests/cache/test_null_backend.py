@@ -1,81 +1,71 @@
 """Tests for null backend (passthrough, no caching).
 """
+from collections import Counter
+from types import SimpleNamespace
+
 import cachu
+import pytest
 
 
-class TestNullBackendWithDecorator:
-    """Tests for null backend integration with @cache decorator.
+@pytest.fixture(scope='module')
+def _null_decorated():
+    """Decorate the sync and async null-backend functions once per module.
     """
+    calls = Counter()
 
-    def test_sync_function_always_executes(self):
-        """Verify sync function always executes (no caching).
-        """
-        call_count = 0
+    @cachu.cache(ttl=60, backend='null')
+    def compute(x: int) -> int:
+        calls['compute'] += 1
+        return x * 2
 
-        @cachu.cache(ttl=60, backend='null')
-        def compute(x: int) -> int:
-            nonlocal call_count
-            call_count += 1
-            return x * 2
+    @cachu.cache(ttl=60, backend='null')
+    async def acompute(x: int) -> int:
+        calls['acompute'] += 1
+        return x * 2
 
-        result1 = compute(5)
-        assert result1 == 10
-        assert call_count == 1
+    return SimpleNamespace(calls=calls, compute=compute, acompute=acompute)
 
-        result2 = compute(5)
-        assert result2 == 10
-        assert call_count == 2
 
-        result3 = compute(5)
-        assert result3 == 10
-        assert call_count == 3
+@pytest.fixture
+def null_compute(_null_decorated):
+    """Shared null-backend functions with the call counter reset.
 
-    async def test_async_function_always_executes(self):
-        """Verify async function always executes (no caching).
-        """
-        call_count = 0
+    The null backend stores nothing, so the counter is the only state that
+    carries over between tests.
+    """
+    _null_decorated.calls.clear()
+    return _null_decorated
 
-        @cachu.cache(ttl=60, backend='null')
-        async def compute(x: int) -> int:
-            nonlocal call_count
-            call_count += 1
-            return x * 2
 
-        result1 = await compute(5)
-        assert result1 == 10
-        assert call_count == 1
+class TestNullBackendWithDecorator:
+    """Tests for null backend integration with @cache decorator.
+    """
 
-        result2 = await compute(5)
-        assert result2 == 10
-        assert call_count == 2
+    def test_sync_function_always_executes(self, null_compute):
+        """Verify sync function always executes (no caching).
+        """
+        for expected_calls in (1, 2, 3):
+            assert null_compute.compute(5) == 10
+            assert null_compute.calls['compute'] == expected_calls
 
-        result3 = await compute(5)
-        assert result3 == 10
-        assert call_count == 3
+    async def test_async_function_always_executes(self, null_compute):
+        """Verify async function always executes (no caching).
+        """
+        for expected_calls in (1, 2, 3):
+            assert await null_compute.acompute(5) == 10
+            assert null_compute.calls['acompute'] == expected_calls
 
-    def test_invalidate_is_noop(self):
+    def test_invalidate_is_noop(self, null_compute):
         """Verify clear() works without error on null backend.
         """
-        @cachu.cache(ttl=60, backend='null')
-        def compute(x: int) -> int:
-            return x * 2
-
-        compute(5)
-        compute.clear(x=5)
+        null_compute.compute(5)
+        null_compute.compute.clear(x=5)
 
-    def test_refresh_always_executes(self):
+    def test_refresh_always_executes(self, null_compute):
         """Verify refresh() always executes function on null backend.
         """
-        call_count = 0
-
-        @cachu.cache(ttl=60, backend='null')
-        def compute(x: int) -> int:
-            nonlocal call_count
-            call_count += 1
-            return x * 2
-
-        compute.refresh(x=5)
-        assert call_count == 1
+        null_compute.compute.refresh(x=5)
+        assert null_compute.calls['compute'] == 1
 
-        compute.refresh(x=5)
-        assert call_count == 2
+        null_compute.compute.refresh(x=5)
+        assert null_compute.calls['compute'] == 2
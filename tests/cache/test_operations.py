@@ -1,214 +1,182 @@
 """Tests for cache operations: cache_get, cache_set, cache_delete.
 """
+import inspect
+from collections import Counter
+from types import SimpleNamespace
+
 import cachu
 import pytest
 from cachu import cache
-from cachu.operations import async_cache_get, async_cache_set, cache_get
+from cachu import manager as manager_module
+from cachu.config import CacheConfig, _registry
+from cachu.manager import manager
+from cachu.operations import async_cache_delete_many, async_cache_get
+from cachu.operations import async_cache_get_many, async_cache_set
+from cachu.operations import cache_delete_many, cache_get, cache_get_many
 from cachu.operations import cache_set
 
 
-class TestCacheGet:
-    """Tests for sync cache_get() function.
+async def _resolve(result):
+    """Await `result` when an async helper returned a coroutine.
     """
+    return await result if inspect.isawaitable(result) else result
 
-    def test_returns_cached_value(self):
-        """Verify cache_get returns value that was cached via function call.
-        """
-        call_count = 0
-
-        @cache(ttl=60, backend='memory')
-        def compute(x: int) -> int:
-            nonlocal call_count
-            call_count += 1
-            return x * 2
-
-        compute(5)
-        assert call_count == 1
-
-        result = cache_get(compute, x=5)
-        assert result == 10
-        assert call_count == 1
-
-    def test_raises_keyerror_when_not_cached(self):
-        """Verify cache_get raises KeyError when no cached value exists.
-        """
-        @cache(ttl=60, backend='memory')
-        def compute(x: int) -> int:
-            return x * 2
-
-        with pytest.raises(KeyError) as exc_info:
-            cache_get(compute, x=999)
-
-        assert 'No cached value' in str(exc_info.value)
-
-    def test_returns_default_when_not_cached(self):
-        """Verify cache_get returns default value when not cached.
-        """
-        @cache(ttl=60, backend='memory')
-        def compute(x: int) -> int:
-            return x * 2
-
-        result = cache_get(compute, default='fallback', x=888)
-        assert result == 'fallback'
-
-    def test_returns_none_default(self):
-        """Verify cache_get can return None as explicit default.
-        """
-        @cache(ttl=60, backend='memory')
-        def compute(x: int) -> int:
-            return x * 2
-
-        result = cache_get(compute, default=None, x=777)
-        assert result is None
-
-    def test_with_cache_set(self):
-        """Verify cache_get returns value set via cache_set.
-        """
-        @cache(ttl=60, backend='memory')
-        def compute(x: int) -> int:
-            return x * 2
-
-        cache_set(compute, 'manually_set', x=100)
-
-        result = cache_get(compute, x=100)
-        assert result == 'manually_set'
-
-    def test_with_multiple_params(self):
-        """Verify cache_get works with multiple parameters.
-        """
-        call_count = 0
-
-        @cache(ttl=60, backend='memory')
-        def compute(a: int, b: str) -> str:
-            nonlocal call_count
-            call_count += 1
-            return f'{a}-{b}'
 
-        compute(1, 'test')
-        assert call_count == 1
-
-        result = cache_get(compute, a=1, b='test')
-        assert result == '1-test'
-        assert call_count == 1
-
-    def test_raises_valueerror_for_undecorated_function(self):
-        """Verify cache_get raises ValueError for non-decorated function.
-        """
-        def not_decorated(x: int) -> int:
-            return x
-
-        with pytest.raises(ValueError) as exc_info:
-            cache_get(not_decorated, x=1)
-
-        assert 'not decorated' in str(exc_info.value)
+@pytest.fixture(scope='module')
+def _decorated():
+    """Decorate the shared sync and async compute functions once per module.
+    """
+    calls = Counter()
+
+    @cache(ttl=60, backend='memory')
+    def compute(x: int) -> int:
+        calls['compute'] += 1
+        return x * 2
+
+    @cache(ttl=60, backend='memory')
+    def compute_pair(a: int, b: str) -> str:
+        calls['compute_pair'] += 1
+        return f'{a}-{b}'
+
+    @cache(ttl=60, backend='memory')
+    async def acompute(x: int) -> int:
+        calls['compute'] += 1
+        return x * 2
+
+    @cache(ttl=60, backend='memory')
+    async def acompute_pair(a: int, b: str) -> str:
+        calls['compute_pair'] += 1
+        return f'{a}-{b}'
+
+    return SimpleNamespace(
+        calls=calls,
+        sync=(compute, compute_pair),
+        async_=(acompute, acompute_pair),
+    )
+
+
+@pytest.fixture(params=['sync', 'async'])
+def ops(request, _decorated):
+    """Bundle the decorated functions and CRUD helpers of one mode.
+
+    The autouse config reset detaches every backend between tests, so the
+    shared functions start each test with an empty cache; only the call
+    counter needs resetting here.
+    """
+    _decorated.calls.clear()
+    is_async = request.param == 'async'
+    compute, compute_pair = _decorated.async_ if is_async else _decorated.sync
+    return SimpleNamespace(
+        is_async=is_async,
+        calls=_decorated.calls,
+        compute=compute,
+        compute_pair=compute_pair,
+        get=async_cache_get if is_async else cache_get,
+        set=async_cache_set if is_async else cache_set,
+    )
 
 
-class TestAsyncCacheGet:
-    """Tests for async_cache_get() function.
+class TestCacheGet:
+    """Tests for cache_get() and async_cache_get(), run once per mode.
     """
 
-    async def test_returns_cached_value(self):
-        """Verify async_cache_get returns value that was cached via function call.
+    async def test_returns_cached_value(self, ops):
+        """Verify the getter returns a value cached by a function call.
         """
-        call_count = 0
-
-        @cache(ttl=60, backend='memory')
-        async def compute(x: int) -> int:
-            nonlocal call_count
-            call_count += 1
-            return x * 2
+        await _resolve(ops.compute(5))
+        assert ops.calls['compute'] == 1
 
-        await compute(5)
-        assert call_count == 1
-
-        result = await async_cache_get(compute, x=5)
+        result = await _resolve(ops.get(ops.compute, x=5))
         assert result == 10
-        assert call_count == 1
+        assert ops.calls['compute'] == 1
 
-    async def test_raises_keyerror_when_not_cached(self):
-        """Verify async_cache_get raises KeyError when no cached value exists.
+    async def test_raises_keyerror_when_not_cached(self, ops):
+        """Verify the getter raises KeyError when no cached value exists.
         """
-        @cache(ttl=60, backend='memory')
-        async def compute(x: int) -> int:
-            return x * 2
-
         with pytest.raises(KeyError) as exc_info:
-            await async_cache_get(compute, x=999)
+            await _resolve(ops.get(ops.compute, x=999))
 
         assert 'No cached value' in str(exc_info.value)
 
-    async def test_returns_default_when_not_cached(self):
-        """Verify async_cache_get returns default value when not cached.
+    @pytest.mark.parametrize('default', ['fallback', None])
+    async def test_returns_default_when_not_cached(self, ops, default):
+        """Verify the getter returns an explicit default, None included, when not cached.
         """
-        @cache(ttl=60, backend='memory')
-        async def compute(x: int) -> int:
-            return x * 2
+        result = await _resolve(ops.get(ops.compute, default=default, x=888))
+        assert result is default
 
-        result = await async_cache_get(compute, default='fallback', x=888)
-        assert result == 'fallback'
-
-    async def test_returns_none_default(self):
-        """Verify async_cache_get can return None as explicit default.
+    async def test_with_cache_set(self, ops):
+        """Verify the getter returns a value stored by the matching setter.
         """
-        @cache(ttl=60, backend='memory')
-        async def compute(x: int) -> int:
-            return x * 2
+        await _resolve(ops.set(ops.compute, 'manually_set', x=100))
 
-        result = await async_cache_get(compute, default=None, x=777)
-        assert result is None
+        result = await _resolve(ops.get(ops.compute, x=100))
+        assert result == 'manually_set'
 
-    async def test_with_cache_set(self):
-        """Verify async_cache_get returns value set via async_cache_set.
+    async def test_with_multiple_params(self, ops):
+        """Verify the getter works with multiple parameters.
         """
-        @cache(ttl=60, backend='memory')
-        async def compute(x: int) -> int:
-            return x * 2
+        await _resolve(ops.compute_pair(1, 'test'))
+        assert ops.calls['compute_pair'] == 1
 
-        await async_cache_set(compute, 'manually_set', x=100)
+        result = await _resolve(ops.get(ops.compute_pair, a=1, b='test'))
+        assert result == '1-test'
+        assert ops.calls['compute_pair'] == 1
 
-        result = await async_cache_get(compute, x=100)
-        assert result == 'manually_set'
+    async def test_raises_valueerror_for_undecorated_function(self, ops):
+        """Verify the getter raises ValueError for a non-decorated function.
 
-    async def test_with_multiple_params(self):
-        """Verify async_cache_get works with multiple parameters.
+        The async getter is handed an undecorated coroutine function, the
+        shape a caller of `async_cache_get` actually gets wrong.
         """
-        call_count = 0
+        if ops.is_async:
+            async def not_decorated(x: int) -> int:
+                return x
+        else:
+            def not_decorated(x: int) -> int:
+                return x
 
-        @cache(ttl=60, backend='memory')
-        async def compute(a: int, b: str) -> str:
-            nonlocal call_count
-            call_count += 1
-            return f'{a}-{b}'
+        with pytest.raises(ValueError) as exc_info:
+            await _resolve(ops.get(not_decorated, x=1))
 
-        await compute(1, 'test')
-        assert call_count == 1
+        assert 'not decorated' in str(exc_info.value)
 
-        result = await async_cache_get(compute, a=1, b='test')
-        assert result == '1-test'
-        assert call_count == 1
 
-    async def test_raises_valueerror_for_undecorated_function(self):
-        """Verify async_cache_get raises ValueError for non-decorated function.
-        """
-        async def not_decorated(x: int) -> int:
-            return x
+# Backends the CRUD helpers must agree on; redis only runs with Docker.
+_each_backend = pytest.mark.parametrize(
+    'backend_fixture',
+    ['memory', 'file', pytest.param('redis', marks=pytest.mark.redis)],
+    indirect=True,
+)
 
-        with pytest.raises(ValueError) as exc_info:
-            await async_cache_get(not_decorated, x=1)
 
-        assert 'not decorated' in str(exc_info.value)
+@pytest.fixture
+def backend_fixture(request):
+    """Yield the backend name after preparing what that backend needs.
+
+    The file backend gets a fresh `temp_cache_dir`; redis pulls in the
+    session-scoped `redis_docker` container, so one connection setup is
+    shared by every redis case.
+    """
+    backend = request.param
+    if backend == 'file':
+        request.getfixturevalue('temp_cache_dir')
+    elif backend == 'redis':
+        request.getfixturevalue('redis_docker')
+    return backend
 
 
 class TestCacheSet:
     """Tests for cache_set() function.
     """
 
-    def test_basic(self):
-        """Verify cache_set updates the cached value.
+    @_each_backend
+    def test_basic(self, backend_fixture):
+        """Verify cache_set updates the cached value on every backend.
         """
         call_count = 0
 
-        @cachu.cache(ttl=300, backend='memory', tag='users')
+        @cachu.cache(ttl=300, backend=backend_fixture, tag='users')
         def get_user(user_id: int) -> dict:
             nonlocal call_count
             call_count += 1
@@ -281,47 +249,6 @@ class TestCacheSet:
         assert result['data'] == 'updated'
         assert call_count == 1
 
-    def test_file_backend(self, temp_cache_dir):
-        """Verify cache_set works with file backend.
-        """
-        call_count = 0
-
-        @cachu.cache(ttl=300, backend='file', tag='items')
-        def get_item(item_id: int) -> dict:
-            nonlocal call_count
-            call_count += 1
-            return {'id': item_id, 'data': 'original_data'}
-
-        get_item(100)
-        assert call_count == 1
-
-        cachu.cache_set(get_item, {'id': 100, 'data': 'updated_data'}, item_id=100)
-
-        result = get_item(100)
-        assert result['data'] == 'updated_data'
-        assert call_count == 1
-
-    @pytest.mark.redis
-    def test_redis_backend(self, redis_docker):
-        """Verify cache_set works with Redis backend.
-        """
-        call_count = 0
-
-        @cachu.cache(ttl=300, backend='redis', tag='items')
-        def get_item(item_id: int) -> dict:
-            nonlocal call_count
-            call_count += 1
-            return {'id': item_id, 'data': 'original_data'}
-
-        get_item(100)
-        assert call_count == 1
-
-        cachu.cache_set(get_item, {'id': 100, 'data': 'updated_data'}, item_id=100)
-
-        result = get_item(100)
-        assert result['data'] == 'updated_data'
-        assert call_count == 1
-
     def test_not_decorated_raises(self):
         """Verify cache_set raises ValueError for non-decorated functions.
         """
@@ -336,12 +263,13 @@ class TestCacheDelete:
     """Tests for cache_delete() function.
     """
 
-    def test_basic(self):
-        """Verify cache_delete removes only the specified entry.
+    @_each_backend
+    def test_basic(self, backend_fixture):
+        """Verify cache_delete removes only the specified entry on every backend.
         """
         call_count = 0
 
-        @cachu.cache(ttl=300, backend='memory', tag='users')
+        @cachu.cache(ttl=300, backend=backend_fixture, tag='users')
         def get_user(user_id: int) -> dict:
             nonlocal call_count
             call_count += 1
@@ -418,66 +346,184 @@ class TestCacheDelete:
         fetch_data('users')
         assert call_count == 3
 
-    def test_file_backend(self, temp_cache_dir):
-        """Verify cache_delete works with file backend.
+    def test_not_decorated_raises(self):
+        """Verify cache_delete raises ValueError for non-decorated functions.
         """
-        call_count = 0
+        def plain_func(x: int) -> int:
+            return x * 2
 
-        @cachu.cache(ttl=300, backend='file', tag='items')
-        def get_item(item_id: int) -> dict:
-            nonlocal call_count
-            call_count += 1
-            return {'id': item_id, 'data': f'data_{item_id}'}
+        with pytest.raises(ValueError, match='not decorated with @cache'):
+            cachu.cache_delete(plain_func, x=5)
 
-        get_item(100)
-        get_item(200)
-        assert call_count == 2
 
-        get_item(100)
-        get_item(200)
-        assert call_count == 2
+class TestCacheGetMany:
+    """Tests for the batch cache_get_many() / cache_delete_many() helpers.
+    """
 
-        cachu.cache_delete(get_item, item_id=100)
+    @pytest.mark.parametrize('backend', ['memory', 'file'])
+    def test_returns_values_in_order_with_default(self, backend, temp_cache_dir):
+        """Verify cache_get_many maps each kwargs dict to its value or default.
+        """
+        @cache(ttl=60, backend=backend)
+        def compute(x: int) -> int:
+            return x * 2
 
-        get_item(100)
-        assert call_count == 3
+        compute(1)
+        compute(3)
 
-        get_item(200)
-        assert call_count == 3
+        result = cache_get_many(compute, [{'x': 3}, {'x': 2}, {'x': 1}], default='miss')
+        assert result == [6, 'miss', 2]
 
-    @pytest.mark.redis
-    def test_redis_backend(self, redis_docker):
-        """Verify cache_delete works with Redis backend.
+    def test_issues_one_backend_call(self, monkeypatch):
+        """Verify the batch reaches the backend as a single get_many call.
+        """
+        @cache(ttl=60, backend='memory')
+        def compute(x: int) -> int:
+            return x * 2
+
+        backend = compute._cache_backend.get()
+        calls = []
+        original = backend.get_many
+        monkeypatch.setattr(backend, 'get_many', lambda keys: calls.append(keys) or original(keys))
+        monkeypatch.setattr(backend, 'get', lambda key: pytest.fail('per-key get'))
+
+        cache_get_many(compute, [{'x': i} for i in range(10)])
+        assert len(calls) == 1
+        assert len(calls[0]) == 10
+
+    @pytest.mark.parametrize('backend', ['memory', 'file'])
+    def test_delete_many_removes_only_named_entries(self, backend, temp_cache_dir):
+        """Verify cache_delete_many leaves unnamed entries cached.
         """
         call_count = 0
 
-        @cachu.cache(ttl=300, backend='redis', tag='items')
-        def get_item(item_id: int) -> dict:
+        @cache(ttl=60, backend=backend)
+        def compute(x: int) -> int:
             nonlocal call_count
             call_count += 1
-            return {'id': item_id, 'data': f'data_{item_id}'}
+            return x * 2
 
-        get_item(100)
-        get_item(200)
-        assert call_count == 2
+        for x in range(3):
+            compute(x)
+        assert call_count == 3
 
-        get_item(100)
-        get_item(200)
-        assert call_count == 2
+        cache_delete_many(compute, [{'x': 0}, {'x': 2}])
+        assert cache_get_many(compute, [{'x': 0}, {'x': 1}, {'x': 2}]) == [None, 2, None]
 
-        cachu.cache_delete(get_item, item_id=100)
+    def test_reads_config_once_per_batch(self, monkeypatch):
+        """Verify the package config is looked up once, not once per key or call.
+        """
 
-        get_item(100)
-        assert call_count == 3
+        @cache(ttl=60, backend='memory')
+        def compute(x: int) -> int:
+            return x * 2
 
-        get_item(200)
-        assert call_count == 3
+        cache_get_many(compute, [{'x': 0}])
 
-    def test_not_decorated_raises(self):
-        """Verify cache_delete raises ValueError for non-decorated functions.
+        lookups = []
+        original = manager_module.get_config
+        monkeypatch.setattr(manager_module, 'get_config',
+                            lambda package: lookups.append(package) or original(package))
+
+        cache_get_many(compute, [{'x': i} for i in range(10)])
+        cache_get_many(compute, [{'x': i} for i in range(10)])
+        assert lookups == []
+
+    async def test_async_roundtrip(self):
+        """Verify the async batch helpers mirror the sync ones.
         """
-        def plain_func(x: int) -> int:
+        @cache(ttl=60, backend='memory')
+        async def compute(x: int) -> int:
             return x * 2
 
-        with pytest.raises(ValueError, match='not decorated with @cache'):
-            cachu.cache_delete(plain_func, x=5)
+        await compute(1)
+        await compute(2)
+
+        assert await async_cache_get_many(compute, [{'x': 1}, {'x': 2}]) == [2, 4]
+        await async_cache_delete_many(compute, [{'x': 1}])
+        assert await async_cache_get_many(compute, [{'x': 1}, {'x': 2}]) == [None, 4]
+
+
+class TestRegionHandle:
+    """Tests for the backend memo the CRUD helpers resolve through.
+    """
+
+    def test_helpers_skip_the_manager_after_first_resolve(self, monkeypatch):
+        """Verify repeated cache_get/cache_set calls resolve the backend once.
+        """
+
+        @cache(ttl=60, backend='memory')
+        def compute(x: int) -> int:
+            return x * 2
+
+        cache_set(compute, 10, x=5)
+
+        calls = []
+        original = manager.get_backend
+        monkeypatch.setattr(manager, 'get_backend',
+                            lambda *a: calls.append(a) or original(*a))
+
+        for _ in range(5):
+            assert cache_get(compute, x=5) == 10
+            cache_set(compute, 10, x=5)
+        assert calls == []
+
+    def test_clear_backends_invalidates_the_memo(self):
+        """Verify a handle re-resolves after clear_backends() closes its backend.
+        """
+        @cache(ttl=60, backend='memory')
+        def compute(x: int) -> int:
+            return x * 2
+
+        compute(5)
+        before = compute._cache_backend.get()
+
+        cachu.clear_backends()
+
+        after = compute._cache_backend.get()
+        assert after is not before
+        assert cache_get(compute, default=None, x=5) is None
+        cache_set(compute, 42, x=5)
+        assert compute(5) == 42
+
+    def test_reconfigure_invalidates_the_memoized_config(self):
+        """Verify configure(), a swapped default and an in-place edit all take effect.
+        """
+
+        @cache(ttl=60, backend='memory')
+        def compute(x: int) -> int:
+            return x * 2
+
+        region = compute._cache_backend
+        assert region.config().key_prefix == 'test:'
+
+        _registry._default.key_prefix = 'edited:'
+        assert region.config().key_prefix == 'edited:'
+
+        _registry._default = CacheConfig(key_prefix='swapped:')
+        assert region.config().key_prefix == 'swapped:'
+
+        cachu.configure(key_prefix='configured:')
+        assert region.config().key_prefix == 'configured:'
+        cache_set(compute, 7, x=1)
+        assert cache_get(compute, x=1) == 7
+        assert all(key.startswith('1m:configured:') for key in region.get().keys())
+
+    def test_packageless_handle_resolves_the_caller_every_call(self):
+        """Verify a handle built with package=None follows each caller's package.
+
+        Mutation: memoize the first get_config(None) answer against the
+        registry version.
+        Oracle: each calling package's own configured key_prefix.
+        """
+        _registry.configure(package='pkg_a', key_prefix='a:')
+        _registry.configure(package='pkg_b', key_prefix='b:')
+        region = manager_module.RegionHandle(None, 'memory', 60)
+
+        def config_from(package):
+            namespace = {'__name__': package, 'region': region}
+            exec('prefix = region.config().key_prefix', namespace)
+            return namespace['prefix']
+
+        assert config_from('pkg_a') == 'a:'
+        assert config_from('pkg_b') == 'b:'
@@ -53,7 +53,6 @@ class TestRedisBackendDirect(_GenericDirectBackendTestSuite):
         return RedisBackend(self._redis_url)
 
 
-@pytest.mark.asyncio
 class TestAsyncRedisBackendDirect(_GenericAsyncDirectBackendTestSuite):
     """Async direct API tests for RedisBackend.
     """
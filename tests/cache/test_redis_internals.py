@@ -6,6 +6,10 @@ import asyncio
 import fnmatch
 import logging
 
+import cachu
+import pytest
+import redis
+from cachu.backends import redis as redis_backend
 from cachu.backends.redis import RedisBackend
 
 
@@ -187,6 +191,243 @@ async def test_aclear_issues_single_key_unlinks_for_cluster_safety():
     assert max(fake.command_key_counts) == 1
 
 
+class _ScanTrackingSyncRedis(_RecordingSyncRedis):
+    """Records how many batches were already flushed when the SCAN finished.
+    """
+
+    def scan_iter(self, match=None, count=None):
+        yield from super().scan_iter(match=match, count=count)
+        self.flushed_during_scan = len(self.unlink_calls)
+
+
+def test_clear_flushes_batches_while_the_scan_is_running():
+    """clear() UNLINKs each full batch as the SCAN yields it, not after listing every key.
+    """
+    backend = RedisBackend('redis://localhost:6379/0')
+    fake = _ScanTrackingSyncRedis()
+    backend._sync_client = fake
+    for i in range(1200):
+        fake.store[f'1m:test:fn|x={i}'] = b'v'
+
+    cleared = backend.clear('1m:test:fn|*')
+
+    assert cleared == 1200
+    assert fake.store == {}
+    assert fake.flushed_during_scan == 2
+    assert [len(batch) for batch in fake.unlink_calls] == [500, 500, 200]
+
+
+class _FlushSyncPipeline(_RecordingSyncPipeline):
+    """Recording pipeline that also queues DBSIZE and FLUSHDB.
+    """
+
+    def __init__(self, client) -> None:
+        super().__init__(client)
+        self._commands = []
+
+    def dbsize(self):
+        self._commands.append('DBSIZE')
+        return self
+
+    def flushdb(self, asynchronous=False):
+        self._commands.append('FLUSHDB ASYNC' if asynchronous else 'FLUSHDB')
+        return self
+
+    def execute(self):
+        if not self._commands:
+            return super().execute()
+        commands, self._commands = self._commands, []
+        self._client.flush_round_trips.append(commands)
+        if self._client.reject_flushdb:
+            raise redis.ResponseError("unknown command 'FLUSHDB'")
+        size = len(self._client.store)
+        self._client.store.clear()
+        return [size, True]
+
+
+class _FlushSyncRedis(_RecordingSyncRedis):
+    """Sync Redis stand-in whose pipelines accept DBSIZE and FLUSHDB.
+    """
+
+    def __init__(self, reject_flushdb=False) -> None:
+        super().__init__()
+        self.reject_flushdb = reject_flushdb
+        self.flush_round_trips = []
+
+    def pipeline(self, transaction=True):
+        return _FlushSyncPipeline(self)
+
+
+class _FlushAsyncPipeline(_RecordingAsyncPipeline):
+    """Async twin of `_FlushSyncPipeline`.
+    """
+
+    def __init__(self, client) -> None:
+        super().__init__(client)
+        self._commands = []
+
+    def dbsize(self):
+        self._commands.append('DBSIZE')
+        return self
+
+    def flushdb(self, asynchronous=False):
+        self._commands.append('FLUSHDB ASYNC' if asynchronous else 'FLUSHDB')
+        return self
+
+    async def execute(self):
+        if not self._commands:
+            return await super().execute()
+        commands, self._commands = self._commands, []
+        self._client.flush_round_trips.append(commands)
+        if self._client.reject_flushdb:
+            raise redis.ResponseError("unknown command 'FLUSHDB'")
+        size = len(self._client.store)
+        self._client.store.clear()
+        return [size, True]
+
+
+class _FlushAsyncRedis(_RecordingAsyncRedis):
+    """Async Redis stand-in whose pipelines accept DBSIZE and FLUSHDB.
+    """
+
+    def __init__(self, reject_flushdb=False) -> None:
+        super().__init__()
+        self.reject_flushdb = reject_flushdb
+        self.flush_round_trips = []
+
+    def pipeline(self, transaction=True):
+        return _FlushAsyncPipeline(self)
+
+
+class TestClearAll:
+    """A pattern-less clear flushes the DB server-side instead of scanning.
+    """
+
+    def test_clear_all_is_one_flush_round_trip(self):
+        """Verify clear() sends DBSIZE and FLUSHDB ASYNC in one pipeline.
+
+        Mutation: keep mapping None to a '*' SCAN, or flush synchronously.
+        Oracle: the fake's recorded round trips and its emptied store.
+        """
+        backend = RedisBackend('redis://localhost:6379/0')
+        fake = _FlushSyncRedis()
+        backend._sync_client = fake
+        for i in range(1200):
+            fake.store[f'1m:test:fn|x={i}'] = b'v'
+
+        assert backend.clear() == 1200
+        assert fake.store == {}
+        assert fake.flush_round_trips == [['DBSIZE', 'FLUSHDB ASYNC']]
+        assert fake.unlink_calls == []
+
+    async def test_aclear_all_is_one_flush_round_trip(self):
+        """Verify aclear() sends DBSIZE and FLUSHDB ASYNC in one pipeline.
+        """
+        backend = RedisBackend('redis://localhost:6379/0')
+        fake = _FlushAsyncRedis()
+        backend._async_client = fake
+        for i in range(1200):
+            fake.store[f'1m:test:fn|x={i}'] = b'v'
+
+        assert await backend.aclear() == 1200
+        assert fake.store == {}
+        assert fake.flush_round_trips == [['DBSIZE', 'FLUSHDB ASYNC']]
+        assert fake.unlink_calls == []
+
+    def test_clear_all_falls_back_to_scan_when_flushdb_is_rejected(self):
+        """Verify a server that disables FLUSHDB is still cleared by SCAN.
+
+        Mutation: let the ResponseError escape, or swallow it and return 0.
+        Oracle: every key is gone and the UNLINK batches cover them all.
+        """
+        backend = RedisBackend('redis://localhost:6379/0')
+        fake = _FlushSyncRedis(reject_flushdb=True)
+        backend._sync_client = fake
+        for i in range(700):
+            fake.store[f'k{i}'] = b'v'
+
+        assert backend.clear() == 700
+        assert fake.store == {}
+        assert [len(batch) for batch in fake.unlink_calls] == [500, 200]
+
+    async def test_aclear_all_falls_back_to_scan_when_flushdb_is_rejected(self):
+        """Verify the async clear falls back to SCAN when FLUSHDB is rejected.
+        """
+        backend = RedisBackend('redis://localhost:6379/0')
+        fake = _FlushAsyncRedis(reject_flushdb=True)
+        backend._async_client = fake
+        for i in range(700):
+            fake.store[f'k{i}'] = b'v'
+
+        assert await backend.aclear() == 700
+        assert fake.store == {}
+
+
+class _RepeatingScanSyncRedis(_RecordingSyncRedis):
+    """SCAN that returns every match twice, as a rehash mid-scan can.
+    """
+
+    def scan_iter(self, match=None, count=None):
+        matches = list(super().scan_iter(match=match, count=count))
+        yield from matches + matches
+
+
+class _RepeatingScanAsyncRedis(_RecordingAsyncRedis):
+    """Async SCAN that returns every match twice.
+    """
+
+    async def scan_iter(self, match=None, count=None):
+        matches = [key async for key in super().scan_iter(match=match, count=count)]
+        for key in matches + matches:
+            yield key
+
+
+def test_keys_and_count_drop_scan_repeats():
+    """keys() yields each key once and count() counts it once despite SCAN repeats.
+
+    Mutation: yield straight from scan_iter.
+    Oracle: the fake's store, which holds each key once.
+    """
+    backend = RedisBackend('redis://localhost:6379/0')
+    fake = _RepeatingScanSyncRedis()
+    backend._sync_client = fake
+    for i in range(5):
+        fake.store[f'user:{i}'] = b'v'
+
+    assert sorted(backend.keys('user:*')) == sorted(fake.store)
+    assert backend.count('user:*') == 5
+
+
+async def test_akeys_and_acount_drop_scan_repeats():
+    """akeys() and acount() see each key once despite SCAN repeats.
+    """
+    backend = RedisBackend('redis://localhost:6379/0')
+    fake = _RepeatingScanAsyncRedis()
+    backend._async_client = fake
+    for i in range(5):
+        fake.store[f'user:{i}'] = b'v'
+
+    assert sorted([key async for key in backend.akeys('user:*')]) == sorted(fake.store)
+    assert await backend.acount('user:*') == 5
+
+
+def test_clear_stats_batches_stat_key_deletes():
+    """clear_stats() drops every stats key through pipelined batches, not one DEL each.
+    """
+    backend = RedisBackend('redis://localhost:6379/0')
+    fake = _RecordingSyncRedis()
+    backend._sync_client = fake
+    for i in range(50):
+        fake.store[f'cachu:stats:fn{i}'] = b'v'
+    fake.store['1m:test:fn|x=1'] = b'v'
+
+    backend.clear_stats()
+
+    assert fake.store == {'1m:test:fn|x=1': b'v'}
+    assert fake.delete_calls == []
+    assert len(fake.unlink_calls) == 1
+
+
 class _CurrsizeFakeClient:
     """Async client for currsize SWR tests.
 
@@ -278,3 +519,226 @@ class TestUndecodableRowIsVisible:
             assert _unpack_value(payload, 'authz:token') is None
 
         assert "Evicting undecodable cache row for key 'authz:token'" in caplog.text
+
+
+class _StatsFakeRedis:
+    """Sync and async stats stand-in; every command or pipeline execute is one round trip.
+    """
+
+    def __init__(self) -> None:
+        self.hashes = {}
+        self.round_trips = 0
+
+    def _hincrby(self, key, field, amount):
+        fields = self.hashes.setdefault(key, {})
+        fields[field] = fields.get(field, 0) + amount
+        return fields[field]
+
+    def hincrby(self, key, field, amount):
+        self.round_trips += 1
+        return self._hincrby(key, field, amount)
+
+    def hmget(self, key, *fields):
+        self.round_trips += 1
+        stored = self.hashes.get(key, {})
+        return [stored.get(field) for field in fields]
+
+    def pipeline(self, transaction=True):
+        return _StatsFakePipeline(self)
+
+    def close(self):
+        pass
+
+
+class _StatsFakePipeline:
+    """Queues HINCRBYs and applies them in one round trip.
+    """
+
+    def __init__(self, client) -> None:
+        self._client = client
+        self._queued = []
+
+    def hincrby(self, key, field, amount):
+        self._queued.append((key, field, amount))
+        return self
+
+    def execute(self):
+        self._client.round_trips += 1
+        return [self._client._hincrby(*queued) for queued in self._queued]
+
+
+class _AsyncStatsFakeRedis(_StatsFakeRedis):
+    """Async face of `_StatsFakeRedis`, sharing its round-trip count.
+    """
+
+    async def hincrby(self, key, field, amount):
+        return _StatsFakeRedis.hincrby(self, key, field, amount)
+
+    async def hmget(self, key, *fields):
+        return _StatsFakeRedis.hmget(self, key, *fields)
+
+    def pipeline(self, transaction=True):
+        return _AsyncStatsFakePipeline(self)
+
+    async def aclose(self):
+        pass
+
+
+class _AsyncStatsFakePipeline(_StatsFakePipeline):
+    """Async pipeline whose execute() is awaited.
+    """
+
+    async def execute(self):
+        return _StatsFakePipeline.execute(self)
+
+
+class TestBufferedStats:
+    """`redis_stats_batch` buffers hit/miss increments into pipelined writes.
+    """
+
+    def test_default_writes_each_increment_through(self):
+        """With the default batch of 1, every increment is its own HINCRBY.
+
+        Mutation: buffer unconditionally, so another process reading the
+        stats of a write-through deployment sees counts that lag.
+        Oracle: one round trip per increment, visible immediately.
+        """
+        backend = RedisBackend('redis://localhost:6379/0')
+        fake = backend._sync_client = _StatsFakeRedis()
+
+        backend.incr_stat('fn', 'hits')
+        backend.incr_stat('fn', 'misses')
+
+        assert fake.round_trips == 2
+        assert fake.hashes['cachu:stats:fn'] == {'hits': 1, 'misses': 1}
+
+    def test_full_batch_is_one_pipelined_write(self):
+        """Increments stay in-process until the batch fills, then go in one round trip.
+
+        Mutation: flush on every call, or never flush until a read.
+        Oracle: zero round trips for the first three of a batch of four,
+        exactly one after the fourth, with per-field totals preserved.
+        """
+        backend = RedisBackend('redis://localhost:6379/0', stats_batch=4)
+        fake = backend._sync_client = _StatsFakeRedis()
+
+        for stat in ('hits', 'hits', 'misses'):
+            backend.incr_stat('fn', stat)
+        assert fake.round_trips == 0
+
+        backend.incr_stat('other', 'hits')
+
+        assert fake.round_trips == 1
+        assert fake.hashes == {
+            'cachu:stats:fn': {'hits': 2, 'misses': 1},
+            'cachu:stats:other': {'hits': 1},
+        }
+
+    def test_reads_and_close_flush_the_partial_batch(self):
+        """get_stats sees this instance's pending increments, and close writes them.
+
+        Mutation: read straight from Redis, so a process's own cache_info
+        under-reports by up to a batch, or drop the buffer on close.
+        Oracle: the counts the caller just recorded.
+        """
+        backend = RedisBackend('redis://localhost:6379/0', stats_batch=100)
+        fake = backend._sync_client = _StatsFakeRedis()
+
+        backend.incr_stat('fn', 'hits')
+        assert backend.get_stats('fn') == (1, 0)
+
+        backend.incr_stat('fn', 'misses')
+        backend.close()
+
+        assert fake.hashes['cachu:stats:fn'] == {'hits': 1, 'misses': 1}
+
+    async def test_async_increments_share_the_buffer(self):
+        """aincr_stat buffers into the same batch, and aget_stats flushes it.
+        """
+        backend = RedisBackend('redis://localhost:6379/0', stats_batch=100)
+        fake = backend._async_client = _AsyncStatsFakeRedis()
+
+        await backend.aincr_stat('fn', 'hits')
+        await backend.aincr_stat('fn', 'hits')
+        assert fake.round_trips == 0
+
+        assert await backend.aget_stats('fn') == (2, 0)
+        assert fake.round_trips == 2
+
+    @pytest.mark.parametrize('bad', [0, -1, 1.5, True])
+    def test_invalid_batch_is_rejected(self, bad):
+        """redis_stats_batch must be a positive integer.
+
+        Oracle: ValueError, the documented rejection for invalid config.
+        """
+        with pytest.raises(ValueError, match='redis_stats_batch'):
+            cachu.configure(redis_stats_batch=bad)
+
+
+class TestSharedSyncClient:
+    """Backends with the same connection settings share one sync client.
+    """
+
+    def test_same_settings_share_a_client_until_the_last_close(self):
+        """Two backends on one URL reuse a pool, which outlives the first close.
+
+        Mutation: build a client per backend, leaving one connection pool
+        per TTL region against the same server; or close the shared client
+        on the first close(), breaking the backend still using it.
+        Oracle: identity of the two clients, and the registry entry
+        surviving exactly until the last holder closes.
+        """
+        url = 'redis://localhost:6379/0'
+        first = RedisBackend(url)
+        second = RedisBackend(url)
+        other = RedisBackend(url, socket_timeout=1.0)
+
+        assert first.client is second.client
+        assert other.client is not first.client
+
+        first.close()
+        assert second.client is not None
+        assert any(settings[0] == url for settings in redis_backend._shared_clients)
+
+        second.close()
+        other.close()
+        assert not any(settings[0] == url for settings in redis_backend._shared_clients)
+
+    def test_injected_client_is_closed_not_released(self):
+        """A client set directly on the backend is closed as before.
+        """
+        closed = []
+
+        class _Client:
+            def close(self):
+                closed.append(True)
+
+        backend = RedisBackend('redis://localhost:6379/0')
+        backend._sync_client = _Client()
+        backend.close()
+
+        assert closed == [True]
+
+
+class TestHiredisParser:
+    """Clients pick up the hiredis RESP parser when it is installed.
+    """
+
+    async def test_sync_and_async_connections_parse_with_hiredis(self):
+        """Both clients leave the parser to redis-py, which prefers hiredis.
+
+        Mutation: pass parser_class=... (or a connection class pinned to the
+        pure-Python parser) when building either client.
+        Oracle: the parser on a connection made from each pool; making a
+        connection does not open a socket.
+        """
+        pytest.importorskip('hiredis')
+        backend = RedisBackend('redis://localhost:6379/0')
+        try:
+            sync_conn = backend.client.connection_pool.make_connection()
+            async_conn = backend._get_async_client().connection_pool.make_connection()
+
+            assert 'Hiredis' in type(sync_conn._parser).__name__
+            assert 'Hiredis' in type(async_conn._parser).__name__
+        finally:
+            backend.close()
@@ -15,14 +15,57 @@ import pytest
 from cachu.backends.redis import RedisBackend, _unpack_value
 
 
+class _RecordingPipeline:
+    """Queues commands and applies them to the owning stand-in on execute.
+    """
+
+    def __init__(self, client) -> None:
+        self._client = client
+        self._queued: list[tuple] = []
+
+    def set(self, name, value, ex=None, **kwargs):
+        self._queued.append(('set', name, value, ex))
+        return self
+
+    def delete(self, *names):
+        self._queued.append(('delete', *names))
+        return self
+
+    def execute(self):
+        self._client.executes += 1
+        results = []
+        for command, *args in self._queued:
+            if command == 'set':
+                name, value, ex = args
+                results.append(_WriteRecordingRedis.set(self._client, name, value, ex=ex))
+            else:
+                results.append(_WriteRecordingRedis.delete(self._client, *args))
+        self._queued = []
+        return results
+
+
+class _AsyncRecordingPipeline(_RecordingPipeline):
+    """Async pipeline: commands queue synchronously, execute is awaited.
+    """
+
+    async def execute(self):
+        return _RecordingPipeline.execute(self)
+
+
 class _WriteRecordingRedis:
     """Sync Redis stand-in that records writes and rejects setex.
     """
 
+    pipeline_class = _RecordingPipeline
+
     def __init__(self) -> None:
         self.store: dict[str, bytes] = {}
         self.expiries: dict[str, int] = {}
         self.set_calls: list[tuple] = []
+        self.executes = 0
+
+    def pipeline(self, transaction=True):
+        return self.pipeline_class(self)
 
     def set(self, name, value, ex=None, **kwargs):
         self.set_calls.append((name, value, ex))
@@ -48,6 +91,8 @@ class _AsyncWriteRecordingRedis(_WriteRecordingRedis):
     """Async Redis stand-in with the same recording behaviour.
     """
 
+    pipeline_class = _AsyncRecordingPipeline
+
     async def set(self, name, value, ex=None, **kwargs):
         return _WriteRecordingRedis.set(self, name, value, ex=ex, **kwargs)
 
@@ -129,6 +174,22 @@ class TestSyncWrite:
         assert client.set_calls == []
         assert 'k' not in client.store
 
+    def test_set_many_pipelines_set_with_expiry(self, sync_backend):
+        """A batch write is one pipeline of SET key value EX ttl per key.
+
+        Mutation: loop over `set`, paying one round trip per key, or batch
+        the keys with MSET, which cannot carry an expiry.
+        Oracle: one pipeline execute, and every key's recorded ex and
+        round-tripped value.
+        """
+        backend, client = sync_backend
+
+        backend.set_many({'a': 1, 'b': [2]}, 300)
+
+        assert client.executes == 1
+        assert [(name, ex) for name, _, ex in client.set_calls] == [('a', 300), ('b', 300)]
+        assert [backend.get('a'), backend.get('b')] == [1, [2]]
+
 
 class TestAsyncWrite:
     """The async write path uses SET with an expiry.
@@ -172,6 +233,19 @@ class TestAsyncWrite:
         assert client.set_calls == []
         assert 'k' not in client.store
 
+    async def test_aset_many_pipelines_set_with_expiry(self, async_backend):
+        """An async batch write is one pipeline of SET key value EX ttl.
+
+        Mutation: loop over `aset` on the async path only.
+        Oracle: one pipeline execute and every key's recorded ex.
+        """
+        backend, client = async_backend
+
+        await backend.aset_many({'a': 1, 'b': [2]}, 300)
+
+        assert client.executes == 1
+        assert [(name, ex) for name, _, ex in client.set_calls] == [('a', 300), ('b', 300)]
+
 
 @pytest.mark.redis
 class TestAgainstRealRedis:
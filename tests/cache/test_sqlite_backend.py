@@ -1,24 +1,35 @@
 """SQLite-specific backend tests not covered by generic suite.
 """
-import tempfile
+import pickle
+import sqlite3
 import time
+from types import SimpleNamespace
 
 import pytest
 from cachu.api import NO_VALUE
 from cachu.backends.sqlite import SqliteBackend
 
 
+@pytest.fixture(scope='module')
+def module_sqlite_backend(tmp_path_factory):
+    """One SQLite backend for the module, so the schema is created once.
+    """
+    backend = SqliteBackend(str(tmp_path_factory.mktemp('sqlite') / 'cache.db'))
+    yield backend
+    backend.close()
+
+
 class TestSqliteBackendSpecific:
     """SQLite-specific tests not covered by generic suite.
     """
 
     @pytest.fixture
-    def sqlite_backend(self):
-        """Provide a SQLite backend for testing.
+    def sqlite_backend(self, module_sqlite_backend):
+        """Provide the module's SQLite backend, emptied before each test.
         """
-        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
-            filepath = f.name
-        return SqliteBackend(filepath)
+        module_sqlite_backend.clear()
+        module_sqlite_backend.clear_stats()
+        return module_sqlite_backend
 
     def test_complex_values_roundtrip(self, sqlite_backend):
         """Verify SQLite backend can handle complex values (dicts, lists).
@@ -35,14 +46,57 @@ class TestSqliteBackendSpecific:
 
         assert result == data
 
-    @pytest.mark.slow
-    def test_cleanup_expired(self, sqlite_backend):
+    def test_values_stored_with_pickle_protocol_5(self, sqlite_backend):
+        """Verify rows are written with pickle protocol 5.
+
+        Mutation: fall back to pickle.dumps' default protocol (4 before
+        Python 3.14), which rebuilds a bytearray through __reduce__ on load.
+        Oracle: the PROTO opcode at the head of the raw row, read back over
+        an independent sqlite3 connection.
+        """
+        sqlite_backend.set('buffer', bytearray(16), 300)
+
+        conn = sqlite3.connect(sqlite_backend._filepath)
+        try:
+            (blob,) = conn.execute("SELECT value FROM cache WHERE key = 'buffer'").fetchone()
+        finally:
+            conn.close()
+
+        assert blob[:2] == pickle.PROTO + bytes([5])
+
+    def test_pattern_clear_uses_key_index_range(self, sqlite_backend):
+        """Verify a prefix pattern is served by a primary-key range scan.
+
+        Mutation: match with LIKE (case-insensitive, so the BINARY-collated
+        key index is skipped) or wrap the key in an expression.
+        Oracle: EXPLAIN QUERY PLAN over an independent sqlite3 connection.
+        """
+        sqlite_backend.set('user:1', 'a', 300)
+
+        conn = sqlite3.connect(sqlite_backend._filepath)
+        try:
+            plan = conn.execute(
+                'EXPLAIN QUERY PLAN DELETE FROM cache WHERE key GLOB ?',
+                (sqlite_backend._fnmatch_to_glob('user:*'),),
+            ).fetchall()
+        finally:
+            conn.close()
+
+        detail = ' '.join(row[-1] for row in plan)
+        assert 'USING' in detail and 'INDEX' in detail
+        assert 'key>? AND key<?' in detail
+
+    def test_cleanup_expired(self, sqlite_backend, monkeypatch):
         """Verify cleanup_expired removes expired entries.
         """
+        offset = 0.0
+        clock = SimpleNamespace(time=lambda: time.time() + offset)
+        monkeypatch.setattr('cachu.backends.sqlite.time', clock)
+
         sqlite_backend.set('short', 'value1', 1)
         sqlite_backend.set('long', 'value2', 300)
 
-        time.sleep(1.5)
+        offset = 1.5
 
         count = sqlite_backend.cleanup_expired()
         assert count == 1
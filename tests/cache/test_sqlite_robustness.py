@@ -8,17 +8,25 @@ import sqlite3
 from cachu.api import NO_VALUE
 from cachu.backends.sqlite import SqliteBackend
 
+# A blob that never unpickles; the tests only care that loading fails.
+CORRUPT_BLOB = b'\x00not-a-pickle'
+
+
+def _corrupt(backend, key):
+    """Overwrite the stored value for `key` with `CORRUPT_BLOB`.
+    """
+    conn = sqlite3.connect(backend._filepath)
+    conn.execute('UPDATE cache SET value = ? WHERE key = ?', (CORRUPT_BLOB, key))
+    conn.commit()
+    conn.close()
+
 
 def test_get_evicts_corrupt_row(tmp_path):
     """A corrupt blob is evicted on read so the next call recomputes.
     """
     backend = SqliteBackend(str(tmp_path / 'cache.db'))
     backend.set('k', 'v', 300)
-
-    conn = sqlite3.connect(backend._filepath)
-    conn.execute("UPDATE cache SET value = ? WHERE key = 'k'", (b'\x00not-a-pickle',))
-    conn.commit()
-    conn.close()
+    _corrupt(backend, 'k')
 
     assert backend.get('k') is NO_VALUE
 
@@ -61,16 +69,31 @@ def test_sync_path_is_wal_and_tolerates_concurrent_writers(tmp_path):
     assert backend.get('k7-19') == 19
 
 
+async def test_connections_relax_fsync_under_wal(tmp_path):
+    """Sync and async connections run synchronous=NORMAL with a busy_timeout,
+    so a stats increment or write does not fsync on every commit.
+    """
+    backend = SqliteBackend(str(tmp_path / 'cache.db'))
+
+    conn = backend._get_sync_connection()
+    try:
+        assert conn.execute('PRAGMA synchronous').fetchone()[0] == 1
+        assert conn.execute('PRAGMA busy_timeout').fetchone()[0] == 5000
+    finally:
+        conn.close()
+
+    aconn = await backend._ensure_async_initialized()
+    async with aconn.execute('PRAGMA synchronous') as cursor:
+        assert (await cursor.fetchone())[0] == 1
+    await backend.aclose()
+
+
 async def test_aget_evicts_corrupt_row(tmp_path):
     """Async read also evicts a corrupt row.
     """
     backend = SqliteBackend(str(tmp_path / 'cache.db'))
     await backend.aset('k', 'v', 300)
-
-    conn = sqlite3.connect(backend._filepath)
-    conn.execute("UPDATE cache SET value = ? WHERE key = 'k'", (b'\x00bad',))
-    conn.commit()
-    conn.close()
+    _corrupt(backend, 'k')
 
     assert await backend.aget('k') is NO_VALUE
 
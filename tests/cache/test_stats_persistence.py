@@ -3,7 +3,7 @@
 These tests verify that stats are stored in the backend (not in-memory)
 and can be shared across processes/instances.
 """
-import tempfile
+import asyncio
 
 import pytest
 from cachu.backends.sqlite import SqliteBackend
@@ -13,11 +13,10 @@ class TestSqliteStatsPersistence:
     """Tests for SQLite stats persistence.
     """
 
-    def test_stats_persist_across_backend_recreation(self):
+    def test_stats_persist_across_backend_recreation(self, tmp_path):
         """Verify stats survive backend close/reopen.
         """
-        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
-            filepath = f.name
+        filepath = str(tmp_path / 'stats.db')
 
         backend1 = SqliteBackend(filepath)
         backend1.incr_stat('my_func', 'hits')
@@ -32,11 +31,10 @@ class TestSqliteStatsPersistence:
         assert hits == 2
         assert misses == 1
 
-    def test_stats_shared_across_instances(self):
+    def test_stats_shared_across_instances(self, tmp_path):
         """Verify two backend instances see same stats (simulates multi-process).
         """
-        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
-            filepath = f.name
+        filepath = str(tmp_path / 'stats.db')
 
         backend1 = SqliteBackend(filepath)
         backend2 = SqliteBackend(filepath)
@@ -56,12 +54,10 @@ class TestSqliteStatsPersistence:
         backend1.close()
         backend2.close()
 
-    @pytest.mark.asyncio
-    async def test_async_stats_persist_across_backend_recreation(self):
+    async def test_async_stats_persist_across_backend_recreation(self, tmp_path):
         """Verify async stats survive backend close/reopen.
         """
-        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
-            filepath = f.name
+        filepath = str(tmp_path / 'stats.db')
 
         backend1 = SqliteBackend(filepath)
         await backend1.aincr_stat('async_func', 'hits')
@@ -81,16 +77,13 @@ class TestRedisStatsPersistence:
     """Tests for Redis stats shared across instances.
     """
 
-    def test_stats_shared_across_instances(self, redis_docker):
+    def test_stats_shared_across_instances(self, redis_url):
         """Verify two backend instances see same stats.
         """
         from cachu.backends.redis import RedisBackend
-        from _fixtures.redis import redis_test_config
 
-        url = f'redis://{redis_test_config.host}:{redis_test_config.port}/0'
-
-        backend1 = RedisBackend(url)
-        backend2 = RedisBackend(url)
+        backend1 = RedisBackend(redis_url)
+        backend2 = RedisBackend(redis_url)
 
         backend1.incr_stat('redis_shared_func', 'hits')
         backend2.incr_stat('redis_shared_func', 'hits')
@@ -107,24 +100,44 @@ class TestRedisStatsPersistence:
         backend1.close()
         backend2.close()
 
-    @pytest.mark.asyncio
-    async def test_async_stats_shared_across_instances(self, redis_docker):
-        """Verify two async backend instances see same stats.
+    def test_batched_stats_shared_across_instances(self, redis_url):
+        """Verify a pipelined incr_stats batch is visible to another instance.
         """
         from cachu.backends.redis import RedisBackend
-        from _fixtures.redis import redis_test_config
 
-        url = f'redis://{redis_test_config.host}:{redis_test_config.port}/0'
+        backend1 = RedisBackend(redis_url)
+        backend2 = RedisBackend(redis_url)
+
+        backend1.incr_stats([
+            ('redis_batch_func', 'hits', 3),
+            ('redis_batch_func', 'misses', 1),
+        ])
+        backend2.incr_stat('redis_batch_func', 'hits')
+
+        assert backend2.get_stats('redis_batch_func') == (4, 1)
+
+        backend1.close()
+        backend2.close()
+
+    async def test_async_stats_shared_across_instances(self, redis_url):
+        """Verify two async backend instances see same stats.
+        """
+        from cachu.backends.redis import RedisBackend
 
-        backend1 = RedisBackend(url)
-        backend2 = RedisBackend(url)
+        backend1 = RedisBackend(redis_url)
+        backend2 = RedisBackend(redis_url)
 
-        await backend1.aincr_stat('async_redis_func', 'hits')
-        await backend2.aincr_stat('async_redis_func', 'misses')
-        await backend1.aincr_stat('async_redis_func', 'misses')
+        # HINCRBY is atomic server-side, so the increments need no ordering.
+        await asyncio.gather(
+            backend1.aincr_stat('async_redis_func', 'hits'),
+            backend2.aincr_stat('async_redis_func', 'misses'),
+            backend1.aincr_stat('async_redis_func', 'misses'),
+        )
 
-        hits1, misses1 = await backend1.aget_stats('async_redis_func')
-        hits2, misses2 = await backend2.aget_stats('async_redis_func')
+        (hits1, misses1), (hits2, misses2) = await asyncio.gather(
+            backend1.aget_stats('async_redis_func'),
+            backend2.aget_stats('async_redis_func'),
+        )
 
         assert hits1 == 1
         assert misses1 == 2
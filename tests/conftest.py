@@ -1,18 +1,21 @@
 """Shared fixtures for cache tests.
+
+The suite is safe under pytest-xdist (`pytest -n auto`): each worker is its
+own process with its own `cachu.manager` and config registry, the autouse
+`reset_cache_config` detaches every backend between tests, and
+`redis_docker` starts one container per worker session. The one resource
+workers would otherwise share is the default file backend directory, so
+it comes from `tmp_path_factory`, which is already per worker; SQLite
+tests take their database paths from `tmp_path` for the same reason.
 """
 import logging
+import os
 import pathlib
-import shutil
 import site
-import tempfile
+import sys
 
 import pytest
 
-try:
-    import redis
-except ImportError:
-    raise Exception('redis package not installed, cannot test Redis functionality')
-
 
 logger = logging.getLogger(__name__)
 
@@ -43,8 +46,74 @@ def _clear_all_backends() -> None:
     AsyncioMutex.clear_locks()
 
 
+_IS_REDIS_TEST = pytest.StashKey[bool]()
+
+
+def _needs_redis(item: pytest.Item) -> bool:
+    """Whether a collected test talks to the session's Redis container.
+    """
+    if item.get_closest_marker('redis') is not None:
+        return True
+    if 'redis_docker' in getattr(item, 'fixturenames', ()):
+        return True
+    callspec = getattr(item, 'callspec', None)
+    if callspec is None:
+        return False
+    params = callspec.params
+    return (
+        params.get('cache_type') == 'redis' or
+        params.get('fixture') == 'redis_docker' or
+        params.get('fixture_needed') == 'redis_docker' or
+        params.get('backend_type') == 'redis'
+    )
+
+
+def _sleeps_for_ttl(item: pytest.Item) -> bool:
+    """Whether a TTL suite test advances its clock with real sleeps.
+
+    `_GenericBackendTestSuiteWithTTL.advance` falls back to `time.sleep` for
+    backends without a `clock_module` (server-side TTLs such as Redis).
+    """
+    if 'advance' not in getattr(item, 'fixturenames', ()):
+        return False
+    cls = getattr(item, 'cls', None)
+    return cls is not None and getattr(cls, 'clock_module', None) is None
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(items):
+    """Decide once per test, at collection, whether it needs Redis.
+
+    Also marks the real-sleep TTL tests slow. This runs before `-m`
+    selection so `-m "not slow"` deselects them.
+    """
+    for item in items:
+        item.stash[_IS_REDIS_TEST] = _needs_redis(item)
+        if _sleeps_for_ttl(item):
+            item.add_marker(pytest.mark.slow)
+
+
+if os.environ.get('CACHU_TEST_UVLOOP') and sys.platform != 'win32':
+    def pytest_asyncio_loop_factories(config, item):
+        """Run the async tests on uvloop, the loop many deployments use.
+
+        Opt-in through `CACHU_TEST_UVLOOP=1` so a plain run exercises the
+        stdlib loop most users run; asking for uvloop without it installed
+        fails rather than silently testing the stdlib loop.
+        """
+        import uvloop
+        return {'uvloop': uvloop.new_event_loop}
+
+
+@pytest.fixture(scope='session')
+def session_file_dir(tmp_path_factory):
+    """Default file backend directory, private to this session (or worker).
+    """
+    return str(tmp_path_factory.mktemp('cachu-files'))
+
+
 @pytest.fixture(autouse=True)
-def reset_cache_config(request):
+def reset_cache_config(request, session_file_dir):
     """Reset cache configuration and clear backends before each test.
     """
     from cachu.config import CacheConfig, _registry, enable
@@ -53,19 +122,7 @@ def reset_cache_config(request):
     _clear_all_backends()
     _registry._configs.clear()
 
-    is_redis_test = 'redis' in [marker.name for marker in request.node.iter_markers()]
-
-    if not is_redis_test:
-        is_redis_test = 'redis_docker' in request.fixturenames
-
-    if not is_redis_test and hasattr(request.node, 'callspec'):
-        params = request.node.callspec.params
-        is_redis_test = (
-            params.get('cache_type') == 'redis' or
-            params.get('fixture') == 'redis_docker' or
-            params.get('fixture_needed') == 'redis_docker' or
-            params.get('backend_type') == 'redis'
-        )
+    is_redis_test = request.node.stash.get(_IS_REDIS_TEST, False)
 
     redis_host = 'localhost'
     redis_port = 6379
@@ -78,17 +135,12 @@ def reset_cache_config(request):
     _registry._default = CacheConfig(
         backend_default='memory',
         key_prefix='test:',
-        file_dir=tempfile.gettempdir(),
+        file_dir=session_file_dir,
         redis_url=f'redis://{redis_host}:{redis_port}/0',
     )
 
     if is_redis_test:
-        try:
-            r = redis.Redis(host=redis_host, port=redis_port, db=0)
-            r.flushdb()
-            r.close()
-        except Exception:
-            pass
+        request.getfixturevalue('redis_clean')
 
     yield
 
@@ -98,14 +150,13 @@ def reset_cache_config(request):
 
 
 @pytest.fixture
-def temp_cache_dir():
+def temp_cache_dir(tmp_path):
     """Provide a temporary directory for file cache tests.
     """
     from cachu.config import _registry
-    temp_dir = tempfile.mkdtemp(prefix='cache_test_')
+    temp_dir = str(tmp_path)
     _registry._default.file_dir = temp_dir
-    yield temp_dir
-    shutil.rmtree(temp_dir, ignore_errors=True)
+    return temp_dir
 
 
 @pytest.fixture
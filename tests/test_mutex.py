@@ -1,14 +1,21 @@
 """Tests for mutex implementations used in dogpile prevention.
 """
 import asyncio
+import threading
 import time
 
+import cachu
 import pytest
 import redis
 import redis.asyncio as aioredis
 from _fixtures.redis import redis_test_config
-from cachu.mutex import AsyncioMutex, AsyncRedisMutex, RedisMutex
-from cachu.mutex import ThreadingMutex
+from cachu.mutex import AsyncioMutex, AsyncRedisMutex, NullAsyncMutex
+from cachu.mutex import NullMutex, RedisMutex, ThreadingMutex
+
+# libuv-based loops (uvloop, see CACHU_TEST_UVLOOP) fire timers off a
+# millisecond clock cached per loop iteration, so a timed-out wait can
+# measure up to a tick short of the requested timeout.
+_TIMER_SLACK = 0.002
 
 
 @pytest.fixture
@@ -49,18 +56,29 @@ class TestThreadingMutex:
         mutex.release()
 
     def test_same_key_uses_same_lock(self):
-        """Verify same key returns mutex with same underlying lock.
+        """Verify same key resolves to the same underlying lock while in use.
         """
         mutex1 = ThreadingMutex('shared_key')
         mutex2 = ThreadingMutex('shared_key')
-        assert mutex1._lock is mutex2._lock
+        assert mutex1.acquire() is True
+        try:
+            assert mutex2.acquire(timeout=0) is False
+            assert mutex1._lock is mutex2._lock
+        finally:
+            mutex1.release()
 
     def test_different_keys_use_different_locks(self):
-        """Verify different keys return mutexes with different locks.
+        """Verify different keys resolve to different underlying locks.
         """
         mutex1 = ThreadingMutex('key1')
         mutex2 = ThreadingMutex('key2')
-        assert mutex1._lock is not mutex2._lock
+        mutex1.acquire()
+        mutex2.acquire()
+        try:
+            assert mutex1._lock is not mutex2._lock
+        finally:
+            mutex1.release()
+            mutex2.release()
 
     def test_context_manager(self):
         """Verify ThreadingMutex works as a context manager.
@@ -142,7 +160,7 @@ class TestAsyncioMutex:
             result = await mutex2.acquire(timeout=0.1)
             elapsed = time.time() - start
             assert result is False
-            assert elapsed >= 0.1
+            assert elapsed >= 0.1 - _TIMER_SLACK
         finally:
             await mutex1.release()
 
@@ -166,6 +184,42 @@ class TestMutexSafety:
         mutex.release()
 
 
+class TestMutexFootprint:
+    """Tests for the no-op marker and slotted mutex instances.
+    """
+
+    @pytest.mark.parametrize('mutex', [
+        ThreadingMutex('slots'), AsyncioMutex('slots'), NullMutex(),
+        NullAsyncMutex(), RedisMutex(None, 'slots'), AsyncRedisMutex(None, 'slots'),
+    ], ids=lambda m: type(m).__name__)
+    def test_instances_carry_no_dict(self, mutex):
+        """Every mutex is slotted, so none allocates a per-instance __dict__.
+        """
+        assert not hasattr(mutex, '__dict__')
+
+    def test_only_null_mutexes_are_noop(self):
+        """The decorator skips acquire/release only for the Null mutexes.
+        """
+        assert NullMutex._is_noop and NullAsyncMutex._is_noop
+        assert not any(cls._is_noop for cls in (
+            ThreadingMutex, AsyncioMutex, RedisMutex, AsyncRedisMutex))
+
+    def test_null_backend_calls_skip_the_mutex(self, monkeypatch):
+        """A null-backend call never enters acquire or release.
+
+        Mutation: drop the `_is_noop` check in the decorator.
+        Oracle: acquire/release patched to fail the test.
+        """
+        monkeypatch.setattr(NullMutex, 'acquire', lambda *a, **k: pytest.fail('acquire'))
+        monkeypatch.setattr(NullMutex, 'release', lambda *a: pytest.fail('release'))
+
+        @cachu.cache(ttl=60, backend='null')
+        def compute(x: int) -> int:
+            return x * 2
+
+        assert compute(3) == 6
+
+
 class TestAsyncMutexSafety:
     """Tests for async mutex _acquired flag safety checks.
     """
@@ -209,6 +263,132 @@ class TestAsyncioMutexThreadSafety:
         )
 
 
+class TestThreadingMutexRefcount:
+    """Tests for the reference-counted ThreadingMutex registry.
+    """
+
+    def test_key_is_dropped_after_release(self):
+        """Verify a released key leaves nothing behind in the registry.
+        """
+        ThreadingMutex.clear_locks()
+        mutex = ThreadingMutex('counted_drop')
+        mutex.acquire()
+        assert ThreadingMutex._locks['counted_drop'].pending == 1
+        mutex.release()
+        assert 'counted_drop' not in ThreadingMutex._locks
+
+    def test_timed_out_waiter_gives_its_registration_back(self):
+        """Verify a waiter that times out does not keep the key registered.
+        """
+        ThreadingMutex.clear_locks()
+        holder = ThreadingMutex('counted_wait')
+        waiter = ThreadingMutex('counted_wait')
+        holder.acquire()
+        assert waiter.acquire(timeout=0) is False
+        assert ThreadingMutex._locks['counted_wait'].pending == 1
+        holder.release()
+        assert 'counted_wait' not in ThreadingMutex._locks
+
+    def test_waiter_keeps_the_entry_alive_across_holder_release(self):
+        """Verify a waiter is handed the lock the holder released, not a new one.
+        """
+        ThreadingMutex.clear_locks()
+        holder = ThreadingMutex('counted_handoff')
+        waiter = ThreadingMutex('counted_handoff')
+        holder.acquire()
+        acquired = []
+
+        thread = threading.Thread(target=lambda: acquired.append(waiter.acquire(timeout=5)))
+        thread.start()
+        while ThreadingMutex._locks['counted_handoff'].pending < 2:
+            time.sleep(0.001)
+        holder.release()
+        thread.join()
+
+        try:
+            assert acquired == [True]
+            assert waiter._lock is holder._lock
+            assert ThreadingMutex._locks['counted_handoff'].pending == 1
+        finally:
+            waiter.release()
+        assert 'counted_handoff' not in ThreadingMutex._locks
+
+    def test_released_lock_is_reused_for_a_new_key(self):
+        """Verify a dropped key's lock is recycled instead of allocating anew.
+        """
+        ThreadingMutex.clear_locks()
+        first = ThreadingMutex('counted_a')
+        first.acquire()
+        recycled = first._lock
+        first.release()
+
+        second = ThreadingMutex('counted_b')
+        second.acquire()
+        try:
+            assert second._lock is recycled
+        finally:
+            second.release()
+
+
+class TestAsyncioMutexPooling:
+    """Tests for the reference-counted, pooled AsyncioMutex registry.
+    """
+
+    async def test_key_is_dropped_after_release(self):
+        """Verify a released key leaves nothing behind in the registry.
+        """
+        AsyncioMutex.clear_locks()
+        mutex = AsyncioMutex('pooled_drop')
+        await mutex.acquire()
+        per_loop = AsyncioMutex._loop_locks[asyncio.get_running_loop()]
+        assert per_loop['pooled_drop'].pending == 1
+        await mutex.release()
+        assert 'pooled_drop' not in per_loop
+
+    async def test_timed_out_waiter_gives_its_registration_back(self):
+        """Verify a waiter that times out does not keep the key registered.
+        """
+        AsyncioMutex.clear_locks()
+        holder = AsyncioMutex('pooled_wait')
+        waiter = AsyncioMutex('pooled_wait')
+        await holder.acquire()
+        assert await waiter.acquire(timeout=0.01) is False
+        per_loop = AsyncioMutex._loop_locks[asyncio.get_running_loop()]
+        assert per_loop['pooled_wait'].pending == 1
+        await holder.release()
+        assert 'pooled_wait' not in per_loop
+
+    async def test_released_lock_is_reused_for_a_new_key(self):
+        """Verify a dropped key's lock is recycled instead of allocating anew.
+        """
+        AsyncioMutex.clear_locks()
+        first = AsyncioMutex('pooled_a')
+        await first.acquire()
+        recycled = first._lock
+        await first.release()
+
+        second = AsyncioMutex('pooled_b')
+        await second.acquire()
+        try:
+            assert second._lock is recycled
+        finally:
+            await second.release()
+
+    async def test_held_lock_is_not_shared_with_another_key(self):
+        """Verify pooling never hands a lock in use to a different key.
+        """
+        AsyncioMutex.clear_locks()
+        first = AsyncioMutex('pooled_x')
+        second = AsyncioMutex('pooled_y')
+        await first.acquire()
+        try:
+            assert await second.acquire(timeout=0) is True
+            assert second._lock is not first._lock
+            await second.release()
+        finally:
+            await first.release()
+
+
 @pytest.mark.redis
 class TestRedisMutex:
     """Tests for RedisMutex (distributed lock via Redis).
@@ -272,6 +452,32 @@ class TestRedisMutex:
         finally:
             mutex1.release()
 
+    def test_waiter_wakes_on_release(self, redis_client):
+        """Verify a waiter acquires as soon as the holder releases.
+
+        Mutation: drop the PUBLISH from the release script, leaving the
+        waiter to notice only on its 0.5 s fallback retry.
+        Oracle: the wall time from release to the waiter's acquire.
+        """
+        holder = RedisMutex(redis_client, 'lock:wake', lock_timeout=10.0)
+        waiter = RedisMutex(redis_client, 'lock:wake', lock_timeout=10.0)
+        assert holder.acquire() is True
+
+        acquired_at = []
+        thread = threading.Thread(
+            target=lambda: waiter.acquire(timeout=5) and acquired_at.append(time.monotonic()))
+        thread.start()
+        time.sleep(0.1)
+        released_at = time.monotonic()
+        holder.release()
+        thread.join()
+
+        try:
+            assert acquired_at
+            assert acquired_at[0] - released_at < 0.25
+        finally:
+            waiter.release()
+
 
 @pytest.mark.redis
 class TestAsyncRedisMutex:
@@ -501,6 +707,6 @@ class TestLocalMutexZeroTimeout:
         try:
             start = time.monotonic()
             assert await waiter.acquire(timeout=0.15) is False
-            assert time.monotonic() - start >= 0.15
+            assert time.monotonic() - start >= 0.15 - _TIMER_SLACK
         finally:
             await holder.release()